@@ -1,109 +1,661 @@
+import asyncio
 import io
-import math
+import os
+import tempfile
+from contextlib import asynccontextmanager
 from decimal import Decimal, getcontext
-from typing import List, Optional, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 import matplotlib
-import requests
-from fastapi import Body, FastAPI, HTTPException
-from fastapi.responses import FileResponse, StreamingResponse
-
-from src.math_algos.binary_relations import (
-    BinaryRelationGraph,
-    BinaryRelationProperties,
+from fastapi import Body, FastAPI, HTTPException, Query, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import FileResponse, Response, StreamingResponse
+
+from src.math_algos.binary_relations import RelationSession
+from src.math_algos.bit_io import ENCODED_FORMATS, pack_frame
+from src.math_algos.boolean_algebra import (
+    IMAGE_ROW_LIMIT,
+    STREAM_CHUNK_ROWS,
+    TRUTH_TABLE_FORMATS,
+    TruthTableWriter,
 )
-from src.math_algos.boolean_algebra import LogicSimplifier, TruthTableGenerator
-from src.math_algos.encoding_decoding_algos import (
-    ArithmeticCoder,
-    FixedLengthCoding,
-    HuffmanCoding,
-    ProbabilityCalculating,
-    ShennonFanoCoding,
+from src.math_algos.context_coding import DEFAULT_ORDER, MAX_ORDER
+from src.math_algos.encoding_decoding_algos import ProbabilityCalculating
+from src.math_algos.expression_parser import parse_set, variables_in_order
+from src.math_algos.prefix_coding import CODEBOOK_FORMATS, MAX_CODE_LENGTH
+from src.math_algos.range_coding import ARITHMETIC_ENGINES
+from src.math_algos.relation_ingestion import RELATION_FORMATS
+from src.math_algos.set_theory import (
+    DiagramCache,
+    UpstreamError,
+    VennDiagramBuilder,
+)
+from src.math_algos.venn_diagram import MAX_SETS, VENN_FORMATS
+
+from . import jobs
+from .models import (
+    BinaryRelationModel,
+    EquivalenceClassesModel,
+    GetRelationPropertiesModel,
+    HasseDiagramModel,
+    RelationClosuresModel,
+    RelationCompositionModel,
+    RelationCompositionResultModel,
+    RelationEditModel,
+    RelationSessionModel,
+)
+from .sessions import SessionNotFoundError, SessionStore
+from .uploads import FIELD_LIMIT, MultipartUpload
+from .workers import (
+    JobTimeoutError,
+    PoolOverloadedError,
+    WorkerCrashedError,
+    WorkerPool,
 )
-from src.math_algos.set_theory import SetSimplifier, VennDiagramBuilder
-
-from .models import BinaryRelationModel, GetRelationPropertiesModel
 
 matplotlib.use("Agg")
 getcontext().prec = 100
 MEDIA_TYPE_PNG = "image/png"
+MEDIA_TYPE_SVG = "image/svg+xml"
+
+DEFAULT_TIMEOUT = float(os.environ.get("DS_TIMEOUT", 10))
+ENDPOINT_TIMEOUTS = {
+    "relation-properties": 10,
+    "relation-properties-upload": 120,
+    "relation-closures": 30,
+    "equivalence-classes": 10,
+    "hasse-diagram": 30,
+    "relation-compose": 30,
+    "generate-relation-graph": 30,
+    "simplify-set": 10,
+    "simplify-boolean-expression": 10,
+    "generate-truth-table": 30,
+    "boolean-equivalence": 10,
+    "count-models": 10,
+    "zhegalkin": 30,
+    "post-classes": 30,
+    "evaluate-set": 30,
+    "fixed-length-encode": 30,
+    "fixed-length-decode": 30,
+    "shennon-fano-encode": 30,
+    "shennon-fano-decode": 30,
+    "huffman-encode": 30,
+    "huffman-decode": 30,
+    "calculate-entropy": 10,
+    "arithmetic-encode": 30,
+    "arithmetic-encode-interval-table": 30,
+    "arithmetic-decode": 30,
+    "adaptive-arithmetic-encode": 60,
+    "adaptive-arithmetic-decode": 60,
+    "batch": 60,
+}
+BATCH_LIMIT = int(os.environ.get("DS_BATCH_LIMIT", 1000))
+MEMBERS_PAGE_LIMIT = 100000
+TRUTH_TABLE_VARIABLE_LIMIT = int(os.environ.get("DS_TRUTH_TABLE_VARIABLES", 24))
+DECODE_LENGTH_LIMIT = int(os.environ.get("DS_DECODE_LENGTH", 10_000_000))
+SESSION_PAIR_LIMIT = int(os.environ.get("DS_SESSION_PAIRS", 100000))
+RELATION_UPLOAD_LIMIT = int(
+    os.environ.get("DS_RELATION_UPLOAD_BYTES", 256 * 1024 * 1024)
+)
+MULTIPART_OVERHEAD = 2 * FIELD_LIMIT
+
+pool = WorkerPool()
+sessions = SessionStore()
+remote_venn = VennDiagramBuilder(
+    os.environ.get("DS_WOLFRAM_APP_ID", "QA7A2U-Y5YWWV97T5"),
+    cache=DiagramCache(
+        os.environ.get(
+            "DS_VENN_CACHE_DIR",
+            os.path.join(tempfile.gettempdir(), "discrete-solver-venn"),
+        ),
+        ttl=float(os.environ.get("DS_VENN_CACHE_TTL", 7 * 24 * 3600)),
+        max_bytes=int(os.environ.get("DS_VENN_CACHE_BYTES", 256 * 1024 * 1024)),
+    ),
+    simplify=lambda expression: run_job(
+        "simplify-set", jobs.venn_diagram_key, expression
+    ),
+)
+
+
+def endpoint_timeout(name):
+    variable = "DS_TIMEOUT_" + name.upper().replace("-", "_")
+    return float(os.environ.get(variable, ENDPOINT_TIMEOUTS.get(name, DEFAULT_TIMEOUT)))
+
+
+async def run_job(name, func, *args):
+    try:
+        return await pool.run(func, *args, timeout=endpoint_timeout(name))
+    except PoolOverloadedError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except JobTimeoutError as e:
+        raise HTTPException(status_code=504, detail=str(e))
+    except WorkerCrashedError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+async def run_batch(name, func, items, *args):
+    if len(items) > BATCH_LIMIT:
+        raise HTTPException(
+            status_code=413, detail=f"Batch is limited to {BATCH_LIMIT} items"
+        )
+    try:
+        outcomes = await pool.map(func, items, *args, timeout=endpoint_timeout(name))
+    except PoolOverloadedError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    return [
+        {"result": value} if status == "ok" else {"error": value}
+        for status, value in outcomes
+    ]
+
+
+async def spool_upload(chunks):
+    size = 0
+    with tempfile.NamedTemporaryFile(prefix="relation-", delete=False) as spool:
+        try:
+            async for chunk in chunks:
+                size += len(chunk)
+                if size > RELATION_UPLOAD_LIMIT:
+                    raise HTTPException(
+                        status_code=413,
+                        detail=f"Relation uploads are limited to "
+                        f"{RELATION_UPLOAD_LIMIT} bytes",
+                    )
+                spool.write(chunk)
+        except BaseException:
+            spool.close()
+            os.remove(spool.name)
+            raise
+    return spool.name
+
+
+def check_upload_length(request, overhead=0):
+    length = request.headers.get("content-length")
+    if length is not None and int(length) > RELATION_UPLOAD_LIMIT + overhead:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Relation uploads are limited to {RELATION_UPLOAD_LIMIT} bytes",
+        )
+
+
+def check_relation_format(input_format):
+    if input_format not in RELATION_FORMATS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown format '{input_format}', expected one of: "
+            f"{', '.join(RELATION_FORMATS)}",
+        )
+
+
+async def spooled_relation_properties(path, input_format, set_of_elements, header):
+    try:
+        properties = await run_job(
+            "relation-properties-upload",
+            jobs.relation_properties_file,
+            path,
+            input_format,
+            set(set_of_elements.split(",")) if set_of_elements else None,
+            header,
+        )
+    finally:
+        os.remove(path)
+    return {"properties": properties}
+
+
+@asynccontextmanager
+async def lifespan(app):
+    await pool.start()
+    yield
+    await remote_venn.close()
+    await pool.stop()
 
-app = FastAPI(title="DiscreteSolver API")
+
+app = FastAPI(title="DiscreteSolver API", lifespan=lifespan)
 
 
 @app.post("/relation-properties/", response_model=GetRelationPropertiesModel)
 async def get_relation_properties(model: BinaryRelationModel) -> dict:
-    relation = BinaryRelationProperties(
-        model.get_set_of_elements(), model.get_binary_relation()
+    properties = await run_job(
+        "relation-properties",
+        jobs.relation_properties,
+        model.get_set_of_elements(),
+        model.get_binary_relation(),
+    )
+    return {"properties": properties}
+
+
+@app.post(
+    "/relation-properties/upload/",
+    response_model=GetRelationPropertiesModel,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "multipart/form-data": {
+                    "schema": {
+                        "type": "object",
+                        "required": ["file"],
+                        "properties": {
+                            "file": {"type": "string", "format": "binary"},
+                            "set_of_elements": {"type": "string"},
+                        },
+                    }
+                }
+            },
+        }
+    },
+)
+async def get_uploaded_relation_properties(
+    request: Request,
+    input_format: str = Query("csv", alias="format"),
+    header: bool = Query(False),
+) -> dict:
+    check_relation_format(input_format)
+    check_upload_length(request, overhead=MULTIPART_OVERHEAD)
+    try:
+        upload = MultipartUpload(request.headers.get("content-type", ""))
+        path = await spool_upload(upload.file_chunks(request.stream()))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return await spooled_relation_properties(
+        path, input_format, upload.fields.get("set_of_elements"), header
     )
-    return {"properties": relation.get_properties_as_list()}
 
 
-@app.post("/generate-relation-graph/")
-async def generate_relation_graph(model: BinaryRelationModel) -> StreamingResponse:
+@app.post("/relation-properties/stream/", response_model=GetRelationPropertiesModel)
+async def get_streamed_relation_properties(
+    request: Request,
+    set_of_elements: Optional[str] = Query(None),
+    input_format: str = Query("json", alias="format"),
+    header: bool = Query(False),
+) -> dict:
+    check_relation_format(input_format)
+    check_upload_length(request)
+    path = await spool_upload(request.stream())
+    return await spooled_relation_properties(
+        path, input_format, set_of_elements, header
+    )
+
+
+def relation_session(session_id):
+    try:
+        return sessions.get(session_id)
+    except SessionNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+def session_state(session_id, session):
+    return {
+        "session_id": session_id,
+        "properties": session.get_properties_as_list(),
+        "counters": session.counters(),
+    }
+
+
+@app.post("/relation-sessions/", response_model=RelationSessionModel)
+async def create_relation_session(model: BinaryRelationModel) -> dict:
+    binary_relation = model.get_binary_relation()
+    if len(binary_relation) > SESSION_PAIR_LIMIT:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Sessions are limited to {SESSION_PAIR_LIMIT} pairs",
+        )
+    loop = asyncio.get_running_loop()
     try:
-        graph = BinaryRelationGraph(
-            model.get_set_of_elements(), model.get_binary_relation()
+        session = await loop.run_in_executor(
+            None, RelationSession, model.get_set_of_elements(), binary_relation
         )
-        return StreamingResponse(graph.get_image(), media_type=MEDIA_TYPE_PNG)
     except ValueError as e:
-        raise HTTPException(status_code=400, detail=f"Invalid input: {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
+    return session_state(sessions.add(session), session)
 
 
-@app.post("/simplify-set/")
-def simplify_set(expression: str = Body(...)):
+@app.get("/relation-sessions/{session_id}/", response_model=RelationSessionModel)
+async def get_relation_session(session_id: str) -> dict:
+    return session_state(session_id, relation_session(session_id))
+
+
+@app.post("/relation-sessions/{session_id}/edits/", response_model=RelationSessionModel)
+async def edit_relation_session(session_id: str, model: RelationEditModel) -> dict:
+    session = relation_session(session_id)
+    insertions = model.get_insertions()
+    if len(session.binary_relation) + len(insertions) > SESSION_PAIR_LIMIT:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Sessions are limited to {SESSION_PAIR_LIMIT} pairs",
+        )
     try:
-        simplifier = SetSimplifier()
-        simplified_expr = simplifier.simplify_expression(expression)
-        result = simplifier.reverse_transform(simplified_expr)
-        return {"simplified_expression": result}
-    except Exception as e:
+        session.apply(insertions, model.get_deletions())
+    except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    return session_state(session_id, session)
+
+
+@app.delete("/relation-sessions/{session_id}/", status_code=204)
+async def delete_relation_session(session_id: str) -> Response:
+    try:
+        sessions.remove(session_id)
+    except SessionNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    return Response(status_code=204)
+
+
+@app.post("/relation-closures/", response_model=RelationClosuresModel)
+async def get_relation_closures(model: BinaryRelationModel) -> dict:
+    return await run_job(
+        "relation-closures",
+        jobs.relation_closures,
+        model.get_set_of_elements(),
+        model.get_binary_relation(),
+    )
+
+
+@app.post("/equivalence-classes/", response_model=EquivalenceClassesModel)
+async def get_equivalence_classes(model: BinaryRelationModel) -> dict:
+    return await run_job(
+        "equivalence-classes",
+        jobs.equivalence_classes,
+        model.get_set_of_elements(),
+        model.get_binary_relation(),
+    )
+
+
+@app.post("/hasse-diagram/", response_model=HasseDiagramModel)
+async def get_hasse_diagram(model: BinaryRelationModel) -> dict:
+    return await run_job(
+        "hasse-diagram",
+        jobs.hasse_diagram,
+        model.get_set_of_elements(),
+        model.get_binary_relation(),
+    )
+
+
+@app.post("/relation-compose/", response_model=RelationCompositionResultModel)
+async def compose_relations(model: RelationCompositionModel) -> dict:
+    composition = await run_job(
+        "relation-compose",
+        jobs.relation_composition,
+        model.get_set_of_elements(),
+        model.get_first_relation(),
+        model.get_second_relation(),
+    )
+    return {"composition": composition}
+
+
+@app.post("/generate-relation-graph/")
+async def generate_relation_graph(
+    model: BinaryRelationModel,
+    output_format: str = Query("png", alias="format"),
+    layout: str = Query("auto"),
+    node_color: str = Query("skyblue"),
+    font_size: int = Query(20, ge=1, le=72),
+) -> Response:
+    image = await run_job(
+        "generate-relation-graph",
+        jobs.relation_graph_image,
+        model.get_set_of_elements(),
+        model.get_binary_relation(),
+        output_format,
+        layout,
+        node_color,
+        font_size,
+    )
+    if output_format == "svg":
+        return Response(image, media_type=MEDIA_TYPE_SVG)
+    return StreamingResponse(io.BytesIO(image), media_type=MEDIA_TYPE_PNG)
+
+
+@app.post("/simplify-set/")
+async def simplify_set(expression: str = Body(...)):
+    result = await run_job("simplify-set", jobs.simplify_set, expression)
+    return {"simplified_expression": result}
+
+
+@app.post("/simplify-set/batch/")
+async def simplify_set_batch(expressions: List[str] = Body(..., embed=True)):
+    results = await run_batch("batch", jobs.simplify_set, expressions)
+    return {"results": results}
+
+
+@app.post("/set-equivalence/")
+async def check_set_equivalence(
+    first_expression: str = Body(...), second_expression: str = Body(...)
+) -> dict:
+    return await run_job(
+        "set-equivalence", jobs.set_equivalence, first_expression, second_expression
+    )
+
+
+@app.post("/set-inclusion/")
+async def check_set_inclusion(
+    first_expression: str = Body(...), second_expression: str = Body(...)
+) -> dict:
+    return await run_job(
+        "set-inclusion", jobs.set_inclusion, first_expression, second_expression
+    )
+
+
+@app.post("/evaluate-set/")
+async def evaluate_set(
+    expression: str = Body(...),
+    sets: Dict[str, list] = Body(...),
+    universe: Optional[list] = Body(None),
+    members: bool = Body(False),
+    start: int = Body(0, ge=0),
+    limit: int = Body(1000, gt=0, le=MEMBERS_PAGE_LIMIT),
+) -> dict:
+    return await run_job(
+        "evaluate-set",
+        jobs.evaluate_set,
+        expression,
+        sets,
+        universe,
+        members,
+        start,
+        limit,
+    )
 
 
 @app.post("/venn-diagram/")
-async def create_venn_diagram(expression: str = Body(...)) -> StreamingResponse:
+async def create_venn_diagram(
+    expression: str = Body(...), output_format: str = Query("png", alias="format")
+) -> StreamingResponse:
+    if output_format not in VENN_FORMATS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown format '{output_format}', expected one of: "
+            f"{', '.join(VENN_FORMATS)}",
+        )
+
     try:
-        diagram_url = VennDiagramBuilder("QA7A2U-Y5YWWV97T5").build_diagram(expression)
-        image_response = requests.get(diagram_url)
-        if image_response.status_code == 200:
-            return StreamingResponse(
-                io.BytesIO(image_response.content), media_type=MEDIA_TYPE_PNG
-            )
-        else:
-            raise HTTPException(
-                status_code=500, detail="Error while collecting an image"
-            )
-    except Exception as e:
+        set_count = len(variables_in_order(parse_set(expression)))
+    except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+    if set_count <= MAX_SETS:
+        diagram = await run_job(
+            "venn-diagram", jobs.venn_diagram, expression, output_format
+        )
+        if output_format == "svg":
+            return Response(diagram, media_type=MEDIA_TYPE_SVG)
+        return StreamingResponse(io.BytesIO(diagram), media_type=MEDIA_TYPE_PNG)
+
+    if output_format != "png":
+        raise HTTPException(
+            status_code=400,
+            detail=f"SVG output supports at most {MAX_SETS} sets",
+        )
+    try:
+        image = await remote_venn.fetch_diagram(expression)
+    except UpstreamError as e:
+        raise HTTPException(status_code=502, detail=str(e))
+    return StreamingResponse(io.BytesIO(image), media_type=MEDIA_TYPE_PNG)
+
 
 @app.post("/simplify-boolean-expression/")
-async def simplify_boolean_expression(expression: str = Body(...)) -> dict:
-    simplifier = LogicSimplifier()
-    simplified_expr = simplifier.simplify_expression(expression)
-    simplified_expr = simplifier.reverse_transform(simplified_expr)
-    return {"simplified_expression": str(simplified_expr)}
+async def simplify_boolean_expression(
+    expression: str = Body(...), engine: str = Body("auto")
+) -> dict:
+    return await run_job(
+        "simplify-boolean-expression",
+        jobs.simplify_boolean_expression,
+        expression,
+        engine,
+    )
+
+
+@app.post("/simplify-boolean-expression/batch/")
+async def simplify_boolean_expression_batch(
+    expressions: List[str] = Body(...), engine: str = Body("auto")
+) -> dict:
+    results = await run_batch(
+        "batch", jobs.simplify_boolean_expression, expressions, engine
+    )
+    return {"results": results}
 
 
 @app.post("/generate-truth-table/")
-async def generate_truth_table_endpoint(expression: str = Body(...)):
-    try:
-        generator = TruthTableGenerator(expression)
-        image_buffer = generator.create_truth_table_image()
-        return StreamingResponse(image_buffer, media_type=MEDIA_TYPE_PNG)
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+async def generate_truth_table_endpoint(
+    expression: str = Body(...),
+    output_format: str = Query("png", alias="format"),
+    start: int = Query(0, ge=0),
+    page_size: Optional[int] = Query(None, gt=0),
+):
+    if output_format not in TRUTH_TABLE_FORMATS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown format '{output_format}', expected one of: "
+            f"{', '.join(TRUTH_TABLE_FORMATS)}",
+        )
 
+    if output_format == "png":
+        stop = start + min(page_size or IMAGE_ROW_LIMIT, IMAGE_ROW_LIMIT)
+        image = await run_job(
+            "generate-truth-table", jobs.truth_table_image, expression, start, stop
+        )
+        return StreamingResponse(io.BytesIO(image), media_type=MEDIA_TYPE_PNG)
+
+    variables = await run_job(
+        "generate-truth-table", jobs.truth_table_variables, expression
+    )
+    if len(variables) > TRUTH_TABLE_VARIABLE_LIMIT:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Truth tables are limited to {TRUTH_TABLE_VARIABLE_LIMIT} "
+            f"variables, got {len(variables)}",
+        )
+    row_count = 1 << len(variables)
+    stop = row_count if page_size is None else min(start + page_size, row_count)
+    writer = TruthTableWriter(variables, expression)
+    header, _, footer = writer.layout(output_format)
+
+    async def body():
+        yield header.encode()
+        for first in range(start, stop, STREAM_CHUNK_ROWS):
+            yield await run_job(
+                "generate-truth-table",
+                jobs.truth_table_rows,
+                expression,
+                output_format,
+                first,
+                min(first + STREAM_CHUNK_ROWS, stop),
+            )
+        yield footer.encode()
+
+    return StreamingResponse(body(), media_type=writer.MEDIA_TYPES[output_format])
+
+
+@app.post("/generate-truth-table/batch/")
+async def generate_truth_table_batch(expressions: List[str] = Body(..., embed=True)):
+    results = await run_batch("batch", jobs.truth_table, expressions)
+    return {"results": results}
+
+
+@app.post("/minterms/")
+async def get_minterms(expression: str = Body(...)) -> dict:
+    return await run_job("minterms", jobs.minterms, expression)
+
+
+@app.post("/maxterms/")
+async def get_maxterms(expression: str = Body(...)) -> dict:
+    return await run_job("maxterms", jobs.maxterms, expression)
+
+
+@app.post("/cdnf/")
+async def get_cdnf(expression: str = Body(...)) -> dict:
+    return {"cdnf": await run_job("cdnf", jobs.cdnf, expression)}
+
+
+@app.post("/ccnf/")
+async def get_ccnf(expression: str = Body(...)) -> dict:
+    return {"ccnf": await run_job("ccnf", jobs.ccnf, expression)}
+
+
+@app.post("/karnaugh-map/")
+async def get_karnaugh_map(expression: str = Body(...)) -> dict:
+    return await run_job("karnaugh-map", jobs.karnaugh_map, expression)
+
+
+@app.post("/zhegalkin/")
+async def get_zhegalkin_polynomial(expression: str = Body(...)) -> dict:
+    return await run_job("zhegalkin", jobs.zhegalkin, expression)
+
+
+@app.post("/post-classes/")
+async def get_post_classes(expression: str = Body(...)) -> dict:
+    return await run_job("post-classes", jobs.post_classes, expression)
+
+
+@app.post("/functional-completeness/")
+async def check_functional_completeness(
+    expressions: List[str] = Body(..., embed=True)
+) -> dict:
+    return await run_job(
+        "functional-completeness", jobs.functional_completeness, expressions
+    )
+
+
+@app.post("/boolean-equivalence/")
+async def check_boolean_equivalence(
+    first_expression: str = Body(...),
+    second_expression: str = Body(...),
+    ordering: str = Body("appearance"),
+) -> dict:
+    return await run_job(
+        "boolean-equivalence",
+        jobs.boolean_equivalence,
+        first_expression,
+        second_expression,
+        ordering,
+    )
 
-@app.post("/calculate-entropy/")
-async def get_entropy(string: str = Body(...)):
-    probability_calculator = ProbabilityCalculating(string)
-    probabilities = probability_calculator.get_probabilities().values()
 
-    probabilities_float = [float(prob) for prob in probabilities]
+@app.post("/count-models/")
+async def count_models(
+    expression: str = Body(...), ordering: str = Body("appearance")
+) -> dict:
+    return await run_job("count-models", jobs.count_models, expression, ordering)
 
-    entropy = -sum(p * math.log2(p) for p in probabilities_float if p > 0)
+
+@app.get("/cache-info/")
+async def get_cache_info() -> dict:
+    return await run_job("cache-info", jobs.cache_info)
+
+
+@app.get("/worker-pool-info/")
+async def get_worker_pool_info() -> dict:
+    return pool.stats()
+
+
+@app.get("/relation-sessions-info/")
+async def get_relation_sessions_info() -> dict:
+    return sessions.stats()
+
+
+@app.post("/calculate-entropy/")
+async def get_entropy(string: str = Body(...)):
+    entropy = await run_job("calculate-entropy", jobs.calculate_entropy, string)
     return {"entropy": entropy}
 
 
@@ -118,140 +670,213 @@ def create_probability_calculator_from_data(
     return probability_calculator
 
 
+def check_choice(kind, value, choices):
+    if value not in choices:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown {kind} '{value}', expected one of: {', '.join(choices)}",
+        )
+
+
+def encoded_response(result):
+    if "encoded_bytes" not in result:
+        return result
+    data = result.pop("encoded_bytes")
+    return Response(
+        content=pack_frame(jsonable_encoder(result), data),
+        media_type="application/octet-stream",
+        headers={"X-Bit-Length": str(result["bit_length"])},
+    )
+
+
 @app.post("/fixed_length-encode/")
-async def fixed_length_encode(string: str = Body(...)):
-    try:
-        coder = FixedLengthCoding(string)
-        encoded_string = coder.encode(string)
-        alphabet_dict = coder.get_alphabet_dict()
-        average_code_length = coder.average_code_length()
-
-        return {
-            "encoded_string": encoded_string,
-            "alphabet": alphabet_dict,
-            "average_code_length": average_code_length,
-        }
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+async def fixed_length_encode(
+    string: str = Body(...), output_format: str = Query("bits", alias="format")
+):
+    check_choice("format", output_format, ENCODED_FORMATS)
+    result = await run_job(
+        "fixed-length-encode", jobs.fixed_length_encode, string, output_format
+    )
+    return encoded_response(result)
 
 
 @app.post("/fixed_length_decode/")
 async def fixed_length_decode(
-    encoded_string: str = Body(...), alphabet: dict = Body(...)
+    alphabet: dict = Body(...),
+    encoded_string: Optional[str] = Body(None),
+    encoded_data: Optional[str] = Body(None),
+    bit_length: Optional[int] = Body(None, ge=0),
 ):
-    coding = FixedLengthCoding.recreate_from_alphabet(alphabet)
-
-    decoded_string = coding.decode(encoded_string)
-
-    return {"decoded_string": decoded_string}
+    return await run_job(
+        "fixed-length-decode",
+        jobs.fixed_length_decode,
+        alphabet,
+        encoded_string,
+        encoded_data,
+        bit_length,
+    )
 
 
 @app.post("/shennon_fano_encode/")
-async def shennon_fano_encode(string: str = Body(...)):
-    try:
-        coder = ShennonFanoCoding(ProbabilityCalculating(string))
-        encoded_string = coder.encode(string)
-        average_code_length = coder.average_code_length()
-
-        return {
-            "encoded_string": encoded_string,
-            "codes": coder.char_to_code,
-            "average_code_length": average_code_length,
-        }
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+async def shennon_fano_encode(
+    string: str = Body(...),
+    output_format: str = Query("bits", alias="format"),
+    codebook: str = Query("codes"),
+):
+    check_choice("format", output_format, ENCODED_FORMATS)
+    check_choice("codebook", codebook, CODEBOOK_FORMATS)
+    result = await run_job(
+        "shennon-fano-encode",
+        jobs.shennon_fano_encode,
+        string,
+        output_format,
+        codebook,
+    )
+    return encoded_response(result)
 
 
 @app.post("/shennon_fano_decode/")
-async def shennon_fano_decode(encoded_string: str = Body(...), codes: dict = Body(...)):
-    try:
-        coder = ShennonFanoCoding.recreate_from_codes(codes)
-        decoded_string = coder.decode(encoded_string)
-        return {"decoded_string": decoded_string}
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+async def shennon_fano_decode(
+    codes: Optional[dict] = Body(None),
+    code_lengths: Optional[Dict[str, int]] = Body(None),
+    encoded_string: Optional[str] = Body(None),
+    encoded_data: Optional[str] = Body(None),
+    bit_length: Optional[int] = Body(None, ge=0),
+):
+    return await run_job(
+        "shennon-fano-decode",
+        jobs.prefix_decode,
+        codes,
+        encoded_string,
+        encoded_data,
+        bit_length,
+        code_lengths,
+    )
 
 
 @app.post("/huffman-encode/")
-async def huffman_encode(string: str = Body(...)):
-    try:
-        probability_calculator = ProbabilityCalculating(string)
-        huffman_coder = HuffmanCoding(probability_calculator)
-        encoded_string = huffman_coder.encode(string)
-        average_code_length = huffman_coder.average_code_length()
-
-        return {
-            "encoded_string": encoded_string,
-            "codes": huffman_coder.code_dict,
-            "average_code_length": average_code_length,
-        }
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+async def huffman_encode(
+    string: str = Body(...),
+    output_format: str = Query("bits", alias="format"),
+    max_code_length: Optional[int] = Query(None, ge=1, le=MAX_CODE_LENGTH),
+    codebook: str = Query("codes"),
+):
+    check_choice("format", output_format, ENCODED_FORMATS)
+    check_choice("codebook", codebook, CODEBOOK_FORMATS)
+    result = await run_job(
+        "huffman-encode",
+        jobs.huffman_encode,
+        string,
+        output_format,
+        max_code_length,
+        codebook,
+    )
+    return encoded_response(result)
 
 
-@app.post("/huffman-decode/")
-async def huffman_decode(encoded_string: str = Body(...), codes: dict = Body(...)):
-    try:
-        huffman_coder = HuffmanCoding(ProbabilityCalculating(encoded_string))
-        decoded_string = huffman_coder.decode(encoded_string, codes)
-        return {"decoded_string": decoded_string}
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+@app.post("/huffman-encode/batch/")
+async def huffman_encode_batch(strings: List[str] = Body(..., embed=True)):
+    results = await run_batch("batch", jobs.huffman_encode, strings)
+    return {"results": results}
 
 
-@app.post("/arithmetic-encode/")
-async def arithmetic_encode(string: str = Body(...)):
-    try:
-        probability_calculator = ProbabilityCalculating(string)
-        coder = ArithmeticCoder(probability_calculator)
-        encoded_value = coder.encode(string)
-        probabilities_dict = probability_calculator.get_probabilities()
+@app.post("/huffman-decode/")
+async def huffman_decode(
+    codes: Optional[dict] = Body(None),
+    code_lengths: Optional[Dict[str, int]] = Body(None),
+    encoded_string: Optional[str] = Body(None),
+    encoded_data: Optional[str] = Body(None),
+    bit_length: Optional[int] = Body(None, ge=0),
+):
+    return await run_job(
+        "huffman-decode",
+        jobs.prefix_decode,
+        codes,
+        encoded_string,
+        encoded_data,
+        bit_length,
+        code_lengths,
+    )
 
-        sorted_probabilities = sorted(
-            probabilities_dict.items(), key=lambda x: (x[1], x[0])
-        )
-        alphabet_dict = {letter: str(prob) for letter, prob in sorted_probabilities}
 
-        return {
-            "encoded_value": str(encoded_value),
-            "alphabet_and_probabilities": alphabet_dict,
-            "original_length_of_string": len(string),
-        }
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+@app.post("/arithmetic-encode/")
+async def arithmetic_encode(string: str = Body(...), engine: str = Query("decimal")):
+    check_choice("engine", engine, ARITHMETIC_ENGINES)
+    if engine == "range":
+        return await run_job("arithmetic-encode", jobs.range_encode, string)
+    return await run_job("arithmetic-encode", jobs.arithmetic_encode, string)
 
 
 @app.post("/arithmetic-encode-interval-table/")
 async def arithmetic_encode_interval_table(string: str = Body(...)):
-    try:
-        probability_calculator = ProbabilityCalculating(string)
-        coder = ArithmeticCoder(probability_calculator)
-        coder.encode(string)
-        image = coder.create_encoding_intervals_image(string)
-        return StreamingResponse(image, media_type=MEDIA_TYPE_PNG)
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    image = await run_job(
+        "arithmetic-encode-interval-table", jobs.arithmetic_interval_table, string
+    )
+    return Response(content=image, media_type=MEDIA_TYPE_PNG)
 
 
 @app.post("/arithmetic-decode/")
 async def arithmetic_decode(
     encoded_value: str = Body(...),
-    alphabet_and_probabilities: dict = Body(...),
-    original_length_of_string: int = Body(...),
+    original_length_of_string: int = Body(..., ge=0),
+    alphabet_and_probabilities: Optional[dict] = Body(None),
+    alphabet_and_frequencies: Optional[Dict[str, int]] = Body(None),
+    engine: str = Query("decimal"),
 ):
-    try:
-        probability_calculator = ProbabilityCalculating("")
-        total_letters = Decimal(original_length_of_string)
-        probability_calculator.letter_counts = {
-            letter: Decimal(prob) * total_letters
-            for letter, prob in alphabet_and_probabilities.items()
-        }
-        probability_calculator.total_letters = total_letters
-        coder = ArithmeticCoder(probability_calculator)
-        decoded_string = coder.decode(Decimal(encoded_value), original_length_of_string)
-        return {"decoded_string": decoded_string}
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    check_choice("engine", engine, ARITHMETIC_ENGINES)
+    if original_length_of_string > DECODE_LENGTH_LIMIT:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Decoding is limited to {DECODE_LENGTH_LIMIT} symbols",
+        )
+    if engine == "range":
+        if alphabet_and_frequencies is None:
+            raise HTTPException(
+                status_code=400,
+                detail="The range engine requires alphabet_and_frequencies",
+            )
+        return await run_job(
+            "arithmetic-decode",
+            jobs.range_decode,
+            encoded_value,
+            alphabet_and_frequencies,
+            original_length_of_string,
+        )
+    if alphabet_and_probabilities is None:
+        raise HTTPException(
+            status_code=400,
+            detail="The decimal engine requires alphabet_and_probabilities",
+        )
+    return await run_job(
+        "arithmetic-decode",
+        jobs.arithmetic_decode,
+        encoded_value,
+        alphabet_and_probabilities,
+        original_length_of_string,
+    )
+
+
+@app.post("/adaptive-arithmetic-encode/")
+async def adaptive_arithmetic_encode(
+    string: str = Body(...),
+    order: int = Query(DEFAULT_ORDER, ge=0, le=MAX_ORDER),
+):
+    return await run_job(
+        "adaptive-arithmetic-encode", jobs.adaptive_arithmetic_encode, string, order
+    )
+
+
+@app.post("/adaptive-arithmetic-decode/")
+async def adaptive_arithmetic_decode(
+    encoded_value: str = Body(...),
+    order: int = Body(DEFAULT_ORDER, ge=0, le=MAX_ORDER),
+):
+    return await run_job(
+        "adaptive-arithmetic-decode",
+        jobs.adaptive_arithmetic_decode,
+        encoded_value,
+        order,
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,389 @@
+import base64
+import math
+import os
+import tempfile
+from decimal import Decimal
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+from src.math_algos.bdd import BDD, order_variables
+from src.math_algos.binary_relations import (
+    BinaryRelationGraph,
+    BinaryRelationProperties,
+    BinaryRelationStructure,
+    RelationAlgebra,
+)
+from src.math_algos.bit_io import ENCODED_FORMATS, BitReader, bits_from_string
+from src.math_algos.boolean_algebra import (
+    CanonicalForms,
+    FunctionalCompleteness,
+    KarnaughMap,
+    LogicSimplifier,
+    PostClasses,
+    TruthTableGenerator,
+    TruthTableWriter,
+    ZhegalkinPolynomial,
+)
+from src.math_algos.caching import DiskCache
+from src.math_algos.context_coding import context_decode, context_encode
+from src.math_algos.encoding_decoding_algos import (
+    ArithmeticCoder,
+    FixedLengthCoding,
+    HuffmanCoding,
+    ProbabilityCalculating,
+    ShennonFanoCoding,
+)
+from src.math_algos.expression_cache import simplification_cache, truth_table_cache
+from src.math_algos.expression_parser import XOR, parse_logic
+from src.math_algos.graph_layout import layout_cache
+from src.math_algos.prefix_coding import PrefixDecoder, canonical_codes
+from src.math_algos.range_coding import FrequencyTable, RangeCoder
+from src.math_algos.relation_ingestion import RelationReader
+from src.math_algos.set_evaluation import SetEvaluator
+from src.math_algos.set_theory import SetRelations, SetSimplifier
+from src.math_algos.venn_diagram import VennDiagramRenderer
+
+layout_cache.disk = DiskCache(
+    os.environ.get(
+        "DS_LAYOUT_CACHE_DIR",
+        os.path.join(tempfile.gettempdir(), "discrete-solver-layouts"),
+    ),
+    ttl=float(os.environ.get("DS_LAYOUT_CACHE_TTL", 24 * 3600)),
+    max_bytes=int(os.environ.get("DS_LAYOUT_CACHE_BYTES", 64 * 1024 * 1024)),
+)
+
+
+def simplify_boolean_expression(expression, engine):
+    simplifier = LogicSimplifier(engine)
+    simplified_expr = simplifier.simplify_expression(expression)
+    return {
+        "simplified_expression": str(simplifier.reverse_transform(simplified_expr)),
+        "exact": simplifier.exact,
+    }
+
+
+def venn_diagram_key(expression):
+    return SetSimplifier().simplify_expression(expression)
+
+
+def simplify_set(expression):
+    simplifier = SetSimplifier()
+    simplified_expr = simplifier.simplify_expression(expression)
+    return simplifier.reverse_transform(simplified_expr)
+
+
+def truth_table_image(expression, start=0, stop=None):
+    generator = TruthTableGenerator(expression)
+    return generator.create_truth_table_image(start, stop).getvalue()
+
+
+def truth_table_variables(expression):
+    return TruthTableGenerator(expression).variables()
+
+
+def truth_table_rows(expression, output_format, start, stop):
+    variables, results = TruthTableGenerator(expression).page(start, stop)
+    writer = TruthTableWriter(variables, expression, results, start)
+    return writer.rows(output_format)
+
+
+def truth_table(expression):
+    generator = TruthTableGenerator(expression)
+    parsed_expr, variables = generator.parse()
+    return {
+        "variables": variables,
+        "results": generator.results(parsed_expr, variables).astype(int).tolist(),
+    }
+
+
+def minterms(expression):
+    forms = CanonicalForms(expression)
+    return {"variables": forms.variables, "minterms": forms.minterms()}
+
+
+def maxterms(expression):
+    forms = CanonicalForms(expression)
+    return {"variables": forms.variables, "maxterms": forms.maxterms()}
+
+
+def cdnf(expression):
+    return CanonicalForms(expression).cdnf()
+
+
+def ccnf(expression):
+    return CanonicalForms(expression).ccnf()
+
+
+def karnaugh_map(expression):
+    return KarnaughMap(expression).build()
+
+
+def zhegalkin(expression):
+    polynomial = ZhegalkinPolynomial(expression)
+    return {
+        "variables": polynomial.variables,
+        "polynomial": polynomial.to_string(),
+        "degree": polynomial.degree(),
+        "monomial_count": len(polynomial.monomials()),
+    }
+
+
+def post_classes(expression):
+    classes = PostClasses(expression)
+    return {"variables": classes.variables, "classes": classes.classes()}
+
+
+def functional_completeness(expressions):
+    return FunctionalCompleteness(expressions).check()
+
+
+def encoded_fields(writer, output_format):
+    if output_format == "bits":
+        return {"encoded_string": writer.to_string()}
+    if output_format == "base64":
+        return {"encoded_data": writer.to_base64(), "bit_length": writer.bit_length}
+    if output_format == "binary":
+        return {"encoded_bytes": writer.getvalue(), "bit_length": writer.bit_length}
+    raise ValueError(
+        f"Unknown format '{output_format}', expected one of: "
+        f"{', '.join(ENCODED_FORMATS)}"
+    )
+
+
+def read_bits(encoded_string, encoded_data, bit_length):
+    if encoded_data is not None:
+        return BitReader.from_base64(encoded_data, bit_length).bits()
+    if encoded_string is None:
+        raise ValueError("Either encoded_string or encoded_data is required")
+    return bits_from_string(encoded_string)
+
+
+def fixed_length_encode(string, output_format="bits"):
+    coder = FixedLengthCoding(string)
+    return {
+        **encoded_fields(coder.encode_bits(string), output_format),
+        "alphabet": coder.get_alphabet_dict(),
+        "average_code_length": coder.average_code_length(),
+    }
+
+
+def fixed_length_decode(alphabet, encoded_string, encoded_data=None, bit_length=None):
+    coder = FixedLengthCoding.recreate_from_alphabet(alphabet)
+    bits = read_bits(encoded_string, encoded_data, bit_length)
+    return {"decoded_string": coder.decode_bits(bits)}
+
+
+def codebook_fields(coder, codes, codebook):
+    if codebook == "lengths":
+        return {"code_lengths": coder.code_lengths()}
+    return {"codes": codes}
+
+
+def shennon_fano_encode(string, output_format="bits", codebook="codes"):
+    coder = ShennonFanoCoding(ProbabilityCalculating(string))
+    if codebook == "lengths":
+        coder.canonicalize()
+    return {
+        **encoded_fields(coder.encode_bits(string), output_format),
+        **codebook_fields(coder, coder.char_to_code, codebook),
+        "average_code_length": coder.average_code_length(),
+    }
+
+
+def huffman_encode(
+    string, output_format="bits", max_code_length=None, codebook="codes"
+):
+    huffman_coder = HuffmanCoding(ProbabilityCalculating(string), max_code_length)
+    if codebook == "lengths":
+        huffman_coder.canonicalize()
+    return {
+        **encoded_fields(huffman_coder.encode_bits(string), output_format),
+        **codebook_fields(huffman_coder, huffman_coder.code_dict, codebook),
+        "average_code_length": huffman_coder.average_code_length(),
+    }
+
+
+def prefix_decode(
+    codes, encoded_string, encoded_data=None, bit_length=None, code_lengths=None
+):
+    if code_lengths is not None:
+        codes = canonical_codes(code_lengths)
+    elif codes is None:
+        raise ValueError("Either codes or code_lengths is required")
+    bits = read_bits(encoded_string, encoded_data, bit_length)
+    return {"decoded_string": PrefixDecoder(codes).decode_bits(bits)}
+
+
+def calculate_entropy(string):
+    probabilities = ProbabilityCalculating(string).get_probabilities().values()
+    probabilities_float = [float(prob) for prob in probabilities]
+    return -sum(p * math.log2(p) for p in probabilities_float if p > 0)
+
+
+def arithmetic_encode(string):
+    probability_calculator = ProbabilityCalculating(string)
+    coder = ArithmeticCoder(probability_calculator)
+    encoded_value = coder.encode(string)
+    probabilities_dict = probability_calculator.get_probabilities()
+
+    sorted_probabilities = sorted(
+        probabilities_dict.items(), key=lambda x: (x[1], x[0])
+    )
+    alphabet_dict = {letter: str(prob) for letter, prob in sorted_probabilities}
+
+    return {
+        "encoded_value": str(encoded_value),
+        "alphabet_and_probabilities": alphabet_dict,
+        "original_length_of_string": len(string),
+    }
+
+
+def arithmetic_interval_table(string):
+    coder = ArithmeticCoder(ProbabilityCalculating(string))
+    coder.encode(string)
+    return coder.create_encoding_intervals_image(string).getvalue()
+
+
+def arithmetic_decode(encoded_value, probabilities, length):
+    probability_calculator = ProbabilityCalculating("")
+    total_letters = Decimal(length)
+    probability_calculator.letter_counts = {
+        letter: Decimal(prob) * total_letters for letter, prob in probabilities.items()
+    }
+    probability_calculator.total_letters = total_letters
+    coder = ArithmeticCoder(probability_calculator)
+    return {"decoded_string": coder.decode(Decimal(encoded_value), length)}
+
+
+def range_encode(string):
+    coder = RangeCoder.from_string(string)
+    return {
+        "encoded_value": base64.b64encode(coder.encode(string)).decode("ascii"),
+        "alphabet_and_frequencies": coder.table.to_dict(),
+        "original_length_of_string": len(string),
+        "engine": "range",
+    }
+
+
+def range_decode(encoded_value, frequencies, length):
+    data = base64.b64decode(encoded_value, validate=True)
+    return {
+        "decoded_string": RangeCoder(FrequencyTable(frequencies)).decode(data, length)
+    }
+
+
+def adaptive_arithmetic_encode(string, order):
+    data = context_encode(string, order)
+    return {
+        "encoded_value": base64.b64encode(data).decode("ascii"),
+        "order": order,
+        "original_length_of_string": len(string),
+        "compressed_bytes": len(data),
+    }
+
+
+def adaptive_arithmetic_decode(encoded_value, order):
+    data = base64.b64decode(encoded_value, validate=True)
+    return {"decoded_string": context_decode(data, order)}
+
+
+def set_equivalence(first_expression, second_expression):
+    return SetRelations(first_expression, second_expression).equivalence()
+
+
+def set_inclusion(first_expression, second_expression):
+    return SetRelations(first_expression, second_expression).inclusion()
+
+
+def evaluate_set(expression, sets, universe, members, start, limit):
+    evaluator = SetEvaluator(sets, universe)
+    result = evaluator.evaluate(expression)
+    cardinality = evaluator.cardinality(result)
+    response = {"cardinality": cardinality}
+    if members:
+        page = evaluator.members(result, start, limit)
+        response["members"] = page
+        response["next_start"] = (
+            start + len(page) if start + len(page) < cardinality else None
+        )
+    return response
+
+
+def venn_diagram(expression, output_format):
+    diagram = VennDiagramRenderer(expression).render(output_format)
+    return diagram.getvalue() if output_format == "png" else diagram
+
+
+def relation_properties(set_of_elements, binary_relation):
+    relation = BinaryRelationProperties(set_of_elements, binary_relation)
+    return relation.get_properties_as_list()
+
+
+def relation_properties_file(path, input_format, set_of_elements, header):
+    with open(path, "rb") as stream:
+        reader = RelationReader(set_of_elements).read(stream, input_format, header)
+    relation = BinaryRelationProperties.from_matrix(reader.matrix())
+    return relation.get_properties_as_list()
+
+
+def relation_closures(set_of_elements, binary_relation):
+    return BinaryRelationStructure(set_of_elements, binary_relation).closures()
+
+
+def equivalence_classes(set_of_elements, binary_relation):
+    relation = BinaryRelationStructure(set_of_elements, binary_relation)
+    return relation.equivalence_classes()
+
+
+def hasse_diagram(set_of_elements, binary_relation):
+    return BinaryRelationStructure(set_of_elements, binary_relation).hasse_diagram()
+
+
+def relation_composition(set_of_elements, first_relation, second_relation):
+    return RelationAlgebra(set_of_elements, first_relation).compose(second_relation)
+
+
+def relation_graph_image(
+    set_of_elements,
+    binary_relation,
+    output_format="png",
+    layout="auto",
+    node_color="skyblue",
+    font_size=20,
+):
+    graph = BinaryRelationGraph(set_of_elements, binary_relation, layout)
+    image = graph.render(output_format, node_color, font_size)
+    return image.getvalue() if output_format == "png" else image
+
+
+def boolean_equivalence(first_expression, second_expression, ordering):
+    trees = [parse_logic(first_expression), parse_logic(second_expression)]
+    manager = BDD(order_variables(trees, ordering))
+    first, second = (manager.build(tree) for tree in trees)
+    difference = manager.apply(XOR, first, second)
+    return {
+        "equivalent": manager.equivalent(first, second),
+        "counterexample": manager.satisfy_one(difference),
+    }
+
+
+def count_models(expression, ordering):
+    tree = parse_logic(expression)
+    manager = BDD(order_variables([tree], ordering))
+    root = manager.build(tree)
+    return {
+        "variables": manager.variables,
+        "models": manager.count(root),
+        "example": manager.satisfy_one(root),
+    }
+
+
+def cache_info():
+    return {
+        "worker_pid": os.getpid(),
+        "simplification": simplification_cache.info(),
+        "truth_table": truth_table_cache.info(),
+        "relation_layout": layout_cache.info(),
+    }
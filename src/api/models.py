@@ -1,8 +1,23 @@
-from typing import Literal, Optional, Union
+from typing import Dict, Literal, Optional, Union
 
 from pydantic import BaseModel, Field
 
 
+def parse_binary_relation(text: str) -> set[tuple[str, str]]:
+    # maybe we need regex here
+    binary_relation = text.replace(" ", "")
+    if not binary_relation:
+        return set()
+    binary_relation = binary_relation.strip("()")
+    binary_relation_list = binary_relation.split("),(")
+    relation_set = set()
+    for pair in binary_relation_list:
+        elements = pair.split(",")
+        el1, el2 = elements[0], elements[1]
+        relation_set.add((el1, el2))
+    return relation_set
+
+
 class BinaryRelationModel(BaseModel):
     set_of_elements: Optional[str] = Field(
         default=None,
@@ -21,16 +36,43 @@ class BinaryRelationModel(BaseModel):
             return set(self.set_of_elements.split(","))
 
     def get_binary_relation(self) -> set[tuple[str, str]]:
-        # maybe we need regex here
-        binary_relation = self.binary_relation.replace(" ", "")
-        binary_relation = binary_relation.strip("()")
-        binary_relation_list = binary_relation.split("),(")
-        relation_set = set()
-        for pair in binary_relation_list:
-            elements = pair.split(",")
-            el1, el2 = elements[0], elements[1]
-            relation_set.add((el1, el2))
-        return relation_set
+        return parse_binary_relation(self.binary_relation)
+
+
+class RelationCompositionModel(BaseModel):
+    set_of_elements: Optional[str] = Field(
+        default=None,
+        description="Множество, на котором заданы оба отношения.\n"
+        "Может быть сгенерировано автоматически на основе отношений",
+        examples=["1,2,3"],
+    )
+    first_relation: str = Field(
+        description="Отношение R, заданное парами",
+        examples=["(1,2),(2,3)"],
+    )
+    second_relation: str = Field(
+        description="Отношение S, заданное парами. Результат: R∘S = "
+        "{(a,c) | (a,b) ∈ R, (b,c) ∈ S}",
+        examples=["(2,1),(3,3)"],
+    )
+
+    def get_set_of_elements(self) -> set[str]:
+        elements = (
+            set(self.set_of_elements.split(",")) if self.set_of_elements else set()
+        )
+        for relation in (self.get_first_relation(), self.get_second_relation()):
+            elements.update(element for pair in relation for element in pair)
+        return elements
+
+    def get_first_relation(self) -> set[tuple[str, str]]:
+        return parse_binary_relation(self.first_relation)
+
+    def get_second_relation(self) -> set[tuple[str, str]]:
+        return parse_binary_relation(self.second_relation)
+
+
+class RelationCompositionResultModel(BaseModel):
+    composition: list[tuple[str, str]]
 
 
 class GetRelationPropertiesModel(BaseModel):
@@ -48,3 +90,47 @@ class GetRelationPropertiesModel(BaseModel):
             "Нетранзитивно",
         ]
     ] = Field(default=["Нерефлексивно", "Несимметрично", "Нетранзитивно"])
+
+
+class RelationClosuresModel(BaseModel):
+    reflexive: list[tuple[str, str]]
+    symmetric: list[tuple[str, str]]
+    transitive: list[tuple[str, str]]
+
+
+class EquivalenceClassesModel(BaseModel):
+    is_equivalence: bool
+    classes: list[list[str]]
+
+
+class HasseDiagramModel(BaseModel):
+    covers: list[tuple[str, str]]
+    minimal: list[str]
+    maximal: list[str]
+    least: Optional[str]
+    greatest: Optional[str]
+    topological_order: list[str]
+
+
+class RelationSessionModel(GetRelationPropertiesModel):
+    session_id: str
+    counters: Dict[str, int]
+
+
+class RelationEditModel(BaseModel):
+    insert: str = Field(
+        default="",
+        description="Пары, добавляемые в отношение",
+        examples=["(1,3)"],
+    )
+    delete: str = Field(
+        default="",
+        description="Пары, удаляемые из отношения",
+        examples=["(2,2)"],
+    )
+
+    def get_insertions(self) -> set[tuple[str, str]]:
+        return parse_binary_relation(self.insert)
+
+    def get_deletions(self) -> set[tuple[str, str]]:
+        return parse_binary_relation(self.delete)
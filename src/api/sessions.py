@@ -0,0 +1,61 @@
+import os
+import time
+import uuid
+from collections import OrderedDict
+
+
+class SessionNotFoundError(KeyError):
+    pass
+
+
+class SessionStore:
+    def __init__(self, maxsize=None, ttl=None, clock=time.monotonic):
+        if maxsize is None:
+            maxsize = int(os.environ.get("DS_SESSION_LIMIT", 1000))
+        if ttl is None:
+            ttl = float(os.environ.get("DS_SESSION_TTL", 3600))
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self.entries = OrderedDict()
+        self.evictions = 0
+
+    def expire(self):
+        deadline = self.clock() - self.ttl
+        while self.entries:
+            session_id, (touched, _) = next(iter(self.entries.items()))
+            if touched > deadline:
+                break
+            del self.entries[session_id]
+            self.evictions += 1
+
+    def add(self, session):
+        self.expire()
+        session_id = uuid.uuid4().hex
+        self.entries[session_id] = (self.clock(), session)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+        return session_id
+
+    def get(self, session_id):
+        self.expire()
+        if session_id not in self.entries:
+            raise SessionNotFoundError(f"Session {session_id} not found or expired")
+        _, session = self.entries.pop(session_id)
+        self.entries[session_id] = (self.clock(), session)
+        return session
+
+    def remove(self, session_id):
+        self.expire()
+        if self.entries.pop(session_id, None) is None:
+            raise SessionNotFoundError(f"Session {session_id} not found or expired")
+
+    def stats(self):
+        self.expire()
+        return {
+            "size": len(self.entries),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "evictions": self.evictions,
+        }
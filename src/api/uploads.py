@@ -0,0 +1,97 @@
+try:
+    from python_multipart.multipart import MultipartParser, parse_options_header
+except ModuleNotFoundError:
+    from multipart.multipart import MultipartParser, parse_options_header
+
+FIELD_LIMIT = 64 * 1024
+
+
+class UploadError(ValueError):
+    pass
+
+
+class MultipartUpload:
+    def __init__(self, content_type, file_field="file", field_limit=FIELD_LIMIT):
+        media_type, options = parse_options_header(content_type)
+        if media_type != b"multipart/form-data" or b"boundary" not in options:
+            raise UploadError("Expected a multipart/form-data body")
+        self.file_field = file_field
+        self.field_limit = field_limit
+        self.fields = {}
+        self.has_file = False
+        self.pending = []
+        self.header_field = bytearray()
+        self.header_value = bytearray()
+        self.part_headers = {}
+        self.part_name = None
+        self.part_value = bytearray()
+        self.parser = MultipartParser(
+            options[b"boundary"],
+            {
+                "on_part_begin": self.on_part_begin,
+                "on_header_field": self.on_header_field,
+                "on_header_value": self.on_header_value,
+                "on_header_end": self.on_header_end,
+                "on_headers_finished": self.on_headers_finished,
+                "on_part_data": self.on_part_data,
+                "on_part_end": self.on_part_end,
+            },
+        )
+
+    def on_part_begin(self):
+        self.part_headers = {}
+        self.part_name = None
+        self.part_value = bytearray()
+
+    def on_header_field(self, data, start, end):
+        self.header_field += data[start:end]
+
+    def on_header_value(self, data, start, end):
+        self.header_value += data[start:end]
+
+    def on_header_end(self):
+        self.part_headers[bytes(self.header_field).lower()] = bytes(self.header_value)
+        self.header_field.clear()
+        self.header_value.clear()
+
+    def on_headers_finished(self):
+        _, options = parse_options_header(
+            self.part_headers.get(b"content-disposition", b"")
+        )
+        name = options.get(b"name", b"").decode("utf-8", "replace")
+        if name == self.file_field and b"filename" in options:
+            if self.has_file:
+                raise UploadError(f"Only one '{self.file_field}' part is allowed")
+            self.has_file = True
+            self.part_name = None
+        else:
+            self.part_name = name
+
+    def on_part_data(self, data, start, end):
+        if self.part_name is None:
+            self.pending.append(bytes(data[start:end]))
+            return
+        self.part_value += data[start:end]
+        if len(self.part_value) > self.field_limit:
+            raise UploadError(
+                f"Form field '{self.part_name}' exceeds {self.field_limit} bytes"
+            )
+
+    def on_part_end(self):
+        if self.part_name is not None:
+            self.fields[self.part_name] = self.part_value.decode("utf-8")
+
+    def drain(self):
+        chunks, self.pending = self.pending, []
+        return chunks
+
+    async def file_chunks(self, stream):
+        async for chunk in stream:
+            self.parser.write(chunk)
+            for piece in self.drain():
+                yield piece
+        self.parser.finalize()
+        for piece in self.drain():
+            yield piece
+        if not self.has_file:
+            raise UploadError(f"Missing '{self.file_field}' file part")
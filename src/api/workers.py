@@ -0,0 +1,257 @@
+import asyncio
+import multiprocessing
+import os
+
+RESPAWN_DELAY = 0.5
+RESPAWN_DELAY_LIMIT = 30
+
+
+class PoolOverloadedError(Exception):
+    pass
+
+
+class JobTimeoutError(Exception):
+    pass
+
+
+class WorkerCrashedError(Exception):
+    pass
+
+
+def prewarm():
+    import matplotlib
+
+    matplotlib.use("Agg")
+
+    import matplotlib.pyplot  # noqa: F401
+    import numpy  # noqa: F401
+
+    from src.api import jobs
+    from src.math_algos.venn_diagram import MAX_SETS, region_geometry
+
+    jobs.simplify_boolean_expression("a ∧ b ∨ a ∧ ¬b", "sympy")
+    for count in range(1, MAX_SETS + 1):
+        region_geometry(count)
+
+
+def run_each(func, items, *args):
+    outcomes = []
+    for item in items:
+        try:
+            outcomes.append(("ok", func(item, *args)))
+        except Exception as e:
+            outcomes.append(("error", str(e)))
+    return outcomes
+
+
+def worker_main(connection):
+    prewarm()
+    connection.send(("ready", None))
+    while True:
+        try:
+            job = connection.recv()
+        except EOFError:
+            break
+        if job is None:
+            break
+
+        func, args = job
+        try:
+            reply = ("ok", func(*args))
+        except Exception as e:
+            reply = ("error", e)
+
+        try:
+            connection.send(reply)
+        except Exception as e:
+            connection.send(("error", ValueError(str(e))))
+
+
+class Worker:
+    def __init__(self, context):
+        self.connection, child_connection = context.Pipe()
+        self.process = context.Process(
+            target=worker_main, args=(child_connection,), daemon=True
+        )
+        self.process.start()
+        child_connection.close()
+
+    def wait_ready(self):
+        status, _ = self.connection.recv()
+        if status != "ready":
+            raise WorkerCrashedError("Worker failed to start")
+
+    def kill(self):
+        self.process.kill()
+        self.process.join()
+        self.connection.close()
+
+    def stop(self, timeout=1):
+        try:
+            self.connection.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.connection.close()
+
+
+class WorkerPool:
+    def __init__(self, size=None, max_queue=None):
+        self.size = size or int(os.environ.get("DS_WORKERS", os.cpu_count() or 1))
+        if max_queue is None:
+            max_queue = int(os.environ.get("DS_QUEUE_DEPTH", self.size * 4))
+        self.max_queue = max_queue
+        self.context = multiprocessing.get_context("spawn")
+        self.idle = None
+        self.workers = set()
+        self.pending = 0
+        self.replacements = set()
+        self.respawn_failures = 0
+        self.respawn_error = None
+
+    @property
+    def started(self):
+        return self.idle is not None
+
+    async def start(self):
+        if self.started:
+            return
+        loop = asyncio.get_running_loop()
+        workers = [Worker(self.context) for _ in range(self.size)]
+        await asyncio.gather(
+            *(loop.run_in_executor(None, worker.wait_ready) for worker in workers)
+        )
+        self.idle = asyncio.Queue()
+        for worker in workers:
+            self.workers.add(worker)
+            self.idle.put_nowait(worker)
+
+    async def stop(self):
+        if not self.started:
+            return
+        for task in list(self.replacements):
+            task.cancel()
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            *(loop.run_in_executor(None, worker.stop) for worker in self.workers)
+        )
+        self.workers.clear()
+        self.idle = None
+
+    def stats(self):
+        return {
+            "size": self.size,
+            "max_queue": self.max_queue,
+            "pending": self.pending,
+            "idle": self.idle.qsize() if self.started else 0,
+            "workers": len(self.workers),
+            "respawning": len(self.replacements),
+            "respawn_failures": self.respawn_failures,
+            "respawn_error": self.respawn_error,
+        }
+
+    async def run(self, func, *args, timeout=None):
+        if not self.started:
+            await self.start()
+        if self.pending >= self.size + self.max_queue:
+            raise PoolOverloadedError("Worker pool queue is full")
+
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        self.pending += 1
+        try:
+            try:
+                worker = await asyncio.wait_for(self.idle.get(), timeout)
+            except asyncio.TimeoutError:
+                raise JobTimeoutError("Timed out waiting for a free worker")
+
+            remaining = None if deadline is None else max(deadline - loop.time(), 0)
+            try:
+                status, result = await asyncio.wait_for(
+                    self.call(worker, func, args), remaining
+                )
+            except asyncio.TimeoutError:
+                self.replace(worker)
+                raise JobTimeoutError("Job exceeded its time limit")
+            except (EOFError, OSError):
+                self.replace(worker)
+                raise WorkerCrashedError("Worker process exited unexpectedly")
+            except BaseException:
+                self.replace(worker)
+                raise
+
+            self.idle.put_nowait(worker)
+        finally:
+            self.pending -= 1
+
+        if status == "error":
+            raise result
+        return result
+
+    async def map(self, func, items, *args, timeout=None):
+        unique = list(dict.fromkeys(items))
+        if not unique:
+            return []
+
+        count = min(self.size, len(unique))
+        chunks = [unique[index::count] for index in range(count)]
+        replies = await asyncio.gather(
+            *(
+                self.run(run_each, func, chunk, *args, timeout=timeout)
+                for chunk in chunks
+            ),
+            return_exceptions=True,
+        )
+
+        outcomes = {}
+        for chunk, reply in zip(chunks, replies):
+            if isinstance(reply, PoolOverloadedError):
+                raise reply
+            if isinstance(reply, BaseException):
+                reply = [("error", str(reply))] * len(chunk)
+            outcomes.update(zip(chunk, reply))
+        return [outcomes[item] for item in items]
+
+    async def call(self, worker, func, args):
+        loop = asyncio.get_running_loop()
+        readable = loop.create_future()
+        fileno = worker.connection.fileno()
+
+        await loop.run_in_executor(None, worker.connection.send, (func, args))
+        loop.add_reader(fileno, lambda: readable.done() or readable.set_result(None))
+        try:
+            await readable
+        finally:
+            loop.remove_reader(fileno)
+        return await loop.run_in_executor(None, worker.connection.recv)
+
+    def replace(self, worker):
+        self.workers.discard(worker)
+        task = asyncio.get_running_loop().create_task(self.respawn(worker))
+        self.replacements.add(task)
+        task.add_done_callback(self.replacements.discard)
+
+    async def respawn(self, worker):
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, worker.kill)
+        delay = RESPAWN_DELAY
+        while True:
+            replacement = None
+            try:
+                replacement = Worker(self.context)
+                await loop.run_in_executor(None, replacement.wait_ready)
+                break
+            except (EOFError, OSError, WorkerCrashedError) as e:
+                self.respawn_failures += 1
+                self.respawn_error = str(e) or type(e).__name__
+                if replacement is not None:
+                    await loop.run_in_executor(None, replacement.kill)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, RESPAWN_DELAY_LIMIT)
+        self.respawn_error = None
+        self.workers.add(replacement)
+        if self.started:
+            self.idle.put_nowait(replacement)
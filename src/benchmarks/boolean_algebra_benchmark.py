@@ -0,0 +1,38 @@
+import sys
+import time
+
+from src.math_algos.boolean_algebra import TruthTableGenerator, ZhegalkinPolynomial
+
+
+def generate_expression(variable_count):
+    names = [f"x{index:02d}" for index in range(variable_count)]
+    pairs = zip(names[::2], names[1::2])
+    return " ∨ ".join(f"({first} ∧ ¬{second})" for first, second in pairs)
+
+
+def measure(build, expression):
+    start = time.perf_counter()
+    build(expression)
+    return time.perf_counter() - start
+
+
+def main(sizes=(10, 14, 18, 20, 22)):
+    print(
+        f"{'variables':>10} {'rows':>10} {'table, ms':>10} {'rows/s':>12} "
+        f"{'zhegalkin, ms':>14}"
+    )
+    for variable_count in sizes:
+        expression = generate_expression(variable_count)
+        table = measure(
+            lambda text: TruthTableGenerator(text).generate_truth_table(), expression
+        )
+        zhegalkin = measure(ZhegalkinPolynomial, expression)
+        rows = 1 << variable_count
+        print(
+            f"{variable_count:>10} {rows:>10} {table * 1000:>10.1f} "
+            f"{rows / table:>12.0f} {zhegalkin * 1000:>14.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main(*[tuple(map(int, sys.argv[1].split(",")))] if len(sys.argv) > 1 else [])
@@ -0,0 +1,59 @@
+import glob
+import os
+import sys
+import time
+import zlib
+
+from src.math_algos.context_coding import ContextDecoder, ContextEncoder
+from src.math_algos.range_coding import RangeCoder
+
+CHUNK = 1 << 14
+
+
+def load_corpus(limit):
+    root = os.path.join(os.path.dirname(__file__), "..")
+    text = []
+    for path in sorted(glob.glob(os.path.join(root, "**", "*.py"), recursive=True)):
+        with open(path, encoding="utf-8") as source:
+            text.append(source.read())
+    corpus = "".join(text)
+    return (corpus * (limit // max(len(corpus), 1) + 1))[:limit]
+
+
+def stream_encode(text, order):
+    encoder = ContextEncoder(order)
+    chunks = [encoder.write(text[i : i + CHUNK]) for i in range(0, len(text), CHUNK)]
+    return b"".join(chunks) + encoder.finish()
+
+
+def stream_decode(data, order):
+    decoder = ContextDecoder(order)
+    parts = [decoder.feed(data[i : i + CHUNK]) for i in range(0, len(data), CHUNK)]
+    return "".join(parts) + decoder.finish()
+
+
+def main(orders=(0, 1, 2, 3, 4), size=1 << 20):
+    text = load_corpus(size)
+    raw = len(text.encode("utf-8"))
+    print(f"corpus: {len(text)} characters, {raw} bytes")
+    print(f"zlib -9: {len(zlib.compress(text.encode('utf-8'), 9))} bytes")
+    print(f"static range coder: {len(RangeCoder.from_string(text).encode(text))} bytes")
+    print(
+        f"{'order':>6} {'bytes':>9} {'bits/char':>10} {'enc KB/s':>9} {'dec KB/s':>9}"
+    )
+    for order in orders:
+        start = time.perf_counter()
+        data = stream_encode(text, order)
+        encoded = time.perf_counter()
+        if stream_decode(data, order) != text:
+            raise AssertionError(f"order {order} did not round-trip")
+        decoded = time.perf_counter()
+        print(
+            f"{order:>6} {len(data):>9} {8 * len(data) / len(text):>10.3f} "
+            f"{raw / (encoded - start) / 1024:>9.0f} "
+            f"{raw / (decoded - encoded) / 1024:>9.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main(*[tuple(map(int, sys.argv[1].split(",")))] if len(sys.argv) > 1 else [])
@@ -0,0 +1,47 @@
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from src.math_algos.binary_relations import BinaryRelationGraph
+from src.math_algos.caching import DiskCache
+from src.math_algos.graph_layout import force_layout, layout_cache
+
+
+def random_pairs(size, count, seed=0):
+    rng = np.random.default_rng(seed)
+    return {(str(a), str(b)) for a, b in rng.integers(0, size, (count, 2))}
+
+
+def measure(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main(sizes=(200, 1000, 2000, 5000)):
+    print(
+        f"{'nodes':>8} {'edges':>8} {'force, ms':>10} {'render, ms':>11} "
+        f"{'restyle, ms':>12} {'disk, ms':>9}"
+    )
+    for size in sizes:
+        relation = random_pairs(size, 5 * size // 2)
+        layout_cache.clear()
+        layout_cache.disk = DiskCache(tempfile.mkdtemp())
+        render = measure(lambda: BinaryRelationGraph(None, relation).get_image())
+        restyle = measure(
+            lambda: BinaryRelationGraph(None, relation).get_svg(node_color="orange")
+        )
+        layout_cache.clear()
+        disk = measure(lambda: BinaryRelationGraph(None, relation))
+        matrix = BinaryRelationGraph(None, relation).matrix
+        force = measure(lambda: force_layout(matrix))
+        print(
+            f"{size:>8} {len(relation):>8} {force * 1000:>10.1f} "
+            f"{render * 1000:>11.1f} {restyle * 1000:>12.1f} {disk * 1000:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main(*[tuple(map(int, sys.argv[1].split(",")))] if len(sys.argv) > 1 else [])
@@ -0,0 +1,76 @@
+import random
+import re
+import sys
+import time
+
+from sympy import symbols
+from sympy.parsing.sympy_parser import (
+    implicit_multiplication_application,
+    parse_expr,
+    standard_transformations,
+)
+
+from src.math_algos.expression_parser import parse_logic
+
+TRANSFORMATIONS = standard_transformations + (implicit_multiplication_application,)
+
+
+def legacy_parse(expr_str):
+    variables = set(re.findall(r"\b[a-zA-Z_][a-zA-Z0-9_]*\b", expr_str))
+    local_dict = {var: symbols(var) for var in variables}
+
+    expr_str = (
+        expr_str.replace("∧", "&").replace("∨", "|").replace("⊕", "^").replace("¬", "~")
+    )
+    expr_str = expr_str.replace("←", "<<").replace("→", ">>")
+    expr_str = expr_str.replace("≡", "==")
+    expr_str = re.sub(r"(\b\w+)\s*==\s*(\b\w+)", r"Equivalent(\1, \2)", expr_str)
+    expr_str = re.sub(r"(\b\w+)\s*↓\s*(\b\w+)", r"Not(Or(\1, \2))", expr_str)
+    expr_str = re.sub(r"(\b\w+)\s*↑\s*(\b\w+)", r"Not(And(\1, \2))", expr_str)
+
+    return parse_expr(expr_str, transformations=TRANSFORMATIONS, local_dict=local_dict)
+
+
+def generate_expression(terms, variable_count=16, seed=0):
+    generator = random.Random(seed)
+    names = [f"x{index}" for index in range(variable_count)]
+    products = []
+    for _ in range(terms):
+        literals = []
+        for name in generator.sample(names, 3):
+            literals.append(name if generator.random() < 0.5 else f"¬{name}")
+        products.append("(" + " ∧ ".join(literals) + ")")
+    return " ∨ ".join(products)
+
+
+def measure(parse, expression, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        parse(expression)
+    return (time.perf_counter() - start) / repeat
+
+
+def main(sizes=(100, 1000, 5000, 20000), legacy_limit=5000):
+    print(
+        f"{'terms':>8} {'chars':>9} {'parser, ms':>11} {'terms/s':>11} {'legacy, ms':>11}"
+    )
+    for terms in sizes:
+        expression = generate_expression(terms)
+        repeat = max(1, 20000 // terms)
+        elapsed = measure(parse_logic, expression, repeat)
+
+        legacy = "-"
+        if terms <= legacy_limit:
+            try:
+                legacy = f"{measure(legacy_parse, expression, 1) * 1000:.1f}"
+            except (RecursionError, MemoryError) as e:
+                legacy = type(e).__name__
+
+        print(
+            f"{terms:>8} {len(expression):>9} {elapsed * 1000:>11.1f} "
+            f"{terms / elapsed:>11.0f} {legacy:>11}"
+        )
+
+
+if __name__ == "__main__":
+    main(*[tuple(map(int, sys.argv[1].split(",")))] if len(sys.argv) > 1 else [])
@@ -0,0 +1,54 @@
+import random
+import sys
+import time
+
+from src.math_algos.bit_io import BitReader
+from src.math_algos.encoding_decoding_algos import (
+    HuffmanCoding,
+    ProbabilityCalculating,
+    ShennonFanoCoding,
+)
+from src.tests.random_text import random_string
+
+
+def measure(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main(sizes=(10**4, 10**5, 10**6), alphabet_sizes=(4, 26, 50)):
+    print(
+        f"{'chars':>9} {'alphabet':>9} {'coder':>13} {'bits/char':>10} "
+        f"{'enc KB/s':>9} {'dec KB/s':>9}"
+    )
+    for size in sizes:
+        for alphabet_size in alphabet_sizes:
+            string = random_string(random.Random(size), size, alphabet_size, 1)
+            raw = len(string.encode("utf-8"))
+            probabilities = ProbabilityCalculating(string)
+            huffman = HuffmanCoding(probabilities)
+            shannon_fano = ShennonFanoCoding(probabilities)
+            coders = (
+                (
+                    "huffman",
+                    huffman,
+                    lambda bits: huffman.decode_bits(bits, huffman.code_dict),
+                ),
+                ("shannon-fano", shannon_fano, shannon_fano.decode_bits),
+            )
+            for name, coder, decode in coders:
+                writer, encoded = measure(lambda: coder.encode_bits(string))
+                bits = BitReader(writer.getvalue(), writer.bit_length).bits()
+                decoded_string, decoded = measure(lambda: decode(bits))
+                if decoded_string != string:
+                    raise AssertionError(f"{name} did not round-trip")
+                print(
+                    f"{size:>9} {alphabet_size:>9} {name:>13} "
+                    f"{writer.bit_length / size:>10.3f} "
+                    f"{raw / encoded / 1024:>9.0f} {raw / decoded / 1024:>9.0f}"
+                )
+
+
+if __name__ == "__main__":
+    main(*[tuple(map(int, sys.argv[1].split(",")))] if len(sys.argv) > 1 else [])
@@ -0,0 +1,34 @@
+import random
+import sys
+import time
+
+from src.math_algos.range_coding import RangeCoder
+from src.tests.random_text import random_string
+
+
+def main(sizes=(10**4, 10**5, 10**6), alphabet_sizes=(4, 20, 50)):
+    print(
+        f"{'chars':>9} {'alphabet':>9} {'bytes':>9} {'bits/char':>10} "
+        f"{'enc KB/s':>9} {'dec KB/s':>9}"
+    )
+    for size in sizes:
+        for alphabet_size in alphabet_sizes:
+            string = random_string(random.Random(size), size, alphabet_size)
+            raw = len(string.encode("utf-8"))
+            coder = RangeCoder.from_string(string)
+            start = time.perf_counter()
+            data = coder.encode(string)
+            encoded = time.perf_counter()
+            if coder.decode(data, len(string)) != string:
+                raise AssertionError(f"{size} characters did not round-trip")
+            decoded = time.perf_counter()
+            print(
+                f"{size:>9} {alphabet_size:>9} {len(data):>9} "
+                f"{8 * len(data) / size:>10.3f} "
+                f"{raw / (encoded - start) / 1024:>9.0f} "
+                f"{raw / (decoded - encoded) / 1024:>9.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main(*[tuple(map(int, sys.argv[1].split(",")))] if len(sys.argv) > 1 else [])
@@ -0,0 +1,57 @@
+import sys
+import time
+
+import numpy as np
+
+from src.math_algos.binary_relations import (
+    BinaryRelationProperties,
+    BinaryRelationStructure,
+    RelationMatrix,
+)
+
+
+def upper_triangle(size):
+    return {(str(a), str(b)) for a in range(size) for b in range(a, size)}
+
+
+def measure(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def random_matrix(size, count, seed=0):
+    rng = np.random.default_rng(seed)
+    return RelationMatrix(
+        range(size), rng.integers(0, size, count), rng.integers(0, size, count)
+    )
+
+
+def measure_composition(sizes):
+    print(f"{'elements':>10} {'pairs':>10} {'bytes/pair':>11} {'compose, ms':>12}")
+    for size in sizes:
+        matrix = random_matrix(size, 5 * size)
+        composed = measure(lambda: matrix.compose(matrix))
+        print(
+            f"{size:>10} {len(matrix):>10} {matrix.nbytes / len(matrix):>11.1f} "
+            f"{composed * 1000:>12.1f}"
+        )
+
+
+def main(sizes=(100, 300, 600, 1000), matrix_sizes=(10**4, 10**5, 10**6)):
+    print(f"{'elements':>10} {'pairs':>10} {'properties, ms':>15} {'hasse, ms':>10}")
+    for size in sizes:
+        relation = upper_triangle(size)
+        properties = measure(
+            lambda: BinaryRelationProperties(None, relation).get_properties_as_list()
+        )
+        hasse = measure(lambda: BinaryRelationStructure(None, relation).hasse_diagram())
+        print(
+            f"{size:>10} {len(relation):>10} {properties * 1000:>15.1f} "
+            f"{hasse * 1000:>10.1f}"
+        )
+    measure_composition(matrix_sizes)
+
+
+if __name__ == "__main__":
+    main(*[tuple(map(int, sys.argv[1].split(",")))] if len(sys.argv) > 1 else [])
@@ -0,0 +1,57 @@
+import sys
+import time
+
+import numpy as np
+
+from src.math_algos.set_evaluation import SetEvaluator
+from src.math_algos.set_theory import SetRelations
+
+EXPRESSION = "(A ∪ B) \\ C"
+
+
+def generate_sets(size, seed=0):
+    rng = np.random.default_rng(seed)
+    return {
+        name: rng.choice(10 * size, size=size, replace=False).tolist() for name in "ABC"
+    }
+
+
+def chained_intersections(set_count, reverse=False):
+    pairs = [(f"S{i}", f"S{i + 1}") for i in range(set_count - 1)]
+    if reverse:
+        pairs = [(second, first) for first, second in reversed(pairs)]
+    return " ∪ ".join(f"{first} ∩ {second}" for first, second in pairs)
+
+
+def measure_relations(set_counts):
+    print(f"{'sets':>10} {'regions':>10} {'relations, ms':>14}")
+    for set_count in set_counts:
+        first = chained_intersections(set_count)
+        second = chained_intersections(set_count, reverse=True)
+        start = time.perf_counter()
+        relations = SetRelations(first, second)
+        relations.equivalence()
+        relations.inclusion()
+        elapsed = time.perf_counter() - start
+        print(f"{set_count:>10} {1 << set_count:>10} {elapsed * 1000:>14.1f}")
+
+
+def main(sizes=(10**4, 10**5, 3 * 10**5, 10**6), set_counts=(8, 12, 16, 20)):
+    print(f"{'elements':>10} {'intern, ms':>11} {'evaluate, ms':>13} {'result':>9}")
+    for size in sizes:
+        sets = generate_sets(size)
+        start = time.perf_counter()
+        evaluator = SetEvaluator(sets)
+        interned = time.perf_counter()
+        result = evaluator.evaluate(EXPRESSION)
+        evaluated = time.perf_counter()
+        print(
+            f"{size:>10} {(interned - start) * 1000:>11.1f} "
+            f"{(evaluated - interned) * 1000:>13.2f} "
+            f"{evaluator.cardinality(result):>9}"
+        )
+    measure_relations(set_counts)
+
+
+if __name__ == "__main__":
+    main(*[tuple(map(int, sys.argv[1].split(",")))] if len(sys.argv) > 1 else [])
@@ -0,0 +1,68 @@
+import asyncio
+import math
+import sys
+import time
+
+from src.api.workers import JobTimeoutError, WorkerPool
+
+
+async def measure_round_trips(pool, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        await pool.run(math.factorial, 10, timeout=30)
+    return (time.perf_counter() - start) / repeat
+
+
+async def measure_payload(pool, size):
+    start = time.perf_counter()
+    await pool.run(bytes, size, timeout=60)
+    return time.perf_counter() - start
+
+
+async def measure_loop_lag(pool, duration):
+    job = asyncio.ensure_future(pool.run(time.sleep, duration, timeout=30))
+    lag = 0.0
+    while not job.done():
+        start = time.perf_counter()
+        await asyncio.sleep(0.01)
+        lag = max(lag, time.perf_counter() - start - 0.01)
+    await job
+    return lag
+
+
+async def measure_timeout_recovery(pool, timeout):
+    start = time.perf_counter()
+    try:
+        await pool.run(time.sleep, 30, timeout=timeout)
+    except JobTimeoutError:
+        pass
+    await pool.run(math.factorial, 5, timeout=30)
+    return time.perf_counter() - start - timeout
+
+
+async def run(sizes):
+    pool = WorkerPool(size=1, max_queue=1)
+    start = time.perf_counter()
+    await pool.start()
+    print(f"pool start: {(time.perf_counter() - start) * 1000:.0f} ms")
+    try:
+        latency = await measure_round_trips(pool, 200)
+        print(f"round trip: {latency * 1000:.2f} ms")
+        print(f"{'payload, MB':>12} {'ms':>9} {'MB/s':>9}")
+        for size in sizes:
+            elapsed = await measure_payload(pool, size << 20)
+            print(f"{size:>12} {elapsed * 1000:>9.1f} {size / elapsed:>9.0f}")
+        lag = await measure_loop_lag(pool, 1)
+        print(f"event loop lag during a job: {lag * 1000:.1f} ms")
+        recovery = await measure_timeout_recovery(pool, 0.5)
+        print(f"recovery after a timeout: {recovery * 1000:.0f} ms")
+    finally:
+        await pool.stop()
+
+
+def main(sizes=(1, 16, 128)):
+    asyncio.run(run(sizes))
+
+
+if __name__ == "__main__":
+    main(*[tuple(map(int, sys.argv[1].split(",")))] if len(sys.argv) > 1 else [])
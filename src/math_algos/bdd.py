@@ -0,0 +1,206 @@
+from collections import Counter
+
+from .expression_parser import (
+    AND,
+    CONVERSE,
+    DIFFERENCE,
+    EQUIVALENT,
+    IMPLIES,
+    NAND,
+    NOR,
+    OR,
+    XOR,
+    Constant,
+    Negation,
+    Variable,
+    iter_variables,
+    variables_in_order,
+)
+
+FALSE = 0
+TRUE = 1
+
+OPERATIONS = {
+    AND: lambda a, b: a and b,
+    OR: lambda a, b: a or b,
+    XOR: lambda a, b: a != b,
+    IMPLIES: lambda a, b: not a or b,
+    CONVERSE: lambda a, b: a or not b,
+    EQUIVALENT: lambda a, b: a == b,
+    NAND: lambda a, b: not (a and b),
+    NOR: lambda a, b: not (a or b),
+    DIFFERENCE: lambda a, b: a and not b,
+}
+
+ORDERINGS = ("appearance", "alphabetical", "frequency")
+
+
+def order_variables(trees, heuristic="appearance"):
+    if heuristic not in ORDERINGS:
+        raise ValueError(
+            f"Unknown ordering '{heuristic}', expected one of: {', '.join(ORDERINGS)}"
+        )
+
+    appearance = list(
+        dict.fromkeys(name for tree in trees for name in variables_in_order(tree))
+    )
+    if heuristic == "alphabetical":
+        return sorted(appearance)
+    if heuristic == "frequency":
+        counts = Counter(name for tree in trees for name in iter_variables(tree))
+        return sorted(appearance, key=lambda name: -counts[name])
+    return appearance
+
+
+class BDD:
+    def __init__(self, variables):
+        self.variables = list(variables)
+        self.levels = {name: level for level, name in enumerate(self.variables)}
+        terminal_level = len(self.variables)
+        self.nodes = [(terminal_level, None, None), (terminal_level, None, None)]
+        self.unique = {}
+        self.computed = {}
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def level(self, node):
+        return self.nodes[node][0]
+
+    def make(self, level, low, high):
+        if low == high:
+            return low
+        key = (level, low, high)
+        node = self.unique.get(key)
+        if node is None:
+            node = len(self.nodes)
+            self.nodes.append(key)
+            self.unique[key] = node
+        return node
+
+    def var(self, name):
+        return self.make(self.levels[name], FALSE, TRUE)
+
+    def negate(self, node):
+        return self.apply(XOR, node, TRUE)
+
+    def apply(self, operator, left, right):
+        key = (operator, left, right)
+        result = self.computed.get(key)
+        if result is not None:
+            return result
+
+        if left <= TRUE and right <= TRUE:
+            result = TRUE if OPERATIONS[operator](left, right) else FALSE
+        elif operator == AND and FALSE in (left, right):
+            result = FALSE
+        elif operator == OR and TRUE in (left, right):
+            result = TRUE
+        elif operator in (AND, OR) and left == right:
+            result = left
+        elif (operator, left) in ((AND, TRUE), (OR, FALSE), (XOR, FALSE)):
+            result = right
+        elif (operator, right) in ((AND, TRUE), (OR, FALSE), (XOR, FALSE)):
+            result = left
+        elif operator == XOR and left == right:
+            result = FALSE
+        else:
+            left_level, left_low, left_high = self.nodes[left]
+            right_level, right_low, right_high = self.nodes[right]
+            level = min(left_level, right_level)
+            if left_level != level:
+                left_low = left_high = left
+            if right_level != level:
+                right_low = right_high = right
+            result = self.make(
+                level,
+                self.apply(operator, left_low, right_low),
+                self.apply(operator, left_high, right_high),
+            )
+
+        self.computed[key] = result
+        return result
+
+    def build(self, tree):
+        if isinstance(tree, Variable):
+            return self.var(tree.name)
+        if isinstance(tree, Constant):
+            return TRUE if tree.value else FALSE
+        if isinstance(tree, Negation):
+            return self.negate(self.build(tree.operand))
+
+        operands = [self.build(operand) for operand in tree.operands]
+        result = operands[0]
+        for operand in operands[1:]:
+            result = self.apply(tree.operator, result, operand)
+        return result
+
+    def restrict(self, node, assignment):
+        levels = {self.levels[name]: bool(value) for name, value in assignment.items()}
+        memo = {}
+
+        def visit(node):
+            if node <= TRUE:
+                return node
+            if node not in memo:
+                level, low, high = self.nodes[node]
+                if level in levels:
+                    memo[node] = visit(high if levels[level] else low)
+                else:
+                    memo[node] = self.make(level, visit(low), visit(high))
+            return memo[node]
+
+        return visit(node)
+
+    def count(self, node):
+        memo = {FALSE: 0, TRUE: 1}
+
+        def visit(node):
+            if node not in memo:
+                level, low, high = self.nodes[node]
+                low_count = visit(low) << (self.level(low) - level - 1)
+                high_count = visit(high) << (self.level(high) - level - 1)
+                memo[node] = low_count + high_count
+            return memo[node]
+
+        return visit(node) << self.level(node)
+
+    def equivalent(self, left, right):
+        return left == right
+
+    def satisfy_one(self, node):
+        if node == FALSE:
+            return None
+        assignment = {}
+        while node > TRUE:
+            level, low, high = self.nodes[node]
+            if low != FALSE:
+                assignment[self.variables[level]] = False
+                node = low
+            else:
+                assignment[self.variables[level]] = True
+                node = high
+        return assignment
+
+    def iter_cubes(self, node):
+        stack = [(node, {})]
+        while stack:
+            node, assignment = stack.pop()
+            if node == FALSE:
+                continue
+            if node == TRUE:
+                yield assignment
+                continue
+            level, low, high = self.nodes[node]
+            name = self.variables[level]
+            stack.append((high, {**assignment, name: True}))
+            stack.append((low, {**assignment, name: False}))
+
+    def iter_minterms(self, node):
+        for cube in self.iter_cubes(node):
+            free = [name for name in self.variables if name not in cube]
+            for bits in range(1 << len(free)):
+                assignment = dict(cube)
+                for index, name in enumerate(free):
+                    assignment[name] = bool(bits >> (len(free) - 1 - index) & 1)
+                yield tuple(assignment[name] for name in self.variables)
@@ -1,9 +1,24 @@
 from abc import ABC
+from html import escape
 from io import BytesIO
 from typing import Optional, Union
 
 import matplotlib.pyplot as plt
 import networkx as nx
+import numpy as np
+from PIL import Image, ImageDraw
+
+from .graph_layout import layout_cache
+
+DENSE_ELEMENT_LIMIT = 1 << 14
+PAIR_CHUNK = 1 << 14
+UNPACK_LIMIT = 1 << 24
+GRAPH_FORMATS = ("png", "svg")
+DRAW_NODE_LIMIT = 40
+DRAW_EDGE_LIMIT = 200
+LABEL_LIMIT = 200
+EDGE_COLOR = (90, 90, 90)
+EMPTY = frozenset()
 
 
 class BinaryRelation(ABC):
@@ -24,12 +39,335 @@ class BinaryRelation(ABC):
         self.binary_relation = binary_relation
 
 
+def sorted_unique(keys):
+    if len(keys) > 1 and not np.all(keys[1:] > keys[:-1]):
+        keys = np.sort(keys)
+        distinct = np.empty(len(keys), dtype=bool)
+        distinct[0] = True
+        np.not_equal(keys[1:], keys[:-1], out=distinct[1:])
+        keys = keys[distinct]
+    return keys
+
+
+def unpack_rows(rows, size):
+    octets = np.ascontiguousarray(rows, dtype="<u8").view(np.uint8)
+    return np.unpackbits(octets, axis=1, bitorder="little")[:, :size].astype(bool)
+
+
+def natural_key(element):
+    text = str(element)
+    if text.lstrip("-").isdigit():
+        return 0, int(text), text
+    return 1, 0, text
+
+
+class RelationMatrix:
+    def __init__(self, elements, sources, targets):
+        self.elements = list(elements)
+        self.index = {
+            element: position for position, element in enumerate(self.elements)
+        }
+        self.size = len(self.elements)
+        keys = np.asarray(sources, dtype=np.int64) * self.size + np.asarray(
+            targets, dtype=np.int64
+        )
+        sources, targets = np.divmod(sorted_unique(keys), max(self.size, 1))
+        self.targets = targets.astype(np.int32)
+        self.offsets = np.searchsorted(sources, np.arange(self.size + 1))
+        self.rows = None
+
+    @classmethod
+    def from_pairs(cls, elements, pairs):
+        elements = set(elements)
+        elements.update(element for pair in pairs for element in pair)
+        elements = sorted(elements, key=natural_key)
+        index = {element: position for position, element in enumerate(elements)}
+        sources = np.fromiter((index[a] for a, _ in pairs), np.int32, len(pairs))
+        targets = np.fromiter((index[b] for _, b in pairs), np.int32, len(pairs))
+        return cls(elements, sources, targets)
+
+    @classmethod
+    def from_rows(cls, elements, rows):
+        size = len(elements)
+        step = max(1, UNPACK_LIMIT // max(size, 1))
+        sources, targets = [], []
+        for start in range(0, size, step):
+            block_sources, block_targets = np.nonzero(
+                unpack_rows(rows[start : start + step], size)
+            )
+            sources.append(block_sources.astype(np.int32) + start)
+            targets.append(block_targets.astype(np.int32))
+        if not sources:
+            return cls(elements, [], [])
+        return cls(elements, np.concatenate(sources), np.concatenate(targets))
+
+    @classmethod
+    def identity(cls, elements):
+        loops = np.arange(len(elements), dtype=np.int32)
+        return cls(elements, loops, loops)
+
+    def pairs(self):
+        return [
+            (self.elements[a], self.elements[b])
+            for a, b in zip(self.sources.tolist(), self.targets.tolist())
+        ]
+
+    def __len__(self):
+        return len(self.targets)
+
+    @property
+    def sources(self):
+        return np.repeat(np.arange(self.size, dtype=np.int32), np.diff(self.offsets))
+
+    @property
+    def nbytes(self):
+        return self.offsets.nbytes + self.targets.nbytes
+
+    @property
+    def dense(self):
+        return self.size <= DENSE_ELEMENT_LIMIT
+
+    def bitset_rows(self):
+        if self.rows is None:
+            words = (self.size + 63) // 64
+            self.rows = np.zeros((self.size, words), dtype=np.uint64)
+            for sources, targets in self.pair_chunks():
+                np.bitwise_or.at(
+                    self.rows,
+                    (sources, targets >> 6),
+                    np.left_shift(np.uint64(1), (targets & 63).astype(np.uint64)),
+                )
+        return self.rows
+
+    def contains(self, sources, targets):
+        sources = np.asarray(sources, dtype=np.int64)
+        targets = np.asarray(targets, dtype=np.int32)
+        if not len(self.targets):
+            return np.zeros(len(sources), dtype=bool)
+
+        last = len(self.targets) - 1
+        low, high = self.offsets[sources], self.offsets[sources + 1]
+        end = high
+        while True:
+            active = low < high
+            if not active.any():
+                break
+            middle = (low + high) >> 1
+            below = active & (self.targets[np.minimum(middle, last)] < targets)
+            low = np.where(below, middle + 1, low)
+            high = np.where(active & ~below, middle, high)
+        return (low < end) & (self.targets[np.minimum(low, last)] == targets)
+
+    def has_loops(self, indices):
+        return self.contains(indices, indices)
+
+    def indices(self, elements):
+        return np.fromiter(
+            (self.index[element] for element in elements), dtype=np.int64
+        )
+
+    def pair_chunks(self):
+        for start in range(0, len(self.targets), PAIR_CHUNK):
+            stop = min(start + PAIR_CHUNK, len(self.targets))
+            sources = np.searchsorted(
+                self.offsets, np.arange(start, stop), side="right"
+            )
+            yield (sources - 1).astype(np.int32), self.targets[start:stop]
+
+    def compositions(self, sources, targets):
+        counts = self.offsets[targets + 1] - self.offsets[targets]
+        total = int(counts.sum())
+        starts = np.repeat(self.offsets[targets] - np.cumsum(counts) + counts, counts)
+        return np.repeat(sources, counts), self.targets[starts + np.arange(total)]
+
+    def is_transitive(self):
+        for sources, targets in self.pair_chunks():
+            if self.dense:
+                rows = self.bitset_rows()
+                if np.any(rows[targets] & ~rows[sources]):
+                    return False
+            elif not np.all(self.contains(*self.compositions(sources, targets))):
+                return False
+        return True
+
+    def is_antitransitive(self):
+        for sources, targets in self.pair_chunks():
+            if self.dense:
+                rows = self.bitset_rows()
+                common = rows[targets] & rows[sources]
+                common[np.arange(len(sources)), sources >> 6] &= ~np.left_shift(
+                    np.uint64(1), (sources & 63).astype(np.uint64)
+                )
+                if np.any(common):
+                    return False
+            else:
+                starts, ends = self.compositions(sources, targets)
+                distinct = starts != ends
+                if np.any(self.contains(starts[distinct], ends[distinct])):
+                    return False
+        return True
+
+    def require_dense(self):
+        if not self.dense:
+            raise ValueError(
+                f"Relations over more than {DENSE_ELEMENT_LIMIT} elements "
+                "are not supported here"
+            )
+
+    def require_same_domain(self, other):
+        if self.elements != other.elements:
+            raise ValueError("Relations must be defined over the same set")
+
+    def union(self, other):
+        self.require_same_domain(other)
+        return RelationMatrix(
+            self.elements,
+            np.concatenate((self.sources, other.sources)),
+            np.concatenate((self.targets, other.targets)),
+        )
+
+    def reflexive_closure(self):
+        return self.union(RelationMatrix.identity(self.elements))
+
+    def symmetric_closure(self):
+        return self.union(self.inverse())
+
+    def inverse(self):
+        order = np.argsort(self.targets, kind="stable")
+        return RelationMatrix(self.elements, self.targets[order], self.sources[order])
+
+    def compose(self, other):
+        self.require_same_domain(other)
+        products = int(np.diff(other.offsets)[self.targets].sum())
+        if self.dense and products > self.size * self.size // 64:
+            return RelationMatrix.from_rows(
+                self.elements, self.compose_rows(other.bitset_rows())
+            )
+
+        keys = [np.empty(0, dtype=np.int64)]
+        for sources, targets in self.pair_chunks():
+            starts, ends = other.compositions(sources, targets)
+            keys.append(sorted_unique(starts.astype(np.int64) * self.size + ends))
+        sources, targets = np.divmod(np.concatenate(keys), max(self.size, 1))
+        return RelationMatrix(self.elements, sources, targets)
+
+    def power(self, exponent):
+        if exponent < 0:
+            raise ValueError("The exponent must be non-negative")
+        result, base = RelationMatrix.identity(self.elements), self
+        while exponent:
+            if exponent & 1:
+                result = result.compose(base)
+            exponent >>= 1
+            if exponent:
+                base = base.compose(base)
+        return result
+
+    def transitive_closure(self):
+        if not self.dense:
+            closure = self
+            while True:
+                extended = closure.union(closure.compose(closure))
+                if len(extended) == len(closure):
+                    return closure
+                closure = extended
+
+        rows = self.bitset_rows().copy()
+        for pivot in range(self.size):
+            bit = np.uint64(1) << np.uint64(pivot & 63)
+            reaching = (rows[:, pivot >> 6] & bit) != 0
+            if reaching.any():
+                rows[reaching] |= rows[pivot]
+        return RelationMatrix.from_rows(self.elements, rows)
+
+    def without_loops(self):
+        sources = self.sources
+        distinct = sources != self.targets
+        return RelationMatrix(self.elements, sources[distinct], self.targets[distinct])
+
+    def compose_rows(self, rows):
+        composed = np.zeros((self.size, rows.shape[1]), dtype=np.uint64)
+        for sources, targets in self.pair_chunks():
+            starts = np.flatnonzero(np.r_[True, sources[1:] != sources[:-1]])
+            composed[sources[starts]] |= np.bitwise_or.reduceat(
+                rows[targets], starts, axis=0
+            )
+        return composed
+
+    def components(self):
+        parents = list(range(self.size))
+
+        def find(node):
+            while parents[node] != node:
+                parents[node] = parents[parents[node]]
+                node = parents[node]
+            return node
+
+        for a, b in zip(self.sources.tolist(), self.targets.tolist()):
+            root_a, root_b = find(a), find(b)
+            if root_a != root_b:
+                parents[max(root_a, root_b)] = min(root_a, root_b)
+
+        classes = {}
+        for node in range(self.size):
+            classes.setdefault(find(node), []).append(node)
+        return list(classes.values())
+
+    def out_degrees(self):
+        return np.diff(self.offsets)
+
+    def in_degrees(self):
+        return np.bincount(self.targets, minlength=self.size)
+
+
+class RelationAlgebra(BinaryRelation):
+    def __init__(
+        self,
+        set_of_elements: Optional[set[str]],
+        binary_relation: set[tuple[str, str]],
+    ):
+        super().__init__(set_of_elements, binary_relation)
+        self.matrix = RelationMatrix.from_pairs(
+            self.set_of_elements, list(self.binary_relation)
+        )
+
+    def compose(self, other_relation: set[tuple[str, str]]):
+        other = RelationMatrix.from_pairs(self.matrix.elements, list(other_relation))
+        return self.matrix.compose(other).pairs()
+
+    def inverse(self):
+        return self.matrix.inverse().pairs()
+
+    def power(self, exponent: int):
+        return self.matrix.power(exponent).pairs()
+
+    def transitive_closure(self):
+        return self.matrix.transitive_closure().pairs()
+
+
 class BinaryRelationProperties(BinaryRelation):
-    def check_reflexive_property(self):
-        is_reflexive = all((e, e) in self.binary_relation for e in self.set_of_elements)
-        is_antireflexive = all(
-            (e, e) not in self.binary_relation for e in self.set_of_elements
+    def __init__(
+        self,
+        set_of_elements: Optional[set[str]],
+        binary_relation: set[tuple[str, str]],
+    ):
+        super().__init__(set_of_elements, binary_relation)
+        self.matrix = RelationMatrix.from_pairs(
+            self.set_of_elements, list(self.binary_relation)
         )
+
+    @classmethod
+    def from_matrix(cls, matrix: RelationMatrix):
+        relation = cls.__new__(cls)
+        relation.set_of_elements = matrix.elements
+        relation.binary_relation = None
+        relation.matrix = matrix
+        return relation
+
+    def check_reflexive_property(self):
+        loops = self.matrix.has_loops(self.matrix.indices(self.set_of_elements))
+        is_reflexive = bool(np.all(loops))
+        is_antireflexive = not np.any(loops)
         is_nonreflexive = not is_reflexive and not is_antireflexive
 
         return {
@@ -39,16 +377,11 @@ class BinaryRelationProperties(BinaryRelation):
         }
 
     def check_symmetry_properties(self):
-        is_symmetric = all(
-            (b, a) in self.binary_relation for a, b in self.binary_relation
-        )
-        is_asymmetric = all(
-            (b, a) not in self.binary_relation for a, b in self.binary_relation
-        )
-        is_antisymmetric = all(
-            (b, a) not in self.binary_relation or a == b
-            for a, b in self.binary_relation
-        )
+        sources, targets = self.matrix.sources, self.matrix.targets
+        reversed_pairs = self.matrix.contains(targets, sources)
+        is_symmetric = bool(np.all(reversed_pairs))
+        is_asymmetric = not np.any(reversed_pairs)
+        is_antisymmetric = not np.any(reversed_pairs & (sources != targets))
         is_nonsymmetric = not is_symmetric and not is_antisymmetric
 
         return {
@@ -59,19 +392,8 @@ class BinaryRelationProperties(BinaryRelation):
         }
 
     def check_transitivity_properties(self):
-        is_transitive = True
-        for a, b in self.binary_relation:
-            for c, d in self.binary_relation:
-                if b == c and (a, d) not in self.binary_relation:
-                    is_transitive = False
-                    break
-
-        is_antitransitive = all(
-            (a, d) not in self.binary_relation
-            for a, b in self.binary_relation
-            for c, d in self.binary_relation
-            if b == c and a != d
-        )
+        is_transitive = self.matrix.is_transitive()
+        is_antitransitive = self.matrix.is_antitransitive()
 
         is_nontransitive = not is_transitive and not is_antitransitive
 
@@ -102,27 +424,304 @@ class BinaryRelationProperties(BinaryRelation):
         return properties_list
 
 
+class RelationSession(BinaryRelationProperties):
+    def __init__(
+        self,
+        set_of_elements: Optional[set[str]],
+        binary_relation: set[tuple[str, str]],
+    ):
+        BinaryRelation.__init__(self, set(set_of_elements or ()), set())
+        self.fixed_elements = bool(set_of_elements)
+        self.successors = {}
+        self.predecessors = {}
+        self.loops = 0
+        self.mutual_pairs = 0
+        self.transitivity_violations = 0
+        self.antitransitivity_witnesses = 0
+        self.apply(binary_relation, ())
+
+    def apply(self, insertions, deletions):
+        if self.fixed_elements:
+            for pair in insertions:
+                for element in pair:
+                    if element not in self.set_of_elements:
+                        raise ValueError(f"Element {element!r} is not in the set")
+
+        changed = sum(self.delete(a, b) for a, b in deletions)
+        return changed + sum(self.insert(a, b) for a, b in insertions)
+
+    def insert(self, a, b):
+        if (a, b) in self.binary_relation:
+            return False
+        self.binary_relation.add((a, b))
+        self.successors.setdefault(a, set()).add(b)
+        self.predecessors.setdefault(b, set()).add(a)
+        if not self.fixed_elements:
+            self.set_of_elements.update((a, b))
+        self.count(a, b, 1)
+        return True
+
+    def delete(self, a, b):
+        if (a, b) not in self.binary_relation:
+            return False
+        self.count(a, b, -1)
+        self.binary_relation.discard((a, b))
+        self.successors[a].discard(b)
+        self.predecessors[b].discard(a)
+        for element in (a, b):
+            if not self.successors.get(element):
+                self.successors.pop(element, None)
+            if not self.predecessors.get(element):
+                self.predecessors.pop(element, None)
+            if not self.fixed_elements and not (
+                element in self.successors or element in self.predecessors
+            ):
+                self.set_of_elements.discard(element)
+        return True
+
+    def count(self, a, b, sign):
+        if a == b:
+            self.loops += sign
+            self.mutual_pairs += sign
+        elif (b, a) in self.binary_relation:
+            self.mutual_pairs += 2 * sign
+
+        out_a = self.successors.get(a, EMPTY)
+        out_b = self.successors.get(b, EMPTY)
+        in_a = self.predecessors.get(a, EMPTY)
+        in_b = self.predecessors.get(b, EMPTY)
+
+        missing = closed = 0
+        for z in out_b:
+            if z not in out_a:
+                missing += 1
+            elif z != a:
+                closed += 1
+        for x in in_a:
+            if x not in in_b:
+                missing += 1
+            elif x != b:
+                closed += 1
+
+        smaller, larger = (out_a, in_b) if len(out_a) <= len(in_b) else (in_b, out_a)
+        middle = sum(1 for y in smaller if y in larger and y != a and y != b)
+        self.transitivity_violations += sign * (missing - middle)
+        if a != b:
+            closed += middle
+        self.antitransitivity_witnesses += sign * closed
+
+    def counters(self):
+        return {
+            "elements": len(self.set_of_elements),
+            "pairs": len(self.binary_relation),
+            "loops": self.loops,
+            "asymmetric_pairs": len(self.binary_relation) - self.mutual_pairs,
+            "antisymmetry_violations": self.mutual_pairs - self.loops,
+            "transitivity_violations": self.transitivity_violations,
+            "antitransitivity_witnesses": self.antitransitivity_witnesses,
+        }
+
+    def check_reflexive_property(self):
+        is_reflexive = self.loops == len(self.set_of_elements)
+        is_antireflexive = self.loops == 0
+        return {
+            "Рефлексивно": is_reflexive,
+            "Антирефлексивно": is_antireflexive,
+            "Нерефлексивно": not is_reflexive and not is_antireflexive,
+        }
+
+    def check_symmetry_properties(self):
+        is_symmetric = self.mutual_pairs == len(self.binary_relation)
+        is_asymmetric = self.mutual_pairs == 0
+        is_antisymmetric = self.mutual_pairs == self.loops
+        return {
+            "Симметрично": is_symmetric,
+            "Асимметрично": is_asymmetric,
+            "Антисимметрично": is_antisymmetric,
+            "Несимметрично": not is_symmetric and not is_antisymmetric,
+        }
+
+    def check_transitivity_properties(self):
+        is_transitive = self.transitivity_violations == 0
+        is_antitransitive = self.antitransitivity_witnesses == 0
+        return {
+            "Транзитивно": is_transitive,
+            "Антитранзитивно": is_antitransitive,
+            "Нетранзитивно": not is_transitive and not is_antitransitive,
+        }
+
+
+class BinaryRelationStructure(BinaryRelationProperties):
+    def reflexive_closure(self):
+        return self.matrix.reflexive_closure().pairs()
+
+    def symmetric_closure(self):
+        return self.matrix.symmetric_closure().pairs()
+
+    def transitive_closure(self):
+        return self.matrix.transitive_closure().pairs()
+
+    def closures(self):
+        return {
+            "reflexive": self.reflexive_closure(),
+            "symmetric": self.symmetric_closure(),
+            "transitive": self.transitive_closure(),
+        }
+
+    def is_equivalence(self):
+        return (
+            self.check_reflexive_property()["Рефлексивно"]
+            and self.check_symmetry_properties()["Симметрично"]
+            and self.matrix.is_transitive()
+        )
+
+    def equivalence_classes(self):
+        elements = self.matrix.elements
+        return {
+            "is_equivalence": self.is_equivalence(),
+            "classes": [
+                [elements[node] for node in component]
+                for component in self.matrix.components()
+            ],
+        }
+
+    def is_partial_order(self):
+        return (
+            self.check_reflexive_property()["Рефлексивно"]
+            and self.check_symmetry_properties()["Антисимметрично"]
+            and self.matrix.is_transitive()
+        )
+
+    def hasse_diagram(self):
+        if not self.is_partial_order():
+            raise ValueError("The relation is not a partial order")
+
+        self.matrix.require_dense()
+        strict = self.matrix.without_loops()
+        rows = strict.bitset_rows()
+        covers = RelationMatrix.from_rows(
+            strict.elements, rows & ~strict.compose_rows(rows)
+        )
+
+        elements = self.matrix.elements
+        below, above = strict.in_degrees(), strict.out_degrees()
+        minimal = np.flatnonzero(below == 0).tolist()
+        maximal = np.flatnonzero(above == 0).tolist()
+        return {
+            "covers": covers.pairs(),
+            "minimal": [elements[node] for node in minimal],
+            "maximal": [elements[node] for node in maximal],
+            "least": elements[minimal[0]] if len(minimal) == 1 else None,
+            "greatest": elements[maximal[0]] if len(maximal) == 1 else None,
+            "topological_order": [
+                elements[node] for node in np.argsort(below, kind="stable").tolist()
+            ],
+        }
+
+
 class BinaryRelationGraph(BinaryRelation):
     def __init__(
         self,
         set_of_elements: Optional[set[str]],
         binary_relation: set[tuple[str, str]],
+        layout: str = "auto",
     ):
         super().__init__(set_of_elements, binary_relation)
-        self.graph = nx.DiGraph()
+        self.matrix = RelationMatrix.from_pairs(
+            self.set_of_elements, list(self.binary_relation)
+        )
+        self.layout = layout
         self._create_graph()
 
     def _create_graph(self):
-        for element in self.set_of_elements:
-            self.graph.add_node(element)
+        self.position = layout_cache.lookup(self.matrix, self.layout)
 
-        self.graph.add_edges_from(self.binary_relation)
-        self.position = nx.spring_layout(self.graph, k=0.3, iterations=10)
+    @property
+    def small(self):
+        return (
+            self.matrix.size <= DRAW_NODE_LIMIT and len(self.matrix) <= DRAW_EDGE_LIMIT
+        )
+
+    def render(self, output_format="png", node_color="skyblue", font_size=20):
+        if output_format == "png":
+            return self.get_image(node_color, font_size)
+        if output_format == "svg":
+            return self.get_svg(node_color, font_size)
+        raise ValueError(
+            f"Unknown format '{output_format}', expected one of: "
+            f"{', '.join(GRAPH_FORMATS)}"
+        )
+
+    def canvas(self):
+        size = int(np.clip(30 * np.sqrt(self.matrix.size), 600, 2000))
+        radius = float(np.clip(size / 5 / np.sqrt(max(self.matrix.size, 1)), 4, 14))
+        if self.matrix.size > LABEL_LIMIT:
+            radius = 4
+        margin = radius * 3
+        points = (self.position + 1) / 2 * (size - 2 * margin) + margin
+        return size, radius, points
+
+    def edge_segments(self, points, radius):
+        sources, targets = self.matrix.sources, self.matrix.targets
+        loops = sources == targets
+        start, end = points[sources[~loops]], points[targets[~loops]]
+        direction = end - start
+        length = np.maximum(np.sqrt((direction**2).sum(axis=1)), 1e-9)[:, None]
+        direction /= length
+        loop_points = points[sources[loops]]
+        return (
+            start + direction * radius,
+            end - direction * radius,
+            direction,
+            loop_points,
+        )
 
     def get_image(self, node_color="skyblue", font_size=20):
+        if self.small:
+            return self.draw_small(node_color, font_size)
+
+        size, radius, points = self.canvas()
+        start, end, direction, loops = self.edge_segments(points, radius)
+        normal = direction[:, ::-1] * [-1, 1]
+        head = min(radius * 1.2, 8)
+        wings = (
+            end - direction * head + normal * head / 2,
+            end - direction * head - normal * head / 2,
+        )
+
+        image = Image.new("RGB", (size, size), "white")
+        draw = ImageDraw.Draw(image)
+        for line in np.hstack((start, end)).tolist():
+            draw.line(line, fill=EDGE_COLOR)
+        for tip, left, right in zip(end.tolist(), *(wing.tolist() for wing in wings)):
+            draw.polygon([tuple(tip), tuple(left), tuple(right)], fill=EDGE_COLOR)
+        for x, y in loops.tolist():
+            draw.ellipse(
+                [x - radius, y - 2.5 * radius, x + radius, y - 0.5 * radius],
+                outline=EDGE_COLOR,
+            )
+        for x, y in points.tolist():
+            draw.ellipse(
+                [x - radius, y - radius, x + radius, y + radius],
+                fill=node_color,
+                outline=EDGE_COLOR,
+            )
+        if self.matrix.size <= LABEL_LIMIT:
+            for element, (x, y) in zip(self.matrix.elements, points.tolist()):
+                draw.text((x, y), str(element), fill="black", anchor="mm")
+
+        img = BytesIO()
+        image.save(img, format="png", compress_level=1)
+        img.seek(0)
+        return img
+
+    def draw_small(self, node_color, font_size):
+        self.graph = nx.DiGraph()
+        self.graph.add_nodes_from(self.matrix.elements)
+        self.graph.add_edges_from(self.matrix.pairs())
         nx.draw(
             self.graph,
-            self.position,
+            dict(zip(self.matrix.elements, self.position)),
             with_labels=True,
             node_size=500,
             node_color=node_color,
@@ -135,3 +734,42 @@ class BinaryRelationGraph(BinaryRelation):
         plt.clf()
         img.seek(0)
         return img
+
+    def get_svg(self, node_color="skyblue", font_size=20):
+        size, radius, points = self.canvas()
+        start, end, _, loops = self.edge_segments(points, radius)
+        if self.matrix.size > LABEL_LIMIT:
+            font_size = min(font_size, radius * 2)
+
+        body = [
+            f'<line x1="{x1:.1f}" y1="{y1:.1f}" x2="{x2:.1f}" y2="{y2:.1f}"/>'
+            for x1, y1, x2, y2 in np.hstack((start, end)).tolist()
+        ]
+        body += [
+            f'<circle cx="{x:.1f}" cy="{y - 1.5 * radius:.1f}" r="{radius}" '
+            'fill="none"/>'
+            for x, y in loops.tolist()
+        ]
+        nodes = [
+            f'<circle cx="{x:.1f}" cy="{y:.1f}" r="{radius}">'
+            f"<title>{escape(str(element))}</title></circle>"
+            for element, (x, y) in zip(self.matrix.elements, points.tolist())
+        ]
+        labels = [
+            f'<text x="{x:.1f}" y="{y:.1f}">{escape(str(element))}</text>'
+            for element, (x, y) in zip(self.matrix.elements, points.tolist())
+        ]
+        edge_color = "rgb({},{},{})".format(*EDGE_COLOR)
+        return (
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{size}" '
+            f'height="{size}" viewBox="0 0 {size} {size}">'
+            '<defs><marker id="arrow" viewBox="0 0 10 10" refX="10" refY="5" '
+            'markerWidth="6" markerHeight="6" orient="auto-start-reverse">'
+            f'<path d="M0,0L10,5L0,10z" fill="{edge_color}"/></marker></defs>'
+            f'<rect width="{size}" height="{size}" fill="white"/>'
+            f'<g stroke="{edge_color}" marker-end="url(#arrow)">{"".join(body)}</g>'
+            f'<g fill="{escape(node_color)}" stroke="{edge_color}">'
+            f'{"".join(nodes)}</g>'
+            f'<g font-size="{font_size}" font-weight="bold" text-anchor="middle" '
+            f'dominant-baseline="central">{"".join(labels)}</g></svg>'
+        )
@@ -0,0 +1,91 @@
+import base64
+import json
+import struct
+
+import numpy as np
+
+ENCODED_FORMATS = ("bits", "base64", "binary")
+FRAME_HEADER = struct.Struct(">I")
+
+
+def bits_from_string(encoded_string):
+    bits = np.frombuffer(encoded_string.encode("ascii"), dtype=np.uint8) - ord("0")
+    if np.any(bits > 1):
+        raise ValueError("Encoded string must contain only '0' and '1'")
+    return bits
+
+
+def bits_to_string(bits):
+    return (np.asarray(bits, dtype=np.uint8) + ord("0")).tobytes().decode("ascii")
+
+
+class BitWriter:
+    def __init__(self):
+        self.data = bytearray()
+        self.bit_length = 0
+
+    def write_bits(self, bits):
+        bits = np.asarray(bits, dtype=np.uint8)
+        used = self.bit_length % 8
+        if used and len(bits):
+            head = min(8 - used, len(bits))
+            self.data[-1] |= int(np.packbits(bits[:head])[0]) >> used
+            self.bit_length += head
+            bits = bits[head:]
+        self.data.extend(np.packbits(bits).tobytes())
+        self.bit_length += len(bits)
+        return self
+
+    def getvalue(self):
+        return bytes(self.data)
+
+    def to_string(self):
+        return bits_to_string(BitReader(self.data, self.bit_length).bits())
+
+    def to_base64(self):
+        return base64.b64encode(self.data).decode("ascii")
+
+
+class BitReader:
+    def __init__(self, data, bit_length=None):
+        self.data = bytes(data)
+        capacity = 8 * len(self.data)
+        if bit_length is None:
+            bit_length = capacity
+        if bit_length < 0 or not capacity - 8 < bit_length <= capacity:
+            raise ValueError(
+                f"Bit length {bit_length} does not match {len(self.data)} bytes of data"
+            )
+        self.bit_length = bit_length
+
+    @classmethod
+    def from_string(cls, encoded_string):
+        return cls(
+            np.packbits(bits_from_string(encoded_string)).tobytes(), len(encoded_string)
+        )
+
+    @classmethod
+    def from_base64(cls, encoded_data, bit_length=None):
+        return cls(base64.b64decode(encoded_data, validate=True), bit_length)
+
+    def bits(self):
+        return np.unpackbits(
+            np.frombuffer(self.data, dtype=np.uint8), count=self.bit_length
+        )
+
+
+def pack_frame(metadata, data):
+    metadata = json.dumps(metadata, separators=(",", ":")).encode("utf-8")
+    return FRAME_HEADER.pack(len(metadata)) + metadata + bytes(data)
+
+
+def unpack_frame(frame):
+    frame = memoryview(frame)
+    if len(frame) < FRAME_HEADER.size:
+        raise ValueError("Frame is too short to hold a metadata length")
+    (length,) = FRAME_HEADER.unpack_from(frame)
+    end = FRAME_HEADER.size + length
+    if len(frame) < end:
+        raise ValueError(f"Frame ended inside {length} bytes of metadata")
+    metadata = json.loads(bytes(frame[FRAME_HEADER.size : end]).decode("utf-8"))
+    return metadata, bytes(frame[end:])
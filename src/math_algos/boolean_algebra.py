@@ -1,53 +1,97 @@
-import re
-from io import BytesIO
+import csv
+import html
+import json
+from io import BytesIO, StringIO
 from itertools import product
 
 import matplotlib.pyplot as plt
 import numpy as np
-from sympy import simplify_logic, symbols
-from sympy.parsing.sympy_parser import (
-    implicit_multiplication_application,
-    parse_expr,
-    standard_transformations,
+from sympy import (
+    ITE,
+    And,
+    Equivalent,
+    Implies,
+    Nand,
+    Nor,
+    Not,
+    Or,
+    Xor,
+    simplify_logic,
 )
+from sympy.logic.boolalg import BooleanFalse, BooleanTrue
+
+from .boolean_minimization import EspressoMinimizer, QuineMcCluskey, cubes_to_dnf
+from .expression_cache import simplification_cache, truth_table_cache
+from .expression_parser import parse_logic, variables_in_order
+
+ENGINES = ("sympy", "qm", "espresso", "auto")
+QM_VARIABLE_LIMIT = 10
+TRUTH_TABLE_FORMATS = ("png", "csv", "ndjson", "html")
+IMAGE_ROW_LIMIT = 64
+STREAM_CHUNK_ROWS = 1 << 16
+
+
+def variable_columns(variable_count, start, stop):
+    indices = np.arange(start, stop, dtype=np.int64)
+    shifts = np.arange(variable_count - 1, -1, -1, dtype=np.int64)
+    return ((indices[:, None] >> shifts) & 1).astype(bool)
+
+
+def popcount(values):
+    octets = np.asarray(values, dtype=">u8").view(np.uint8).reshape(-1, 8)
+    return np.unpackbits(octets, axis=1).sum(axis=1)
 
 
 class LogicSimplifier:
-    def __init__(self):
-        self.transformations = standard_transformations + (
-            implicit_multiplication_application,
-        )
+    def __init__(self, engine="sympy"):
+        if engine not in ENGINES:
+            raise ValueError(
+                f"Unknown engine '{engine}', expected one of: {', '.join(ENGINES)}"
+            )
+        self.engine = engine
+        self.exact = None
 
     def extract_variables(self, expr_str):
-        return set(re.findall(r"\b[a-zA-Z_][a-zA-Z0-9_]*\b", expr_str))
+        return set(variables_in_order(parse_logic(expr_str)))
+
+    def parse_expression(self, expr_str):
+        return parse_logic(expr_str).to_sympy({})
 
     def simplify_expression(self, expr_str):
-        variables = self.extract_variables(expr_str)
-        sympy_symbols = {var: symbols(var) for var in variables}
-        local_dict = sympy_symbols.copy()
-
-        expr_str = (
-            expr_str.replace("∧", "&")
-            .replace("∨", "|")
-            .replace("⊕", "^")
-            .replace("¬", "~")
+        return self.minimize(self.parse_expression(expr_str))
+
+    def minimize(self, expr):
+        simplified_expr, self.exact = simplification_cache.lookup(
+            f"logic:{self.engine}", expr, self.minimize_uncached, self.restore
         )
-        expr_str = expr_str.replace("←", "<<").replace("→", ">>")
-        expr_str = expr_str.replace("≡", "==")
+        return simplified_expr
 
-        expr_str = re.sub(r"(\b\w+)\s*==\s*(\b\w+)", r"Equivalent(\1, \2)", expr_str)
-        expr_str = re.sub(r"(\b\w+)\s*↓\s*(\b\w+)", r"Not(Or(\1, \2))", expr_str)
-        expr_str = re.sub(r"(\b\w+)\s*↑\s*(\b\w+)", r"Not(And(\1, \2))", expr_str)
+    @staticmethod
+    def restore(value, originals):
+        simplified_expr, exact = value
+        canonical = simplification_cache.canonical_symbols(len(originals))
+        return simplification_cache.rename(simplified_expr, canonical, originals), exact
 
-        try:
-            expr = parse_expr(
-                expr_str, transformations=self.transformations, local_dict=local_dict
-            )
-            simplified_expr = simplify_logic(expr, form="dnf", force=True)
-            return simplified_expr
-        except Exception as e:
-            print(f"Error parsing expression: {expr_str}")
-            raise e
+    def minimize_uncached(self, expr, variables):
+        if self.engine == "sympy":
+            return simplify_logic(expr, form="dnf", force=True), True
+
+        variables = [
+            variable for variable in variables if variable in expr.free_symbols
+        ]
+        _, on_set = VectorizedTruthTable(expr, map(str, variables)).evaluate()
+
+        engine = self.engine
+        if engine == "auto":
+            engine = "qm" if len(variables) <= QM_VARIABLE_LIMIT else "espresso"
+
+        if engine == "qm":
+            minimizer = QuineMcCluskey(len(variables))
+        else:
+            minimizer = EspressoMinimizer(len(variables))
+
+        cubes = minimizer.minimize(on_set)
+        return cubes_to_dnf(cubes, variables), minimizer.exact
 
     def reverse_transform(self, simplified_expr):
         expr_str = str(simplified_expr)
@@ -60,41 +104,154 @@ class LogicSimplifier:
         return expr_str
 
 
+class VectorizedTruthTable:
+    def __init__(self, expr, variables):
+        self.variables = list(variables)
+        self.positions = {name: index for index, name in enumerate(self.variables)}
+        self.kernel = self.compile(expr)
+
+    @property
+    def row_count(self):
+        return 1 << len(self.variables)
+
+    def compile(self, expr):
+        if isinstance(expr, BooleanTrue):
+            return lambda columns: np.ones(columns.shape[0], dtype=bool)
+        if isinstance(expr, BooleanFalse):
+            return lambda columns: np.zeros(columns.shape[0], dtype=bool)
+        if expr.is_Symbol:
+            position = self.positions[str(expr)]
+            return lambda columns: columns[:, position]
+
+        operands = [self.compile(arg) for arg in expr.args]
+
+        if isinstance(expr, Not):
+            (operand,) = operands
+            return lambda columns: ~operand(columns)
+        if isinstance(expr, And):
+            return lambda columns: self.fold(np.logical_and, operands, columns)
+        if isinstance(expr, Or):
+            return lambda columns: self.fold(np.logical_or, operands, columns)
+        if isinstance(expr, Xor):
+            return lambda columns: self.fold(np.logical_xor, operands, columns)
+        if isinstance(expr, Nand):
+            return lambda columns: ~self.fold(np.logical_and, operands, columns)
+        if isinstance(expr, Nor):
+            return lambda columns: ~self.fold(np.logical_or, operands, columns)
+        if isinstance(expr, Implies):
+            premise, conclusion = operands
+            return lambda columns: ~premise(columns) | conclusion(columns)
+        if isinstance(expr, Equivalent):
+            return lambda columns: self.all_equal(operands, columns)
+        if isinstance(expr, ITE):
+            condition, if_true, if_false = operands
+            return lambda columns: np.where(
+                condition(columns), if_true(columns), if_false(columns)
+            )
+
+        raise ValueError(f"Unsupported operation: {expr.func.__name__}")
+
+    @staticmethod
+    def fold(operation, operands, columns):
+        result = operands[0](columns)
+        for operand in operands[1:]:
+            result = operation(result, operand(columns))
+        return result
+
+    @staticmethod
+    def all_equal(operands, columns):
+        values = [operand(columns) for operand in operands]
+        all_true = np.logical_and.reduce(values)
+        all_false = ~np.logical_or.reduce(values)
+        return all_true | all_false
+
+    def variable_columns(self, start=0, stop=None):
+        if stop is None or stop > self.row_count:
+            stop = self.row_count
+        return variable_columns(len(self.variables), start, stop)
+
+    def evaluate(self, start=0, stop=None):
+        columns = self.variable_columns(start, stop)
+        return columns, np.asarray(self.kernel(columns), dtype=bool)
+
+    def results(self, start=0, stop=None, chunk_rows=STREAM_CHUNK_ROWS):
+        if stop is None or stop > self.row_count:
+            stop = self.row_count
+        start = min(max(start, 0), stop)
+        results = np.empty(stop - start, dtype=bool)
+        for first in range(start, stop, chunk_rows):
+            last = min(first + chunk_rows, stop)
+            results[first - start : last - start] = self.evaluate(first, last)[1]
+        return results
+
+
 class TruthTableGenerator:
     def __init__(self, expression):
         self.expression = expression
-        self.simplifier = LogicSimplifier()
+
+    def parse(self):
+        tree = parse_logic(self.expression)
+        return tree.to_sympy({}), sorted(variables_in_order(tree))
+
+    def variables(self):
+        return sorted(variables_in_order(parse_logic(self.expression)))
 
     def generate_truth_table(self):
-        simplified_expr = self.simplifier.simplify_expression(self.expression)
-        variables = sorted(self.simplifier.extract_variables(self.expression))
-        rows = list(product([False, True], repeat=len(variables)))
-        results = []
+        parsed_expr, variables = self.parse()
+        engine = VectorizedTruthTable(parsed_expr, variables)
+        return (
+            variables,
+            engine.variable_columns(),
+            self.results(parsed_expr, variables),
+        )
 
-        for row in rows:
-            local_dict = dict(zip(variables, row))
-            result = simplified_expr.subs(local_dict)
-            results.append(result)
+    def page(self, start=0, stop=None):
+        parsed_expr, variables = self.parse()
+        engine = VectorizedTruthTable(parsed_expr, variables)
+        if stop is None or stop > engine.row_count:
+            stop = engine.row_count
+        start = min(max(start, 0), stop)
 
-        return variables, rows, results
+        if start == 0 and stop == engine.row_count:
+            return variables, self.results(parsed_expr, variables)
+        return variables, engine.results(start, stop)
+
+    def results(self, parsed_expr, variables):
+        if {str(symbol) for symbol in parsed_expr.free_symbols} != set(variables):
+            return VectorizedTruthTable(parsed_expr, variables).results()
+
+        return truth_table_cache.lookup(
+            "truth-table",
+            parsed_expr,
+            lambda expr, symbols: VectorizedTruthTable(
+                expr, map(str, symbols)
+            ).results(),
+            lambda results, originals: self.reorder(
+                results, [str(symbol) for symbol in originals], variables
+            ),
+        )
 
     @staticmethod
-    def boolean_to_int(value):
-        return 1 if value else 0
-
-    def create_truth_table_image(self):
-        variables, rows, results = self.generate_truth_table()
-        data = []
-
-        for index, row in enumerate(rows):
-            data.append(
-                [index]
-                + [self.boolean_to_int(val) for val in row]
-                + [self.boolean_to_int(results[index])]
-            )
+    def reorder(results, source_order, target_order):
+        if source_order == target_order:
+            return results
+        axes = [source_order.index(name) for name in target_order]
+        return results.reshape((2,) * len(source_order)).transpose(axes).reshape(-1)
+
+    def create_truth_table_image(self, start=0, stop=None):
+        if stop is None or stop - start > IMAGE_ROW_LIMIT:
+            stop = start + IMAGE_ROW_LIMIT
+        variables, results = self.page(start, stop)
+        rows = variable_columns(len(variables), start, start + len(results))
 
         fig, ax = plt.subplots()
-        data = np.array(data)
+        data = np.column_stack(
+            (
+                np.arange(start, start + len(rows)),
+                rows.astype(np.uint8),
+                results.astype(np.uint8),
+            )
+        )
         ax.axis("tight")
         ax.axis("off")
 
@@ -124,3 +281,292 @@ class TruthTableGenerator:
         buffer.seek(0)
 
         return buffer
+
+
+class CanonicalForms:
+    def __init__(self, expression):
+        self.variables, self.results = TruthTableGenerator(expression).page()
+
+    def minterms(self):
+        return np.flatnonzero(self.results).tolist()
+
+    def maxterms(self):
+        return np.flatnonzero(~self.results).tolist()
+
+    @staticmethod
+    def literal_table(variables, positive, joiner):
+        choices = [
+            (name, f"¬{name}") if not positive else (f"¬{name}", name)
+            for name in variables
+        ]
+        return [joiner.join(literals) for literals in product(*choices)]
+
+    def terms(self, indices, positive, joiner):
+        variable_count = len(self.variables)
+        split = variable_count // 2
+        low_bits = variable_count - split
+        mask = (1 << low_bits) - 1
+        high = self.literal_table(self.variables[:split], positive, joiner)
+        low = self.literal_table(self.variables[split:], positive, joiner)
+
+        if not split:
+            return [low[index] for index in indices]
+        return [
+            f"({high[index >> low_bits]}{joiner}{low[index & mask]})"
+            for index in indices
+        ]
+
+    def cdnf(self):
+        if not self.variables or not self.results.any():
+            return "1" if self.results.all() else "0"
+        return " ∨ ".join(self.terms(self.minterms(), True, " ∧ "))
+
+    def ccnf(self):
+        if not self.variables or self.results.all():
+            return "1" if self.results.all() else "0"
+        return " ∧ ".join(self.terms(self.maxterms(), False, " ∨ "))
+
+
+class KarnaughMap:
+    MIN_VARIABLES = 2
+    MAX_VARIABLES = 6
+
+    def __init__(self, expression):
+        self.variables, self.results = TruthTableGenerator(expression).page()
+        if not self.MIN_VARIABLES <= len(self.variables) <= self.MAX_VARIABLES:
+            raise ValueError(
+                f"Karnaugh maps support {self.MIN_VARIABLES} to "
+                f"{self.MAX_VARIABLES} variables, got {len(self.variables)}"
+            )
+
+    @staticmethod
+    def gray_code(bits):
+        codes = np.arange(1 << bits, dtype=np.int64)
+        return codes ^ (codes >> 1)
+
+    def build(self):
+        row_bits = len(self.variables) // 2
+        column_bits = len(self.variables) - row_bits
+        rows = self.gray_code(row_bits)
+        columns = self.gray_code(column_bits)
+        grid = self.results[(rows[:, None] << column_bits) | columns[None, :]]
+
+        return {
+            "row_variables": self.variables[:row_bits],
+            "column_variables": self.variables[row_bits:],
+            "row_labels": [format(code, f"0{row_bits}b") for code in rows],
+            "column_labels": [format(code, f"0{column_bits}b") for code in columns],
+            "grid": grid.astype(int).tolist(),
+        }
+
+
+class ZhegalkinPolynomial:
+    def __init__(self, expression):
+        self.variables, results = TruthTableGenerator(expression).page()
+        self.coefficients = self.mobius_transform(results)
+
+    @staticmethod
+    def mobius_transform(results):
+        coefficients = np.array(results, dtype=np.uint8)
+        step = 1
+        while step < len(coefficients):
+            blocks = coefficients.reshape(-1, 2, step)
+            blocks[:, 1, :] ^= blocks[:, 0, :]
+            step <<= 1
+        return coefficients
+
+    def monomials(self):
+        monomials = np.flatnonzero(self.coefficients)
+        return monomials[np.lexsort((-monomials, popcount(monomials)))]
+
+    def degree(self):
+        monomials = self.monomials()
+        if not len(monomials):
+            return 0
+        return int(popcount(monomials).max())
+
+    @staticmethod
+    def monomial_table(variables):
+        table = [""]
+        for name in variables:
+            table = [
+                term
+                for prefix in table
+                for term in (prefix, f"{prefix} ∧ {name}" if prefix else name)
+            ]
+        return table
+
+    def to_string(self):
+        monomials = self.monomials()
+        if not len(monomials):
+            return "0"
+
+        split = len(self.variables) // 2
+        low_bits = len(self.variables) - split
+        mask = (1 << low_bits) - 1
+        high = self.monomial_table(self.variables[:split])
+        low = self.monomial_table(self.variables[split:])
+
+        terms = []
+        for monomial in monomials.tolist():
+            left, right = high[monomial >> low_bits], low[monomial & mask]
+            if left and right:
+                terms.append(f"{left} ∧ {right}")
+            else:
+                terms.append(left or right or "1")
+        return " ⊕ ".join(terms)
+
+
+class PostClasses:
+    NAMES = ("T0", "T1", "S", "M", "L")
+
+    def __init__(self, expression):
+        self.variables, self.results = TruthTableGenerator(expression).page()
+
+    def preserves_false(self):
+        return not self.results[0]
+
+    def preserves_true(self):
+        return bool(self.results[-1])
+
+    def is_self_dual(self):
+        return bool(np.array_equal(self.results, ~self.results[::-1]))
+
+    def is_monotone(self):
+        step = 1
+        while step < len(self.results):
+            blocks = self.results.reshape(-1, 2, step)
+            if np.any(blocks[:, 0, :] > blocks[:, 1, :]):
+                return False
+            step <<= 1
+        return True
+
+    def is_linear(self):
+        coefficients = ZhegalkinPolynomial.mobius_transform(self.results)
+        return bool(np.all(popcount(np.flatnonzero(coefficients)) <= 1))
+
+    def classes(self):
+        return dict(
+            zip(
+                self.NAMES,
+                (
+                    self.preserves_false(),
+                    self.preserves_true(),
+                    self.is_self_dual(),
+                    self.is_monotone(),
+                    self.is_linear(),
+                ),
+            )
+        )
+
+
+class FunctionalCompleteness:
+    def __init__(self, expressions):
+        if not expressions:
+            raise ValueError("At least one function is required")
+        self.expressions = list(expressions)
+        self.memberships = [
+            PostClasses(expression).classes() for expression in expressions
+        ]
+
+    def check(self):
+        witnesses = {}
+        for name in PostClasses.NAMES:
+            witnesses[name] = next(
+                (
+                    expression
+                    for expression, classes in zip(self.expressions, self.memberships)
+                    if not classes[name]
+                ),
+                None,
+            )
+        return {
+            "complete": all(witness is not None for witness in witnesses.values()),
+            "witnesses": witnesses,
+        }
+
+
+class TruthTableWriter:
+    MEDIA_TYPES = {
+        "csv": "text/csv",
+        "ndjson": "application/x-ndjson",
+        "html": "text/html",
+    }
+
+    def __init__(self, variables, label, results=(), start=0):
+        self.variables = list(variables)
+        self.label = label
+        self.results = np.asarray(results, dtype=bool)
+        self.start = start
+
+    def chunks(self, chunk_rows=STREAM_CHUNK_ROWS):
+        for offset in range(0, len(self.results), chunk_rows):
+            results = self.results[offset : offset + chunk_rows]
+            first = self.start + offset
+            columns = variable_columns(len(self.variables), first, first + len(results))
+            yield np.column_stack((columns, results))
+
+    @staticmethod
+    def render(bits, parts):
+        parts = [part.encode() for part in parts]
+        width = sum(len(part) for part in parts) + bits.shape[1]
+        rendered = np.empty((len(bits), width), dtype=np.uint8)
+
+        position = 0
+        for index, part in enumerate(parts):
+            rendered[:, position : position + len(part)] = np.frombuffer(
+                part, dtype=np.uint8
+            )
+            position += len(part)
+            if index < bits.shape[1]:
+                rendered[:, position] = bits[:, index] + ord("0")
+                position += 1
+        return rendered.tobytes()
+
+    def stream(self, template, header="", footer=""):
+        if header:
+            yield header.encode()
+        for bits in self.chunks():
+            yield self.render(bits, template)
+        if footer:
+            yield footer.encode()
+
+    def csv(self):
+        header = StringIO()
+        csv.writer(header, lineterminator="\n").writerow([*self.variables, self.label])
+        template = [""] + [","] * len(self.variables) + ["\n"]
+        return header.getvalue(), template, ""
+
+    def ndjson(self):
+        keys = [json.dumps(name, ensure_ascii=False) for name in self.variables]
+        keys.append(json.dumps(self.label, ensure_ascii=False))
+        template = [f"{{{keys[0]}: "]
+        template += [f", {key}: " for key in keys[1:]]
+        template.append("}\n")
+        return "", template, ""
+
+    def html(self):
+        names = [*self.variables, self.label]
+        header = "".join(f"<th>{html.escape(name)}</th>" for name in names)
+        template = ["<tr><td>"] + ["</td><td>"] * len(self.variables) + ["</td></tr>\n"]
+        return (
+            f"<table>\n<thead><tr>{header}</tr></thead>\n<tbody>\n",
+            template,
+            "</tbody>\n</table>\n",
+        )
+
+    def layout(self, output_format):
+        if output_format not in self.MEDIA_TYPES:
+            raise ValueError(
+                f"Unknown format '{output_format}', expected one of: "
+                f"{', '.join(self.MEDIA_TYPES)}"
+            )
+        return getattr(self, output_format)()
+
+    def rows(self, output_format):
+        _, template, _ = self.layout(output_format)
+        return b"".join(self.render(bits, template) for bits in self.chunks())
+
+    def write(self, output_format):
+        header, template, footer = self.layout(output_format)
+        return self.stream(template, header, footer)
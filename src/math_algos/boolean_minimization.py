@@ -0,0 +1,274 @@
+import numpy as np
+from sympy import And, Not, Or, false, true
+
+SEARCH_LIMIT = 2000
+
+
+class Cube:
+    __slots__ = ("value", "mask")
+
+    def __init__(self, value, mask=0):
+        self.value = value
+        self.mask = mask
+
+    def __eq__(self, other):
+        return self.value == other.value and self.mask == other.mask
+
+    def __hash__(self):
+        return hash((self.value, self.mask))
+
+    def __repr__(self):
+        return f"Cube(value={self.value}, mask={self.mask})"
+
+    def covers(self, minterm):
+        return minterm & ~self.mask == self.value
+
+    def minterms(self):
+        free_bits = [
+            1 << bit for bit in range(self.mask.bit_length()) if self.mask >> bit & 1
+        ]
+        result = [self.value]
+        for bit in free_bits:
+            result += [minterm | bit for minterm in result]
+        return result
+
+    def literal_count(self, variable_count):
+        return variable_count - bin(self.mask).count("1")
+
+
+def cubes_to_dnf(cubes, variables):
+    if not cubes:
+        return false
+
+    terms = []
+    variable_count = len(variables)
+    for cube in cubes:
+        literals = []
+        for index, variable in enumerate(variables):
+            bit = 1 << (variable_count - 1 - index)
+            if cube.mask & bit:
+                continue
+            literals.append(variable if cube.value & bit else Not(variable))
+        if not literals:
+            return true
+        terms.append(And(*literals))
+
+    return Or(*terms)
+
+
+class QuineMcCluskey:
+    def __init__(self, variable_count, search_limit=SEARCH_LIMIT):
+        self.variable_count = variable_count
+        self.search_limit = search_limit
+        self.exact = True
+
+    def minimize(self, on_set):
+        self.exact = True
+        minterms = [int(minterm) for minterm in np.flatnonzero(on_set)]
+        if not minterms:
+            return []
+
+        primes = self.prime_implicants(minterms)
+        return self.select_cover(primes, minterms)
+
+    def prime_implicants(self, minterms):
+        groups = {0: set(minterms)}
+        primes = []
+
+        while groups:
+            combined = {}
+            for mask, values in groups.items():
+                used = set()
+                for position in range(self.variable_count):
+                    bit = 1 << position
+                    if mask & bit:
+                        continue
+                    merged = {
+                        value
+                        for value in values
+                        if not value & bit and value | bit in values
+                    }
+                    if merged:
+                        combined.setdefault(mask | bit, set()).update(merged)
+                        used.update(merged)
+                        used.update(value | bit for value in merged)
+                primes.extend(Cube(value, mask) for value in values - used)
+            groups = combined
+
+        return sorted(primes, key=lambda cube: (-cube.mask, cube.value))
+
+    def select_cover(self, primes, minterms):
+        coverage = {prime: frozenset(prime.minterms()) for prime in primes}
+        covering = {minterm: [] for minterm in minterms}
+        for prime in primes:
+            for minterm in coverage[prime]:
+                covering[minterm].append(prime)
+
+        chosen = []
+        uncovered = set(minterms)
+        for minterm in minterms:
+            candidates = covering[minterm]
+            if len(candidates) == 1 and candidates[0] not in chosen:
+                chosen.append(candidates[0])
+                uncovered -= coverage[candidates[0]]
+
+        return chosen + self.cover_remaining(covering, coverage, uncovered)
+
+    def cost(self, cubes):
+        return (
+            len(cubes),
+            sum(cube.literal_count(self.variable_count) for cube in cubes),
+        )
+
+    def cover_remaining(self, covering, coverage, uncovered):
+        if not uncovered:
+            return []
+
+        best = self.greedy_cover(covering, coverage, uncovered)
+        best_cost = self.cost(best)
+        budget = self.search_limit
+        selected = []
+
+        def search(uncovered):
+            nonlocal best, best_cost, budget
+            if budget <= 0:
+                self.exact = False
+                return
+            budget -= 1
+
+            if not uncovered:
+                cost = self.cost(selected)
+                if cost < best_cost:
+                    best, best_cost = list(selected), cost
+                return
+            if len(selected) >= best_cost[0]:
+                return
+
+            pivot = min(uncovered, key=lambda minterm: len(covering[minterm]))
+            candidates = sorted(
+                covering[pivot], key=lambda prime: -len(coverage[prime] & uncovered)
+            )
+            for prime in candidates:
+                selected.append(prime)
+                search(uncovered - coverage[prime])
+                selected.pop()
+
+        search(frozenset(uncovered))
+        return best
+
+    @staticmethod
+    def greedy_cover(covering, coverage, uncovered):
+        uncovered = set(uncovered)
+        chosen = []
+        while uncovered:
+            pivot = min(uncovered, key=lambda minterm: len(covering[minterm]))
+            prime = max(
+                covering[pivot],
+                key=lambda prime: (len(coverage[prime] & uncovered), prime.mask),
+            )
+            chosen.append(prime)
+            uncovered -= coverage[prime]
+        return chosen
+
+
+class EspressoMinimizer:
+    exact = False
+
+    def __init__(self, variable_count, rounds=3):
+        self.variable_count = variable_count
+        self.rounds = rounds
+
+    def minimize(self, on_set):
+        on_set = np.asarray(on_set, dtype=bool)
+        on = np.flatnonzero(on_set).astype(np.int64)
+        off = np.flatnonzero(~on_set).astype(np.int64)
+        if not len(on):
+            return []
+        if not len(off):
+            return [Cube(0, (1 << self.variable_count) - 1)]
+
+        cubes = []
+        uncovered = on[np.argsort(self.on_neighbours(on, on_set), kind="stable")]
+        while len(uncovered):
+            cube = self.expand(Cube(int(uncovered[0])), off, uncovered)
+            cubes.append(cube)
+            uncovered = uncovered[(uncovered & ~cube.mask) != cube.value]
+        cubes = self.irredundant(cubes, on)
+
+        for _ in range(self.rounds):
+            improved = self.irredundant(self.reduce_and_expand(cubes, on, off), on)
+            if self.cost(improved) >= self.cost(cubes):
+                break
+            cubes = improved
+
+        return cubes
+
+    def cost(self, cubes):
+        return (
+            len(cubes),
+            sum(cube.literal_count(self.variable_count) for cube in cubes),
+        )
+
+    def on_neighbours(self, minterms, on_set):
+        counts = np.zeros(len(minterms), dtype=np.int64)
+        for position in range(self.variable_count):
+            counts += on_set[minterms ^ (1 << position)]
+        return counts
+
+    @staticmethod
+    def covered_by(cube, minterms):
+        return (minterms & ~cube.mask) == cube.value
+
+    def expand(self, cube, off, targets):
+        bits = [
+            1 << position
+            for position in range(self.variable_count)
+            if not cube.mask >> position & 1
+        ]
+        while bits:
+            best, best_score = None, -1
+            for bit in list(bits):
+                candidate = Cube(cube.value & ~bit, cube.mask | bit)
+                if np.any(self.covered_by(candidate, off)):
+                    bits.remove(bit)
+                    continue
+                score = np.count_nonzero(self.covered_by(candidate, targets))
+                if score > best_score:
+                    best, best_score = candidate, score
+            if best is None:
+                break
+            bits.remove(best.mask & ~cube.mask)
+            cube = best
+        return cube
+
+    def reduce_and_expand(self, cubes, on, off):
+        covered = [self.covered_by(cube, on) for cube in cubes]
+        counts = np.sum(covered, axis=0)
+
+        result = []
+        for cube, cube_covered in zip(cubes, covered):
+            unique = on[cube_covered & (counts == 1)]
+            if not len(unique):
+                counts -= cube_covered
+                continue
+            mask = int(np.bitwise_or.reduce(unique ^ unique[0]))
+            reduced = Cube(int(unique[0]) & ~mask, mask)
+            shared = on[(counts - cube_covered) == 1]
+            expanded = self.expand(reduced, off, shared)
+            expanded_covered = self.covered_by(expanded, on)
+            counts += expanded_covered.astype(np.int64) - cube_covered
+            result.append(expanded)
+        return result
+
+    def irredundant(self, cubes, on):
+        cubes = sorted(cubes, key=lambda cube: bin(cube.mask).count("1"))
+        covered = [self.covered_by(cube, on) for cube in cubes]
+        counts = np.sum(covered, axis=0)
+
+        result = []
+        for cube, cube_covered in zip(cubes, covered):
+            if np.all(counts[cube_covered] >= 2):
+                counts -= cube_covered
+            else:
+                result.append(cube)
+        return result
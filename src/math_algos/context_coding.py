@@ -0,0 +1,222 @@
+from .range_coding import HEADER_BYTES, MAX_TOTAL, RangeDecoder, RangeEncoder
+
+MAX_ORDER = 6
+DEFAULT_ORDER = 2
+INCREMENT = 32
+ESCAPE_INCREMENT = 16
+RESCALE_LIMIT = MAX_TOTAL
+MAX_CONTEXTS = 1 << 16
+LITERAL_PAGES = 0x110000 >> 16
+LITERAL_PAGE = 1 << 16
+END_OF_STREAM = LITERAL_PAGES
+SYMBOL_MARGIN = 2 * (MAX_ORDER + 3)
+
+
+class FenwickTree:
+    def __init__(self, frequencies=()):
+        self.frequencies = list(frequencies)
+        self.rebuild()
+
+    def rebuild(self):
+        size = len(self.frequencies)
+        self.tree = [0] * (size + 1)
+        for i, frequency in enumerate(self.frequencies, 1):
+            self.tree[i] += frequency
+            parent = i + (i & -i)
+            if parent <= size:
+                self.tree[parent] += self.tree[i]
+        self.total = sum(self.frequencies)
+        self.top = 1 << size.bit_length() - 1 if size else 0
+
+    def prefix(self, index):
+        tree, total = self.tree, 0
+        while index:
+            total += tree[index]
+            index &= index - 1
+        return total
+
+    def append(self, frequency):
+        self.frequencies.append(frequency)
+        i = len(self.frequencies)
+        self.tree.append(frequency + self.prefix(i - 1) - self.prefix(i - (i & -i)))
+        self.total += frequency
+        if i >= 2 * self.top:
+            self.top = i
+
+    def add(self, index, delta):
+        self.frequencies[index] += delta
+        self.total += delta
+        tree, size = self.tree, len(self.tree) - 1
+        index += 1
+        while index <= size:
+            tree[index] += delta
+            index += index & -index
+
+    def find(self, value):
+        tree, size = self.tree, len(self.tree) - 1
+        position, remaining, step = 0, value, self.top
+        while step:
+            following = position + step
+            if following <= size and tree[following] <= remaining:
+                position = following
+                remaining -= tree[following]
+            step >>= 1
+        return position, value - remaining
+
+
+class ContextModel:
+    def __init__(self):
+        self.slots = {}
+        self.symbols = [None]
+        self.tree = FenwickTree([0])
+
+    def interval(self, slot):
+        return self.tree.prefix(slot), self.tree.frequencies[slot]
+
+    def update(self, symbol):
+        slot = self.slots.get(symbol)
+        if slot is None:
+            self.slots[symbol] = len(self.symbols)
+            self.symbols.append(symbol)
+            self.tree.append(INCREMENT)
+            self.tree.add(0, ESCAPE_INCREMENT)
+        else:
+            self.tree.add(slot, INCREMENT)
+        if self.tree.total > RESCALE_LIMIT:
+            self.rescale()
+
+    def rescale(self):
+        self.tree.frequencies = [
+            (frequency + 1) // 2 for frequency in self.tree.frequencies
+        ]
+        self.tree.rebuild()
+
+
+def check_order(order):
+    if not 0 <= order <= MAX_ORDER:
+        raise ValueError(f"Context order must be between 0 and {MAX_ORDER}")
+    return order
+
+
+class ContextModels:
+    def __init__(self, order=DEFAULT_ORDER):
+        self.order = check_order(order)
+        self.models = {}
+        self.history = ""
+
+    def contexts(self):
+        history = self.history
+        return [history[len(history) - j :] for j in range(len(history), -1, -1)]
+
+    def update(self, contexts, symbol):
+        models = self.models
+        if len(models) > MAX_CONTEXTS:
+            models.clear()
+        for context in contexts:
+            model = models.get(context)
+            if model is None:
+                model = models[context] = ContextModel()
+            model.update(symbol)
+        if self.order:
+            self.history = (self.history + symbol)[-self.order :]
+
+
+class ContextEncoder(ContextModels):
+    def __init__(self, order=DEFAULT_ORDER):
+        super().__init__(order)
+        self.encoder = RangeEncoder()
+
+    def write(self, text):
+        encoder, models = self.encoder, self.models
+        for symbol in text:
+            contexts = self.contexts()
+            for depth, context in enumerate(contexts, 1):
+                model = models.get(context)
+                if model is None:
+                    continue
+                slot = model.slots.get(symbol)
+                start, size = model.interval(slot or 0)
+                encoder.encode_interval(start, size, model.tree.total)
+                if slot is not None:
+                    break
+            else:
+                code = ord(symbol)
+                encoder.encode_interval(code >> 16, 1, LITERAL_PAGES + 1)
+                encoder.encode_interval(code & 0xFFFF, 1, LITERAL_PAGE)
+            self.update(contexts[:depth], symbol)
+        return encoder.take()
+
+    def finish(self):
+        for context in self.contexts():
+            model = self.models.get(context)
+            if model is not None:
+                start, size = model.interval(0)
+                self.encoder.encode_interval(start, size, model.tree.total)
+        self.encoder.encode_interval(END_OF_STREAM, 1, LITERAL_PAGES + 1)
+        return self.encoder.finish()
+
+
+class ContextDecoder(ContextModels):
+    def __init__(self, order=DEFAULT_ORDER):
+        super().__init__(order)
+        self.decoder = None
+        self.pending = bytearray()
+        self.finished = False
+
+    def feed(self, chunk):
+        if self.decoder is None:
+            self.pending.extend(chunk)
+            if len(self.pending) < HEADER_BYTES + SYMBOL_MARGIN:
+                return ""
+            self.decoder = RangeDecoder(self.pending)
+        else:
+            self.decoder.extend(chunk)
+        return self.read(SYMBOL_MARGIN)
+
+    def finish(self):
+        if self.decoder is None:
+            self.decoder = RangeDecoder(self.pending)
+        text = self.read(0)
+        if not self.finished:
+            raise ValueError("Compressed stream ended before the end marker")
+        return text
+
+    def read(self, margin):
+        decoder, models = self.decoder, self.models
+        output = []
+        while not self.finished and decoder.available() >= margin:
+            contexts = self.contexts()
+            symbol = None
+            for depth, context in enumerate(contexts, 1):
+                model = models.get(context)
+                if model is None:
+                    continue
+                slot, start = model.tree.find(decoder.target(model.tree.total))
+                decoder.consume(start, model.tree.frequencies[slot])
+                if slot:
+                    symbol = model.symbols[slot]
+                    break
+            if symbol is None:
+                page = decoder.target(LITERAL_PAGES + 1)
+                decoder.consume(page, 1)
+                if page == END_OF_STREAM:
+                    self.finished = True
+                    break
+                code = page << 16 | decoder.target(LITERAL_PAGE)
+                decoder.consume(code & 0xFFFF, 1)
+                symbol = chr(code)
+            output.append(symbol)
+            self.update(contexts[:depth], symbol)
+            if not margin and decoder.available() < -SYMBOL_MARGIN:
+                break
+        return "".join(output)
+
+
+def context_encode(string, order=DEFAULT_ORDER):
+    encoder = ContextEncoder(order)
+    return encoder.write(string) + encoder.finish()
+
+
+def context_decode(data, order=DEFAULT_ORDER):
+    decoder = ContextDecoder(order)
+    return decoder.feed(data) + decoder.finish()
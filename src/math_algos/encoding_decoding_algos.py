@@ -2,10 +2,21 @@ import heapq
 import math
 from collections import defaultdict
 from decimal import Decimal, getcontext
+from io import BytesIO
 
 import matplotlib.pyplot as plt
 import numpy as np
-from io import BytesIO
+
+from .bit_io import BitWriter, bits_from_string
+from .prefix_coding import (
+    ENCODE_BLOCK,
+    PrefixDecoder,
+    PrefixEncoder,
+    canonical_codes,
+    code_lengths,
+    package_merge,
+    symbols_to_string,
+)
 
 getcontext().prec = 100
 
@@ -115,8 +126,9 @@ class FixedLengthCoding:
         self.alphabet = sorted(list(set(string)))
         self.char_to_code = {}
         self.code_to_char = {}
+        self.code_length = 0
         if string != "":
-            self.code_length = math.ceil(math.log2(len(self.alphabet)))
+            self.code_length = max(1, math.ceil(math.log2(len(self.alphabet))))
         self.generate_codes()
 
     def generate_codes(self):
@@ -127,20 +139,47 @@ class FixedLengthCoding:
 
     @staticmethod
     def recreate_from_alphabet(alphabet):
+        lengths = {len(code) for code in alphabet.values()}
+        if len(lengths) > 1:
+            raise ValueError("Fixed-length codes must all have the same length")
         instance = FixedLengthCoding("")
-        instance.code_length = math.ceil(math.log2(len(alphabet)))
+        instance.code_length = lengths.pop() if lengths else 0
         instance.code_to_char = {v: k for k, v in alphabet.items()}
         instance.char_to_code = alphabet
         return instance
 
     def encode(self, string):
-        return "".join(self.char_to_code.get(char, "") for char in string)
+        return self.encode_bits(string).to_string()
+
+    def encode_bits(self, string, writer=None):
+        writer = BitWriter() if writer is None else writer
+        encoder = PrefixEncoder(self.char_to_code)
+        for start in range(0, len(string), ENCODE_BLOCK):
+            ids = encoder.symbol_ids(string[start : start + ENCODE_BLOCK])
+            writer.write_bits(encoder.table[ids].ravel())
+        return writer
 
     def decode(self, encoded_string):
-        return "".join(
-            self.code_to_char[encoded_string[i : i + self.code_length]]
-            for i in range(0, len(encoded_string), self.code_length)
+        return self.decode_bits(bits_from_string(encoded_string))
+
+    def decode_bits(self, bits):
+        if not len(bits):
+            return ""
+        if not self.code_length or len(bits) % self.code_length:
+            raise ValueError(
+                f"Encoded length {len(bits)} is not a multiple of "
+                f"the code length {self.code_length}"
+            )
+        codes = sorted(self.code_to_char)
+        keys = np.array([int(code, 2) for code in codes], dtype=np.uint64)
+        weights = np.uint64(1) << np.arange(
+            self.code_length - 1, -1, -1, dtype=np.uint64
         )
+        values = bits.reshape(-1, self.code_length).astype(np.uint64) @ weights
+        ids = np.minimum(np.searchsorted(keys, values), len(keys) - 1)
+        if np.any(keys[ids] != values):
+            raise ValueError("Encoded string contains an unknown code")
+        return symbols_to_string([self.code_to_char[code] for code in codes], ids)
 
     def get_alphabet_dict(self):
         return {char: self.char_to_code[char] for char in self.alphabet}
@@ -174,7 +213,7 @@ class ShennonFanoCoding:
 
         if len(symbols) == 1:
             letter = symbols[0][0]
-            return {letter: prefix}
+            return {letter: prefix or "0"}
 
         left, right = self.split_into_parts(symbols)
         code_dict = {}
@@ -190,17 +229,24 @@ class ShennonFanoCoding:
         return instance
 
     def encode(self, string):
-        return "".join(self.char_to_code.get(char, "") for char in string)
+        return self.encode_bits(string).to_string()
+
+    def encode_bits(self, string, writer=None):
+        return PrefixEncoder(self.char_to_code).encode_bits(string, writer)
 
     def decode(self, encoded_string):
-        decoded_string = ""
-        code = ""
-        for bit in encoded_string:
-            code += bit
-            if code in self.code_to_char:
-                decoded_string += self.code_to_char[code]
-                code = ""
-        return decoded_string
+        return PrefixDecoder(self.char_to_code).decode(encoded_string)
+
+    def decode_bits(self, bits):
+        return PrefixDecoder(self.char_to_code).decode_bits(bits)
+
+    def code_lengths(self):
+        return code_lengths(self.char_to_code)
+
+    def canonicalize(self):
+        self.char_to_code = canonical_codes(self.code_lengths())
+        self.code_to_char = {v: k for k, v in self.char_to_code.items()}
+        return self
 
     def get_alphabet_dict(self):
         return self.char_to_code
@@ -215,13 +261,18 @@ class ShennonFanoCoding:
 
 
 class HuffmanCoding:
-    def __init__(self, probability_calculator):
+    def __init__(self, probability_calculator, max_code_length=None):
         self.probability_calculator = probability_calculator
         self.letters, self.probabilities = zip(
             *probability_calculator.get_probabilities().items()
         )
-        self.root = self.build_huffman_tree()
-        self.code_dict = self.build_huffman_code()
+        if max_code_length is None:
+            self.root = self.build_huffman_tree()
+            self.code_dict = self.build_huffman_code()
+        else:
+            self.root = None
+            lengths = package_merge(self.probabilities, max_code_length)
+            self.code_dict = canonical_codes(dict(zip(self.letters, lengths)))
 
     @classmethod
     def recreate_from_codes(cls, codes):
@@ -276,7 +327,7 @@ class HuffmanCoding:
             code_dict = {}
 
         if node.char is not None:
-            code_dict[node.char] = current_code
+            code_dict[node.char] = current_code or "0"
         if node.left is not None:
             self.build_huffman_code(node.left, current_code + node.left.code, code_dict)
         if node.right is not None:
@@ -287,24 +338,23 @@ class HuffmanCoding:
         return code_dict
 
     def encode(self, string):
-        encoded_string = ""
-        for char in string:
-            encoded_string += self.code_dict[char]
-        return encoded_string
+        return self.encode_bits(string).to_string()
+
+    def encode_bits(self, string, writer=None):
+        return PrefixEncoder(self.code_dict).encode_bits(string, writer)
 
     def decode(self, encoded_string, codes):
-        decoded_string = ""
-        current_code = ""
-
-        for bit in encoded_string:
-            current_code += bit
-            for char, code in codes.items():
-                if current_code == code:
-                    decoded_string += char
-                    current_code = ""
-                    break
+        return PrefixDecoder(codes).decode(encoded_string)
+
+    def decode_bits(self, bits, codes):
+        return PrefixDecoder(codes).decode_bits(bits)
+
+    def code_lengths(self):
+        return code_lengths(self.code_dict)
 
-        return decoded_string
+    def canonicalize(self):
+        self.code_dict = canonical_codes(self.code_lengths())
+        return self
 
     def average_code_length(self):
         probabilities = self.probability_calculator.get_probabilities()
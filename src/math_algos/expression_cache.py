@@ -0,0 +1,68 @@
+from sympy import And, Equivalent, Nand, Nor, Or, Symbol, Xor
+
+from .caching import LRUCache
+
+COMMUTATIVE_OPERATIONS = (And, Or, Xor, Equivalent, Nand, Nor)
+
+
+class CanonicalCache(LRUCache):
+    @staticmethod
+    def shape(expr, shapes):
+        if expr not in shapes:
+            if expr.is_Symbol:
+                shapes[expr] = "v"
+            elif not expr.args:
+                shapes[expr] = str(expr)
+            else:
+                children = [CanonicalCache.shape(arg, shapes) for arg in expr.args]
+                if isinstance(expr, COMMUTATIVE_OPERATIONS):
+                    children.sort()
+                shapes[expr] = f"{expr.func.__name__}({','.join(children)})"
+        return shapes[expr]
+
+    def canonicalize(self, expr):
+        shapes = {}
+        order = {}
+
+        def visit(node):
+            if node.is_Symbol:
+                if node not in order:
+                    order[node] = f"_c{len(order)}"
+                return order[node]
+            if not node.args:
+                return str(node)
+
+            args = node.args
+            if isinstance(node, COMMUTATIVE_OPERATIONS):
+                args = sorted(args, key=lambda arg: (self.shape(arg, shapes), str(arg)))
+            children = [visit(arg) for arg in args]
+            return f"{node.func.__name__}({','.join(children)})"
+
+        key = visit(expr)
+        return key, list(order)
+
+    @staticmethod
+    def canonical_symbols(count):
+        return [Symbol(f"_c{index}") for index in range(count)]
+
+    @staticmethod
+    def rename(value, source, target):
+        return value.xreplace(dict(zip(source, target)))
+
+    def lookup(self, namespace, expr, compute, restore=None):
+        key, originals = self.canonicalize(expr)
+        key = (namespace, key)
+        canonical = self.canonical_symbols(len(originals))
+
+        found, value = self.get(key)
+        if not found:
+            value = compute(self.rename(expr, originals, canonical), canonical)
+            self.put(key, value)
+
+        if restore is None:
+            return self.rename(value, canonical, originals)
+        return restore(value, originals)
+
+
+simplification_cache = CanonicalCache(maxsize=1024)
+truth_table_cache = CanonicalCache(maxsize=64)
@@ -0,0 +1,355 @@
+from sympy import (
+    And,
+    Equivalent,
+    Implies,
+    Nand,
+    Nor,
+    Not,
+    Or,
+    Symbol,
+    Xor,
+    false,
+    true,
+)
+
+AND = "and"
+OR = "or"
+XOR = "xor"
+IMPLIES = "implies"
+CONVERSE = "converse"
+EQUIVALENT = "equivalent"
+NAND = "nand"
+NOR = "nor"
+DIFFERENCE = "difference"
+
+ASSOCIATIVE_OPERATORS = {AND, OR, XOR}
+
+
+class Variable:
+    __slots__ = ("name",)
+
+    def __init__(self, name):
+        self.name = name
+
+    def __repr__(self):
+        return f"Variable({self.name!r})"
+
+    def to_sympy(self, symbols):
+        if self.name not in symbols:
+            symbols[self.name] = Symbol(self.name)
+        return symbols[self.name]
+
+    def evaluate(self, values, ones):
+        return values[self.name]
+
+
+class Constant:
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __repr__(self):
+        return f"Constant({self.value!r})"
+
+    def to_sympy(self, symbols):
+        return true if self.value else false
+
+    def evaluate(self, values, ones):
+        return ones if self.value else ones ^ ones
+
+
+class Negation:
+    __slots__ = ("operand",)
+
+    def __init__(self, operand):
+        self.operand = operand
+
+    def __repr__(self):
+        return f"Negation({self.operand!r})"
+
+    def to_sympy(self, symbols):
+        return Not(self.operand.to_sympy(symbols))
+
+    def evaluate(self, values, ones):
+        return ones ^ self.operand.evaluate(values, ones)
+
+
+class Operation:
+    __slots__ = ("operator", "operands")
+
+    def __init__(self, operator, operands):
+        self.operator = operator
+        self.operands = operands
+
+    def __repr__(self):
+        return f"Operation({self.operator!r}, {self.operands!r})"
+
+    def to_sympy(self, symbols):
+        args = [operand.to_sympy(symbols) for operand in self.operands]
+        if self.operator == AND:
+            return And(*args)
+        if self.operator == OR:
+            return Or(*args)
+        if self.operator == XOR:
+            return Xor(*args)
+        if self.operator == IMPLIES:
+            return Implies(*args)
+        if self.operator == CONVERSE:
+            return Implies(args[1], args[0])
+        if self.operator == EQUIVALENT:
+            return Equivalent(*args)
+        if self.operator == NAND:
+            return Nand(*args)
+        if self.operator == NOR:
+            return Nor(*args)
+        return And(args[0], Not(args[1]))
+
+    def evaluate(self, values, ones):
+        args = [operand.evaluate(values, ones) for operand in self.operands]
+        if self.operator in ASSOCIATIVE_OPERATORS:
+            result = args[0]
+            for arg in args[1:]:
+                if self.operator == AND:
+                    result = result & arg
+                elif self.operator == OR:
+                    result = result | arg
+                else:
+                    result = result ^ arg
+            return result
+
+        left, right = args
+        if self.operator == IMPLIES:
+            return (ones ^ left) | right
+        if self.operator == CONVERSE:
+            return left | (ones ^ right)
+        if self.operator == EQUIVALENT:
+            return ones ^ left ^ right
+        if self.operator == NAND:
+            return ones ^ (left & right)
+        if self.operator == NOR:
+            return ones ^ (left | right)
+        return left & (ones ^ right)
+
+
+def iter_variables(node):
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, Variable):
+            yield node.name
+        elif isinstance(node, Negation):
+            stack.append(node.operand)
+        elif isinstance(node, Operation):
+            stack.extend(reversed(node.operands))
+
+
+def variables_in_order(node):
+    return list(dict.fromkeys(iter_variables(node)))
+
+
+class Grammar:
+    def __init__(self, infix, prefix, constants, keywords=(), functions=None):
+        self.infix = infix
+        self.prefix = set(prefix)
+        self.constants = constants
+        self.keywords = set(keywords)
+        self.functions = functions or {}
+        self.symbols = sorted(
+            [token for token in (*infix, *prefix, *constants) if not token.isalnum()],
+            key=len,
+            reverse=True,
+        )
+
+
+LOGIC_GRAMMAR = Grammar(
+    infix={
+        "≡": (EQUIVALENT, 1, False),
+        "==": (EQUIVALENT, 1, False),
+        "→": (IMPLIES, 2, True),
+        ">>": (IMPLIES, 2, True),
+        "←": (CONVERSE, 2, False),
+        "<<": (CONVERSE, 2, False),
+        "∨": (OR, 3, False),
+        "|": (OR, 3, False),
+        "↓": (NOR, 3, False),
+        "⊕": (XOR, 4, False),
+        "^": (XOR, 4, False),
+        "∧": (AND, 5, False),
+        "&": (AND, 5, False),
+        "↑": (NAND, 5, False),
+    },
+    prefix=("¬", "~", "!"),
+    constants={"1": True, "0": False, "True": True, "False": False},
+    functions={
+        "And": AND,
+        "Or": OR,
+        "Xor": XOR,
+        "Implies": IMPLIES,
+        "Equivalent": EQUIVALENT,
+        "Nand": NAND,
+        "Nor": NOR,
+        "Not": None,
+    },
+)
+
+SET_GRAMMAR = Grammar(
+    infix={
+        "∪": (OR, 3, False),
+        "|": (OR, 3, False),
+        "∆": (XOR, 4, False),
+        "^": (XOR, 4, False),
+        "∩": (AND, 5, False),
+        "&": (AND, 5, False),
+        "\\": (DIFFERENCE, 5, False),
+    },
+    prefix=("not", "~", "¬"),
+    constants={"U": True, "∅": False, "True": True, "False": False},
+    keywords=("not",),
+)
+
+
+class ExpressionParser:
+    def __init__(self, grammar):
+        self.grammar = grammar
+
+    def tokenize(self, text):
+        tokens = []
+        position = 0
+        length = len(text)
+        symbols = self.grammar.symbols
+
+        while position < length:
+            char = text[position]
+            if char.isspace():
+                position += 1
+            elif char.isalnum() or char == "_":
+                start = position
+                while position < length and (
+                    text[position].isalnum() or text[position] == "_"
+                ):
+                    position += 1
+                tokens.append((text[start:position], start))
+            elif char in "(),":
+                tokens.append((char, position))
+                position += 1
+            else:
+                for symbol in symbols:
+                    if text.startswith(symbol, position):
+                        tokens.append((symbol, position))
+                        position += len(symbol)
+                        break
+                else:
+                    raise ValueError(f"Unexpected character '{char}' at {position}")
+
+        return tokens
+
+    def parse(self, text):
+        self.tokens = self.tokenize(text)
+        self.index = 0
+        if not self.tokens:
+            raise ValueError("Empty expression")
+
+        node = self.parse_expression(0)
+        if self.index < len(self.tokens):
+            token, position = self.tokens[self.index]
+            raise ValueError(f"Unexpected token '{token}' at {position}")
+        return node
+
+    def peek(self):
+        if self.index < len(self.tokens):
+            return self.tokens[self.index][0]
+        return None
+
+    def advance(self):
+        if self.index >= len(self.tokens):
+            raise ValueError("Unexpected end of expression")
+        token = self.tokens[self.index]
+        self.index += 1
+        return token
+
+    def expect(self, expected):
+        token, position = self.advance()
+        if token != expected:
+            raise ValueError(f"Expected '{expected}' at {position}, got '{token}'")
+
+    def parse_expression(self, min_precedence):
+        left = self.parse_prefix()
+        infix = self.grammar.infix
+
+        while self.peek() in infix:
+            operator, precedence, right_associative = infix[self.peek()]
+            if precedence < min_precedence:
+                break
+            self.advance()
+            right = self.parse_expression(
+                precedence if right_associative else precedence + 1
+            )
+            left = self.combine(operator, left, right)
+
+        return left
+
+    @staticmethod
+    def combine(operator, left, right):
+        if operator in ASSOCIATIVE_OPERATORS:
+            if isinstance(left, Operation) and left.operator == operator:
+                left.operands.append(right)
+                return left
+            return Operation(operator, [left, right])
+        return Operation(operator, [left, right])
+
+    def parse_prefix(self):
+        token, position = self.advance()
+        grammar = self.grammar
+
+        if token in grammar.prefix:
+            return Negation(self.parse_prefix())
+        if token == "(":
+            node = self.parse_expression(0)
+            self.expect(")")
+            return node
+        if token in grammar.constants:
+            return Constant(grammar.constants[token])
+        if token in grammar.functions and self.peek() == "(":
+            return self.parse_call(grammar.functions[token])
+        if (token[0].isalpha() or token[0] == "_") and token not in grammar.keywords:
+            return Variable(token)
+
+        raise ValueError(f"Unexpected token '{token}' at {position}")
+
+    def parse_call(self, operator):
+        self.expect("(")
+        operands = [self.parse_expression(0)]
+        while self.peek() == ",":
+            self.advance()
+            operands.append(self.parse_expression(0))
+        self.expect(")")
+
+        if operator is None:
+            if len(operands) != 1:
+                raise ValueError("Not takes exactly one argument")
+            return Negation(operands[0])
+        if len(operands) == 1 and operator in ASSOCIATIVE_OPERATORS:
+            return operands[0]
+        if len(operands) != 2 and operator not in ASSOCIATIVE_OPERATORS:
+            if operator in (NAND, NOR):
+                inner = AND if operator == NAND else OR
+                return Negation(Operation(inner, operands))
+            if operator == EQUIVALENT:
+                return Operation(
+                    AND,
+                    [
+                        Operation(EQUIVALENT, [operands[0], operand])
+                        for operand in operands[1:]
+                    ],
+                )
+            raise ValueError("Implies takes exactly two arguments")
+        return Operation(operator, operands)
+
+
+def parse_logic(text):
+    return ExpressionParser(LOGIC_GRAMMAR).parse(text)
+
+
+def parse_set(text):
+    return ExpressionParser(SET_GRAMMAR).parse(text)
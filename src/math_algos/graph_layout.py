@@ -0,0 +1,294 @@
+import hashlib
+from io import BytesIO
+
+import numpy as np
+
+from .caching import LRUCache
+
+LAYOUTS = ("auto", "circular", "shell", "layered", "force")
+CIRCULAR_LIMIT = 12
+SHELL_LIMIT = 60
+FORCE_ITERATIONS = 50
+LEAF_OCCUPANCY = 2
+LEAF_LIMIT = 16
+MAX_LEVEL = 8
+GRAVITY = 1.0
+
+
+def graph_hash(matrix):
+    digest = hashlib.sha256()
+    for element in matrix.elements:
+        digest.update(str(element).encode())
+        digest.update(b"\0")
+    digest.update(matrix.offsets.tobytes())
+    digest.update(matrix.targets.tobytes())
+    return digest.hexdigest()
+
+
+def normalize(positions):
+    positions = positions - (positions.max(axis=0) + positions.min(axis=0)) / 2
+    extent = np.abs(positions).max()
+    return positions / extent if extent > 0 else positions
+
+
+def circular_layout(size):
+    angles = np.linspace(0, 2 * np.pi, size, endpoint=False) + np.pi / 2
+    if size == 1:
+        return np.zeros((1, 2))
+    return np.column_stack((np.cos(angles), np.sin(angles)))
+
+
+def shell_layout(matrix):
+    degrees = matrix.out_degrees() + matrix.in_degrees()
+    order = np.argsort(-degrees, kind="stable")
+    positions = np.zeros((matrix.size, 2))
+    shell, start = 0, 0
+    while start < matrix.size:
+        capacity = 6 * (shell + 1)
+        members = order[start : start + capacity]
+        angles = np.linspace(0, 2 * np.pi, len(members), endpoint=False) + shell / 2
+        positions[members] = (shell + 1) * np.column_stack(
+            (np.cos(angles), np.sin(angles))
+        )
+        shell, start = shell + 1, start + capacity
+    return normalize(positions)
+
+
+def longest_path_layers(matrix):
+    strict = matrix.without_loops()
+    remaining = strict.in_degrees()
+    layers = np.full(matrix.size, -1)
+    frontier = np.flatnonzero(remaining == 0)
+    depth = 0
+    while len(frontier):
+        layers[frontier] = depth
+        _, successors = strict.compositions(frontier, frontier)
+        remaining -= np.bincount(successors, minlength=matrix.size)
+        frontier = np.flatnonzero((remaining == 0) & (layers < 0))
+        depth += 1
+    return layers if np.all(layers >= 0) else None
+
+
+def layered_layout(matrix, layers=None):
+    if layers is None:
+        layers = longest_path_layers(matrix)
+    if layers is None:
+        raise ValueError("Layered layout requires an acyclic relation")
+
+    strict = matrix.without_loops()
+    sources, targets = strict.sources, strict.targets
+    order = np.argsort(layers[targets], kind="stable")
+    sources, targets = sources[order], targets[order]
+    edge_layers = layers[targets]
+
+    x = np.zeros(matrix.size)
+    width = 1
+    for depth in range(layers.max() + 1 if matrix.size else 0):
+        members = np.flatnonzero(layers == depth)
+        low, high = np.searchsorted(edge_layers, [depth, depth + 1])
+        counts = np.bincount(targets[low:high], minlength=matrix.size)[members]
+        sums = np.bincount(
+            targets[low:high], weights=x[sources[low:high]], minlength=matrix.size
+        )[members]
+        barycenters = np.where(counts > 0, sums / np.maximum(counts, 1), 0)
+        ranks = np.argsort(barycenters, kind="stable")
+        x[members[ranks]] = np.arange(len(members)) - (len(members) - 1) / 2
+        width = max(width, len(members))
+
+    positions = np.column_stack((x / width, -layers / max(layers.max(), 1)))
+    return normalize(positions)
+
+
+def interaction_offsets():
+    table = np.zeros((4, 27, 2), dtype=np.int64)
+    for parity in range(4):
+        bx, by = parity >> 1, parity & 1
+        table[parity] = [
+            (dx, dy)
+            for dx in range(-2 - bx, 4 - bx)
+            for dy in range(-2 - by, 4 - by)
+            if max(abs(dx), abs(dy)) > 1
+        ]
+    return table
+
+
+INTERACTIONS = interaction_offsets()
+NEIGHBORHOOD = [(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1)]
+
+
+def padded_cells(unit, level):
+    cells = 1 << level
+    return np.minimum((unit * cells).astype(np.int64), cells - 1) + 2, cells + 4
+
+
+def cell_moments(x, y, ids, count):
+    mass = np.bincount(ids, minlength=count).astype(float)
+    scale = 1 / np.maximum(mass, 1)
+    center_x = np.bincount(ids, weights=x, minlength=count) * scale
+    center_y = np.bincount(ids, weights=y, minlength=count) * scale
+    return mass, center_x, center_y
+
+
+def far_field(x, y, unit, level):
+    cell, width = padded_cells(unit, level)
+    ids = cell[:, 0] * width + cell[:, 1]
+    mass, center_x, center_y = cell_moments(x, y, ids, width * width)
+
+    cells = 2 << level
+    child = np.minimum((unit * cells).astype(np.int64), cells - 1)
+    occupied, nodes_child = np.unique(
+        child[:, 0] * cells + child[:, 1], return_inverse=True
+    )
+    _, point_x, point_y = cell_moments(x, y, nodes_child, len(occupied))
+    parent_x, parent_y = np.divmod(occupied, cells)
+    parent_x, parent_y = (parent_x >> 1) + 2, (parent_y >> 1) + 2
+
+    shifts = INTERACTIONS[:, :, 0] * width + INTERACTIONS[:, :, 1]
+    parity = (parent_x & 1) << 1 | (parent_y & 1)
+    sources = (parent_x * width + parent_y)[:, None] + shifts.take(parity, axis=0)
+    dx = point_x[:, None] - center_x.take(sources)
+    dy = point_y[:, None] - center_y.take(sources)
+    weight = mass.take(sources) / np.maximum(dx * dx + dy * dy, 1e-9)
+    force_x, force_y = (dx * weight).sum(axis=1), (dy * weight).sum(axis=1)
+    return force_x[nodes_child], force_y[nodes_child]
+
+
+def near_field(x, y, unit, level):
+    cell, width = padded_cells(unit, level)
+    ids = cell[:, 0] * width + cell[:, 1]
+    order = np.argsort(ids, kind="stable")
+    starts = np.searchsorted(ids[order], np.arange(width * width + 1))
+    force_x, force_y = np.zeros(len(x)), np.zeros(len(x))
+    for dx, dy in NEIGHBORHOOD:
+        neighbor = ids + dx * width + dy
+        counts = starts[neighbor + 1] - starts[neighbor]
+        nodes = np.repeat(np.arange(len(x)), counts)
+        offsets = np.repeat(starts[neighbor] - np.cumsum(counts) + counts, counts)
+        others = order[offsets + np.arange(len(nodes))]
+        distinct = nodes != others
+        nodes, others = nodes[distinct], others[distinct]
+        delta_x, delta_y = x[nodes] - x[others], y[nodes] - y[others]
+        weight = 1 / np.maximum(delta_x * delta_x + delta_y * delta_y, 1e-9)
+        force_x += np.bincount(nodes, weights=delta_x * weight, minlength=len(x))
+        force_y += np.bincount(nodes, weights=delta_y * weight, minlength=len(x))
+    return force_x, force_y
+
+
+def leaf_level(unit):
+    level = max(2, int(np.ceil(np.log(len(unit) / LEAF_OCCUPANCY) / np.log(4))))
+    while level < MAX_LEVEL:
+        cell, width = padded_cells(unit, level)
+        occupancy = np.bincount(cell[:, 0] * width + cell[:, 1])
+        if occupancy.max() <= LEAF_LIMIT:
+            break
+        level += 1
+    return level
+
+
+def repulsion(positions):
+    low = positions.min(axis=0)
+    extent = max(float((positions.max(axis=0) - low).max()), 1e-9)
+    unit = (positions - low) / extent
+    x, y = positions[:, 0], positions[:, 1]
+    depth = leaf_level(unit)
+
+    force_x, force_y = near_field(x, y, unit, depth)
+    for level in range(2, depth + 1):
+        far_x, far_y = far_field(x, y, unit, level)
+        force_x += far_x
+        force_y += far_y
+    return np.column_stack((force_x, force_y))
+
+
+def force_layout(matrix, iterations=FORCE_ITERATIONS, seed=0):
+    size = matrix.size
+    if size <= 2:
+        return circular_layout(size) if size else np.zeros((0, 2))
+
+    strict = matrix.without_loops()
+    sources, targets = strict.sources, strict.targets
+    positions = np.random.default_rng(seed).random((size, 2))
+    optimal = 1 / np.sqrt(size)
+
+    for step in range(iterations):
+        forces = optimal**2 * repulsion(positions)
+        forces -= GRAVITY * optimal * (positions - positions.mean(axis=0))
+        delta = positions[sources] - positions[targets]
+        length = np.sqrt((delta**2).sum(axis=1))[:, None]
+        pull = delta * length / optimal
+        for axis in range(2):
+            forces[:, axis] -= np.bincount(
+                sources, weights=pull[:, axis], minlength=size
+            )
+            forces[:, axis] += np.bincount(
+                targets, weights=pull[:, axis], minlength=size
+            )
+
+        temperature = 0.1 * (1 - step / iterations)
+        magnitude = np.maximum(np.sqrt((forces**2).sum(axis=1)), 1e-9)[:, None]
+        positions += forces / magnitude * np.minimum(magnitude, temperature)
+
+    return normalize(positions)
+
+
+def compute_layout(matrix, layout="auto"):
+    if layout not in LAYOUTS:
+        raise ValueError(
+            f"Unknown layout '{layout}', expected one of: {', '.join(LAYOUTS)}"
+        )
+    if layout == "auto":
+        layers = longest_path_layers(matrix) if len(matrix) else None
+        if layers is not None and layers.max() > 0:
+            return layered_layout(matrix, layers)
+        if matrix.size <= CIRCULAR_LIMIT:
+            return circular_layout(matrix.size)
+        if matrix.size <= SHELL_LIMIT:
+            return shell_layout(matrix)
+        return force_layout(matrix)
+    if layout == "circular":
+        return circular_layout(matrix.size)
+    if layout == "shell":
+        return shell_layout(matrix)
+    if layout == "layered":
+        return layered_layout(matrix)
+    return force_layout(matrix)
+
+
+class LayoutCache(LRUCache):
+    def __init__(self, maxsize=64, disk=None):
+        super().__init__(maxsize)
+        self.disk = disk
+        self.disk_hits = 0
+
+    def lookup(self, matrix, layout="auto"):
+        key = (graph_hash(matrix), layout)
+        found, positions = self.get(key)
+        if found:
+            return positions
+
+        positions = self.load(key)
+        if positions is None:
+            positions = compute_layout(matrix, layout)
+            self.store(key, positions)
+        positions.setflags(write=False)
+        self.put(key, positions)
+        return positions
+
+    def load(self, key):
+        data = None if self.disk is None else self.disk.get(":".join(key))
+        if data is None:
+            return None
+        self.disk_hits += 1
+        return np.load(BytesIO(data), allow_pickle=False)
+
+    def store(self, key, positions):
+        if self.disk is not None:
+            buffer = BytesIO()
+            np.save(buffer, positions, allow_pickle=False)
+            self.disk.put(":".join(key), buffer.getvalue())
+
+    def info(self):
+        return {**super().info(), "disk_hits": self.disk_hits}
+
+
+layout_cache = LayoutCache()
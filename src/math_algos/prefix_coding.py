@@ -0,0 +1,234 @@
+from heapq import merge
+
+import numpy as np
+
+from .bit_io import BitWriter, bits_from_string
+
+TABLE_BITS = 10
+TABLE_MASK = (1 << TABLE_BITS) - 1
+DECODE_BLOCK = 1 << 20
+ENCODE_BLOCK = 1 << 16
+MAX_CODE_LENGTH = 32
+CODEBOOK_FORMATS = ("codes", "lengths")
+
+
+def symbols_to_string(symbols, ids):
+    if all(len(symbol) == 1 for symbol in symbols):
+        code_points = np.array([ord(symbol) for symbol in symbols], dtype="<u4")
+        return code_points[ids].tobytes().decode("utf-32-le", "surrogatepass")
+    return "".join(map(symbols.__getitem__, ids.tolist()))
+
+
+def package_merge(weights, max_length):
+    count = len(weights)
+    if count <= 1:
+        return [1] * count
+    if not 1 <= max_length <= MAX_CODE_LENGTH or 1 << max_length < count:
+        raise ValueError(f"{count} symbols do not fit in codes of length {max_length}")
+
+    leaves = sorted((weight, index) for index, weight in enumerate(weights))
+    items = leaves
+    for _ in range(max_length - 1):
+        packages = [
+            (items[i][0] + items[i + 1][0], (items[i], items[i + 1]))
+            for i in range(0, len(items) - 1, 2)
+        ]
+        items = list(merge(leaves, packages, key=lambda item: item[0]))
+
+    lengths = [0] * count
+    stack = items[: 2 * count - 2]
+    while stack:
+        _, payload = stack.pop()
+        if isinstance(payload, tuple):
+            stack.extend(payload)
+        else:
+            lengths[payload] += 1
+    return lengths
+
+
+def canonical_codes(lengths):
+    for symbol, length in lengths.items():
+        if isinstance(length, bool) or not isinstance(length, int):
+            raise ValueError(f"Code length for {symbol!r} must be an integer")
+        if not 1 <= length <= MAX_CODE_LENGTH:
+            raise ValueError(
+                f"Code length for {symbol!r} must be between 1 and {MAX_CODE_LENGTH}"
+            )
+    if sum(1 << MAX_CODE_LENGTH - length for length in lengths.values()) > (
+        1 << MAX_CODE_LENGTH
+    ):
+        raise ValueError("Code lengths do not form a prefix code")
+
+    codes, code, previous = {}, 0, 0
+    for symbol in sorted(lengths, key=lambda symbol: (lengths[symbol], symbol)):
+        code <<= lengths[symbol] - previous
+        previous = lengths[symbol]
+        codes[symbol] = format(code, f"0{previous}b")
+        code += 1
+    return codes
+
+
+def code_lengths(codes):
+    return {symbol: len(code) for symbol, code in codes.items()}
+
+
+def code_points(string):
+    return np.frombuffer(string.encode("utf-32-le", "surrogatepass"), dtype="<u4")
+
+
+def check_code(symbol, code):
+    if not isinstance(code, str) or code.strip("01"):
+        raise ValueError(f"Code for {symbol!r} must be a string of 0 and 1")
+    if not code:
+        raise ValueError(f"Code for {symbol!r} must not be empty")
+
+
+class PrefixEncoder:
+    def __init__(self, codes):
+        for symbol, code in codes.items():
+            check_code(symbol, code)
+        characters = sorted(symbol for symbol in codes if len(symbol) == 1)
+        self.keys = code_points("".join(characters))
+        self.lengths = np.array(
+            [len(codes[char]) for char in characters], dtype=np.int64
+        )
+        self.table = np.zeros((len(characters), max(self.lengths, default=0)), np.uint8)
+        for row, char in enumerate(characters):
+            self.table[row, : self.lengths[row]] = bits_from_string(codes[char])
+
+    def symbol_ids(self, string):
+        points = code_points(string)
+        ids = np.searchsorted(self.keys, points)
+        known = ids < len(self.keys)
+        known[known] = self.keys[ids[known]] == points[known]
+        if not np.all(known):
+            missing = chr(points[np.argmin(known)])
+            raise ValueError(f"Symbol {missing!r} has no code")
+        return ids
+
+    def encode_bits(self, string, writer=None):
+        writer = BitWriter() if writer is None else writer
+        columns = np.arange(self.table.shape[1])
+        for start in range(0, len(string), ENCODE_BLOCK):
+            ids = self.symbol_ids(string[start : start + ENCODE_BLOCK])
+            used = columns < self.lengths[ids][:, None]
+            writer.write_bits(self.table[ids][used])
+        return writer
+
+
+class PrefixDecoder:
+    def __init__(self, codes):
+        self.symbols = []
+        entries = []
+        for symbol, code in codes.items():
+            check_code(symbol, code)
+            entries.append((code, len(self.symbols)))
+            self.symbols.append(symbol)
+
+        self.max_length = max((len(code) for code, _ in entries), default=0)
+        self.min_length = min((len(code) for code, _ in entries), default=0)
+        self.lengths, self.values, self.widths = [], [], []
+        if entries:
+            self.root_width = self.build(entries, 0)
+        self.lengths = np.array(self.lengths, dtype=np.int64)
+        self.values = np.array(self.values, dtype=np.int64)
+        self.widths = np.array(self.widths, dtype=np.int64)
+
+    def build(self, entries, depth):
+        width = min(TABLE_BITS, max(len(code) for code, _ in entries) - depth)
+        offset = len(self.lengths)
+        self.lengths.extend([0] * (1 << width))
+        self.values.extend([0] * (1 << width))
+        self.widths.extend([0] * (1 << width))
+
+        groups = {}
+        for code, symbol in entries:
+            prefix = code[depth : depth + width]
+            if len(code) - depth > width:
+                groups.setdefault(prefix, []).append((code, symbol))
+                continue
+            start = offset + (int(prefix, 2) << width - len(prefix))
+            stop = start + (1 << width - len(prefix))
+            if any(self.lengths[start:stop]) or any(self.widths[start:stop]):
+                raise ValueError(f"Code {code!r} is not prefix-free")
+            self.lengths[start:stop] = [len(prefix)] * (stop - start)
+            self.values[start:stop] = [symbol] * (stop - start)
+
+        for prefix, group in groups.items():
+            index = offset + int(prefix, 2)
+            if self.lengths[index]:
+                raise ValueError(f"Code {group[0][0]!r} is not prefix-free")
+            self.values[index] = len(self.lengths)
+            self.widths[index] = self.build(group, depth + width)
+            self.lengths[index] = width
+        return width
+
+    def windows(self, bits, start, stop):
+        count = stop - start + self.max_length
+        packed = np.zeros((count + 7) // 8 + 3, dtype=np.uint32)
+        data = np.packbits(bits[start : start + count])
+        packed[: len(data)] = data
+        words = packed[:-2] << 16 | packed[1:-1] << 8 | packed[2:]
+        windows = np.empty(len(words) * 8, dtype=np.int64)
+        for offset in range(8):
+            windows[offset::8] = words >> 24 - TABLE_BITS - offset & TABLE_MASK
+        return windows
+
+    def resolve(self, windows, count):
+        index = windows[:count] >> TABLE_BITS - self.root_width
+        lengths, symbols = self.lengths[index], self.values[index]
+        widths = self.widths[index]
+        pending = np.flatnonzero(widths)
+        consumed = lengths[pending]
+        lengths[pending] = 0
+        while len(pending):
+            shift = TABLE_BITS - widths[pending]
+            index = symbols[pending] + (windows[pending + consumed] >> shift)
+            step, inner = self.lengths[index], self.widths[index]
+            found = (inner == 0) & (step > 0)
+            lengths[pending[found]] = consumed[found] + step[found]
+            symbols[pending] = self.values[index]
+            nested = inner > 0
+            widths[pending[nested]] = inner[nested]
+            pending, consumed = pending[nested], consumed[nested] + step[nested]
+        return lengths, symbols
+
+    def decode_bits(self, bits):
+        total = len(bits)
+        if not total:
+            return ""
+        if not self.max_length:
+            raise ValueError("Cannot decode bits without any codes")
+
+        output = np.empty(total // self.min_length + 1, dtype=np.int64)
+        count, position = 0, 0
+        for start in range(0, total, DECODE_BLOCK):
+            stop = min(start + DECODE_BLOCK, total)
+            if position >= stop:
+                continue
+            lengths, symbols = self.resolve(
+                self.windows(bits, start, stop), stop - start
+            )
+            jumps = np.arange(stop - start) + lengths
+            jumps[lengths == 0] = total - start + 1
+
+            following = memoryview(jumps)
+            visited = []
+            append = visited.append
+            position -= start
+            while position < stop - start:
+                append(position)
+                position = following[position]
+            visited = np.array(visited, dtype=np.int64)
+            output[count : count + len(visited)] = symbols[visited]
+            count += len(visited)
+            position += start
+            if position > total:
+                last = visited[-1]
+                if lengths[last] == 0:
+                    raise ValueError(f"Invalid code at bit {start + last}")
+                raise ValueError(f"Truncated code at bit {start + last}")
+        return symbols_to_string(self.symbols, output[:count])
+
+    def decode(self, encoded_string):
+        return self.decode_bits(bits_from_string(encoded_string))
@@ -0,0 +1,189 @@
+from bisect import bisect_right
+from collections import Counter
+
+ARITHMETIC_ENGINES = ("decimal", "range")
+RANGE_TOP = 1 << 32
+RANGE_BOTTOM = 1 << 24
+RANGE_MASK = RANGE_TOP - 1
+LOW_MASK = RANGE_BOTTOM - 1
+CARRY_LIMIT = 0xFF << 24
+MAX_TOTAL = 1 << 16
+HEADER_BYTES = 5
+
+
+class FrequencyTable:
+    def __init__(self, frequencies):
+        self.symbols = sorted(symbol for symbol, count in frequencies.items() if count)
+        counts = [int(frequencies[symbol]) for symbol in self.symbols]
+        if any(count < 0 for count in counts):
+            raise ValueError("Symbol frequencies must be non-negative integers")
+        if len(counts) > MAX_TOTAL:
+            raise ValueError(f"Alphabet is limited to {MAX_TOTAL} symbols")
+
+        total = sum(counts)
+        if total > MAX_TOTAL:
+            budget = MAX_TOTAL - len(counts)
+            counts = [max(1, count * budget // total) for count in counts]
+            total = sum(counts)
+
+        self.frequencies = counts
+        self.total = total
+        self.starts = []
+        start = 0
+        for count in counts:
+            self.starts.append(start)
+            start += count
+        self.intervals = {
+            symbol: (start, count)
+            for symbol, start, count in zip(self.symbols, self.starts, counts)
+        }
+
+    @classmethod
+    def from_string(cls, string):
+        return cls(Counter(string))
+
+    def to_dict(self):
+        return dict(zip(self.symbols, self.frequencies))
+
+
+class RangeEncoder:
+    def __init__(self):
+        self.low = 0
+        self.range = RANGE_MASK
+        self.cache = 0
+        self.cache_size = 1
+        self.output = bytearray()
+
+    def encode(self, symbols, table):
+        intervals, total = table.intervals, table.total
+        low, width = self.low, self.range
+        cache, cache_size, output = self.cache, self.cache_size, self.output
+        for symbol in symbols:
+            try:
+                start, size = intervals[symbol]
+            except KeyError:
+                raise ValueError(f"Symbol {symbol!r} is not in the frequency table")
+            width //= total
+            low += start * width
+            width *= size
+            while width < RANGE_BOTTOM:
+                width <<= 8
+                if low < CARRY_LIMIT or low >= RANGE_TOP:
+                    carry = low >> 32
+                    output.append((cache + carry) & 0xFF)
+                    if cache_size > 1:
+                        output.extend(bytes((0xFF + carry & 0xFF,)) * (cache_size - 1))
+                    cache, cache_size = (low >> 24) & 0xFF, 0
+                cache_size += 1
+                low = (low & LOW_MASK) << 8
+        self.low, self.range = low, width
+        self.cache, self.cache_size = cache, cache_size
+        return self
+
+    def encode_interval(self, start, size, total):
+        self.range //= total
+        self.low += start * self.range
+        self.range *= size
+        while self.range < RANGE_BOTTOM:
+            self.range <<= 8
+            self.shift_low()
+
+    def shift_low(self):
+        if self.low < CARRY_LIMIT or self.low >= RANGE_TOP:
+            carry = self.low >> 32
+            self.output.append((self.cache + carry) & 0xFF)
+            filler = bytes((0xFF + carry & 0xFF,))
+            self.output.extend(filler * (self.cache_size - 1))
+            self.cache, self.cache_size = (self.low >> 24) & 0xFF, 0
+        self.cache_size += 1
+        self.low = (self.low & LOW_MASK) << 8
+
+    def take(self):
+        chunk = bytes(self.output)
+        self.output.clear()
+        return chunk
+
+    def finish(self):
+        for _ in range(HEADER_BYTES):
+            self.shift_low()
+        return self.take()
+
+
+class RangeDecoder:
+    def __init__(self, data):
+        self.data = bytearray(data)
+        self.position = HEADER_BYTES
+        self.range = RANGE_MASK
+        header = self.data[:HEADER_BYTES].ljust(HEADER_BYTES, b"\0")
+        self.code = int.from_bytes(header, "big") & RANGE_MASK
+
+    def extend(self, chunk):
+        del self.data[: self.position]
+        self.position = 0
+        self.data.extend(chunk)
+
+    def available(self):
+        return len(self.data) - self.position
+
+    def target(self, total):
+        self.range //= total
+        value = self.code // self.range
+        return value if value < total else total - 1
+
+    def consume(self, start, size):
+        self.code -= start * self.range
+        self.range *= size
+        while self.range < RANGE_BOTTOM:
+            self.range <<= 8
+            byte = self.data[self.position] if self.position < len(self.data) else 0
+            self.code = (self.code << 8 | byte) & RANGE_MASK
+            self.position += 1
+
+    def decode(self, table, count):
+        if not table.total:
+            if count:
+                raise ValueError("Cannot decode symbols with an empty frequency table")
+            return []
+        symbols, starts, frequencies = table.symbols, table.starts, table.frequencies
+        total, last = table.total, table.total - 1
+        data, position = self.data, self.position
+        code, width = self.code, self.range
+        end = len(data)
+        result = []
+        append = result.append
+        for i in range(count):
+            width //= total
+            value = code // width
+            index = bisect_right(starts, value if value < last else last) - 1
+            append(symbols[index])
+            code -= starts[index] * width
+            width *= frequencies[index]
+            while width < RANGE_BOTTOM:
+                width <<= 8
+                if position < end:
+                    byte = data[position]
+                elif position < end + HEADER_BYTES:
+                    byte = 0
+                else:
+                    raise ValueError(
+                        f"Encoded data ended after {i + 1} of {count} symbols"
+                    )
+                code = (code << 8 | byte) & RANGE_MASK
+                position += 1
+        self.code, self.range, self.position = code, width, position
+        return result
+
+
+class RangeCoder:
+    def __init__(self, table):
+        self.table = table
+
+    @classmethod
+    def from_string(cls, string):
+        return cls(FrequencyTable.from_string(string))
+
+    def encode(self, string):
+        return RangeEncoder().encode(string, self.table).finish()
+
+    def decode(self, data, length):
+        return "".join(RangeDecoder(data).decode(self.table, length))
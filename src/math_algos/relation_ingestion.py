@@ -0,0 +1,155 @@
+import codecs
+import csv
+import io
+import json
+from array import array
+
+import numpy as np
+
+from .binary_relations import RelationMatrix, natural_key
+
+RELATION_FORMATS = ("json", "csv", "tsv", "int32")
+READ_CHUNK = 1 << 16
+INT32_PAIR = np.dtype("<i4")
+
+
+class RelationReader:
+    def __init__(self, set_of_elements=None):
+        self.index = {}
+        self.elements = []
+        self.sources = array("i")
+        self.targets = array("i")
+        for element in sorted(set_of_elements or (), key=natural_key):
+            self.intern(element)
+
+    def intern(self, element):
+        position = self.index.get(element)
+        if position is None:
+            position = self.index[element] = len(self.elements)
+            self.elements.append(element)
+        return position
+
+    def add_pair(self, first, second):
+        self.sources.append(self.intern(first))
+        self.targets.append(self.intern(second))
+
+    def read(self, stream, input_format, header=False):
+        if input_format == "json":
+            self.read_json(stream)
+        elif input_format == "csv":
+            self.read_delimited(stream, ",", header)
+        elif input_format == "tsv":
+            self.read_delimited(stream, "\t", header)
+        elif input_format == "int32":
+            self.read_int32(stream)
+        else:
+            raise ValueError(
+                f"Unknown format '{input_format}', expected one of: "
+                f"{', '.join(RELATION_FORMATS)}"
+            )
+        return self
+
+    def read_delimited(self, stream, delimiter, header=False):
+        text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+        try:
+            rows = csv.reader(text, delimiter=delimiter)
+            if header:
+                next(rows, None)
+            for row in rows:
+                if not row or not "".join(row).strip():
+                    continue
+                if len(row) < 2:
+                    raise ValueError(
+                        f"Line {rows.line_num}: expected two columns, got {len(row)}"
+                    )
+                self.add_pair(row[0].strip(), row[1].strip())
+        finally:
+            text.detach()
+
+    def read_json(self, stream):
+        decoder = json.JSONDecoder()
+        text = codecs.getincrementaldecoder("utf-8")()
+        buffer, position = "", 0
+        opened = closed = False
+        exhausted = False
+
+        while not closed:
+            while position < len(buffer) and buffer[position] in " \t\r\n,":
+                position += 1
+            if position == len(buffer) or (opened and buffer[position] == "["):
+                if position == len(buffer) and exhausted:
+                    raise ValueError("Unexpected end of JSON pair array")
+                if position < len(buffer):
+                    try:
+                        pair, end = decoder.raw_decode(buffer, position)
+                    except json.JSONDecodeError:
+                        if exhausted:
+                            raise ValueError("Malformed JSON pair array")
+                    else:
+                        self.add_json_pair(pair)
+                        position = end
+                        continue
+
+                chunk = stream.read(READ_CHUNK)
+                exhausted = not chunk
+                buffer = buffer[position:] + text.decode(chunk, final=exhausted)
+                position = 0
+            elif not opened and buffer[position] == "[":
+                opened = True
+                position += 1
+            elif opened and buffer[position] == "]":
+                closed = True
+            else:
+                raise ValueError(
+                    f"Expected a JSON array of pairs, got {buffer[position]!r}"
+                )
+
+    def add_json_pair(self, pair):
+        if not isinstance(pair, list) or len(pair) != 2:
+            raise ValueError(f"Expected a pair of two elements, got {pair!r}")
+        first, second = pair
+        self.add_pair(json_element(first), json_element(second))
+
+    def read_int32(self, stream):
+        remainder = b""
+        while True:
+            chunk = stream.read(READ_CHUNK)
+            if not chunk:
+                break
+            data = remainder + chunk
+            usable = len(data) - len(data) % (2 * INT32_PAIR.itemsize)
+            remainder = data[usable:]
+            self.add_ids(np.frombuffer(data[:usable], dtype=INT32_PAIR))
+        if remainder:
+            raise ValueError("Binary pair file length must be a multiple of 8 bytes")
+
+    def add_ids(self, values):
+        if not len(values):
+            return
+        distinct, inverse = np.unique(values, return_inverse=True)
+        positions = np.fromiter(
+            (self.intern(str(value)) for value in distinct.tolist()),
+            dtype=np.int32,
+            count=len(distinct),
+        )
+        ids = positions[inverse.reshape(-1)]
+        self.sources.frombytes(np.ascontiguousarray(ids[0::2]).tobytes())
+        self.targets.frombytes(np.ascontiguousarray(ids[1::2]).tobytes())
+
+    def matrix(self):
+        order = sorted(
+            range(len(self.elements)), key=lambda i: natural_key(self.elements[i])
+        )
+        ranks = np.empty(len(order), dtype=np.int32)
+        ranks[order] = np.arange(len(order), dtype=np.int32)
+        return RelationMatrix(
+            [self.elements[position] for position in order],
+            ranks[np.frombuffer(self.sources, dtype=np.int32)],
+            ranks[np.frombuffer(self.targets, dtype=np.int32)],
+        )
+
+
+def json_element(value):
+    if isinstance(value, bool) or not isinstance(value, (str, int, float)):
+        raise ValueError(f"Pair elements must be strings or numbers, got {value!r}")
+    return value if isinstance(value, str) else str(value)
@@ -0,0 +1,122 @@
+import numpy as np
+
+from .expression_parser import parse_set, variables_in_order
+
+POPCOUNT = np.array([bin(byte).count("1") for byte in range(256)], dtype=np.int64)
+NUMERIC_KINDS = "biuf"
+
+
+class SetEvaluator:
+    def __init__(self, sets, universe=None):
+        self.names = list(sets)
+        collections = [list(elements) for elements in sets.values()]
+        if universe is not None:
+            universe = list(universe)
+
+        interned = self.intern_arrays(collections, universe)
+        if interned is None:
+            interned = self.intern_objects(collections, universe)
+        self.universe, indices = interned
+
+        self.size = len(self.universe)
+        self.ones = self.pack(np.arange(self.size))
+        self.bitsets = {
+            name: self.pack(positions) for name, positions in zip(self.names, indices)
+        }
+
+    @staticmethod
+    def as_array(elements):
+        array = np.asarray(elements)
+        if array.ndim != 1 and len(elements):
+            return None
+        if array.dtype.kind in NUMERIC_KINDS:
+            return array
+        if array.dtype.kind == "U" and all(isinstance(item, str) for item in elements):
+            return array
+        return None
+
+    def intern_arrays(self, collections, universe):
+        candidates = collections + ([universe] if universe is not None else [])
+        arrays = [self.as_array(elements) for elements in candidates]
+        filled = [array for array in arrays if array is not None and len(array)]
+        if any(array is None for array in arrays):
+            return None
+        if len({array.dtype.kind in NUMERIC_KINDS for array in filled}) > 1:
+            return None
+
+        if not filled:
+            return np.array([]), [np.array([], dtype=np.int64) for _ in collections]
+
+        arrays = [
+            array if len(array) else np.empty(0, dtype=filled[0].dtype)
+            for array in arrays
+        ]
+        domain, inverse = np.unique(np.concatenate(arrays), return_inverse=True)
+        boundaries = np.cumsum([len(array) for array in arrays])[:-1]
+        indices = np.split(inverse.reshape(-1), boundaries)
+        if universe is None:
+            return domain, indices
+
+        allowed = np.zeros(len(domain), dtype=bool)
+        allowed[indices.pop()] = True
+        for name, positions in zip(self.names, indices):
+            outside = ~allowed[positions]
+            if np.any(outside):
+                missing = domain[positions[np.argmax(outside)]].item()
+                raise ValueError(f"Element {missing!r} of set {name} is not in U")
+        return domain, indices
+
+    def intern_objects(self, collections, universe):
+        positions = {}
+        domain = []
+        if universe is not None:
+            for element in universe:
+                if element not in positions:
+                    positions[element] = len(domain)
+                    domain.append(element)
+
+        indices = []
+        for name, elements in zip(self.names, collections):
+            for element in elements:
+                if element not in positions:
+                    if universe is not None:
+                        raise ValueError(
+                            f"Element {element!r} of set {name} is not in U"
+                        )
+                    positions[element] = len(domain)
+                    domain.append(element)
+            indices.append(
+                np.fromiter(
+                    (positions[element] for element in elements),
+                    dtype=np.int64,
+                    count=len(elements),
+                )
+            )
+        return domain, indices
+
+    def pack(self, positions):
+        bits = np.zeros(self.size, dtype=bool)
+        bits[positions] = True
+        return np.packbits(bits, bitorder="little")
+
+    def evaluate(self, expression):
+        tree = parse_set(expression)
+        unknown = [
+            name for name in variables_in_order(tree) if name not in self.bitsets
+        ]
+        if unknown:
+            raise ValueError(f"Unknown sets: {', '.join(unknown)}")
+        return tree.evaluate(self.bitsets, self.ones)
+
+    @staticmethod
+    def cardinality(bitset):
+        return int(POPCOUNT[bitset].sum())
+
+    def members(self, bitset, start=0, limit=None):
+        bits = np.unpackbits(bitset, count=self.size, bitorder="little")
+        positions = np.flatnonzero(bits)[start:]
+        if limit is not None:
+            positions = positions[:limit]
+        if isinstance(self.universe, np.ndarray):
+            return self.universe[positions].tolist()
+        return [self.universe[position] for position in positions.tolist()]
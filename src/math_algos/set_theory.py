@@ -1,20 +1,24 @@
+import asyncio
+import json
 import re
-from urllib.parse import quote
+from functools import lru_cache
 
-import requests
-from sympy import simplify_logic, symbols
-from sympy.parsing.sympy_parser import (
-    implicit_multiplication_application,
-    parse_expr,
-    standard_transformations,
-)
+import aiohttp
+from sympy import simplify_logic
+
+from .caching import DiskCache
+from .expression_cache import simplification_cache
+from .expression_parser import parse_set, variables_in_order
+
+MAX_REGION_SETS = 24
+
+
+class UpstreamError(Exception):
+    pass
 
 
 class SetSimplifier:
     def __init__(self):
-        self.transformations = standard_transformations + (
-            implicit_multiplication_application,
-        )
         self.replacements = {
             "∩": "&",
             "∪": "|",
@@ -40,16 +44,18 @@ class SetSimplifier:
             input_expr = input_expr.replace(old, new)
         return input_expr
 
-    def simplify_expression(self, expr_str):
-        expr_str = self.transform(expr_str)
+    def parse_expression(self, expr_str):
+        return parse_set(expr_str).to_sympy({})
 
-        all_symbols = set(re.findall(r"\b[A-Za-z]+\b", expr_str))
-        symbols_dict = {s: symbols(s) for s in all_symbols}
-
-        expr = parse_expr(
-            expr_str, local_dict=symbols_dict, transformations=self.transformations
+    def simplify_expression(self, expr_str):
+        expr = self.parse_expression(expr_str)
+        simplified_expr = simplification_cache.lookup(
+            "set",
+            expr,
+            lambda canonical_expr, _: simplify_logic(
+                canonical_expr, form="dnf", force=True
+            ),
         )
-        simplified_expr = simplify_logic(expr, form="dnf", force=True)
 
         return self.reverse_transform(simplified_expr)
 
@@ -62,30 +68,175 @@ class SetSimplifier:
         return reversed_str
 
 
-class VennDiagramBuilder:
-    def __init__(self, api_key):
-        self.api_key = api_key
-        self.simplifier = SetSimplifier()
+@lru_cache(maxsize=MAX_REGION_SETS + 1)
+def region_masks(count):
+    region_count = 1 << count
+    masks = []
+    for index in range(count):
+        period = 1 << (count - index)
+        mask = ((1 << (period // 2)) - 1) << (period // 2)
+        while period < region_count:
+            mask |= mask << period
+            period <<= 1
+        masks.append(mask)
+    return masks, (1 << region_count) - 1
+
+
+class SetRelations:
+    def __init__(self, first_expression, second_expression):
+        self.trees = [parse_set(first_expression), parse_set(second_expression)]
+        self.sets = sorted(
+            {name for tree in self.trees for name in variables_in_order(tree)}
+        )
+        if len(self.sets) > MAX_REGION_SETS:
+            raise ValueError(
+                f"At most {MAX_REGION_SETS} sets are supported, got {len(self.sets)}"
+            )
+
+        masks, ones = region_masks(len(self.sets))
+        values = dict(zip(self.sets, masks))
+        self.first, self.second = (tree.evaluate(values, ones) for tree in self.trees)
+
+    def region(self, difference):
+        if not difference:
+            return None
+        index = (difference & -difference).bit_length() - 1
+        count = len(self.sets)
+        return {
+            "sets": {
+                name: bool(index >> (count - 1 - position) & 1)
+                for position, name in enumerate(self.sets)
+            },
+            "in_first": bool(self.first >> index & 1),
+            "in_second": bool(self.second >> index & 1),
+        }
+
+    def equivalence(self):
+        difference = self.first ^ self.second
+        return {"equivalent": not difference, "counterexample": self.region(difference)}
+
+    def inclusion(self):
+        difference = self.first & ~self.second
+        return {"subset": not difference, "counterexample": self.region(difference)}
+
 
-    def build_diagram(self, expression):
-        simplified_expr = self.simplifier.simplify_expression(expression)
-        transformed_expr = self.simplifier.reverse_transform(simplified_expr)
+class DiagramCache(DiskCache):
+    suffix = ".png"
 
-        venn_query = f"Venn diagram of {transformed_expr}"
 
-        encoded_query = quote(venn_query)
+class VennDiagramBuilder:
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+    def __init__(
+        self,
+        api_key,
+        base_url="http://api.wolframalpha.com",
+        cache=None,
+        max_connections=8,
+        max_concurrency=4,
+        retries=3,
+        backoff=0.5,
+        timeout=10,
+        simplify=None,
+    ):
+        self.api_key = api_key
+        self.base_url = base_url.rstrip("/")
+        self.cache = cache
+        self.max_connections = max_connections
+        self.max_concurrency = max_concurrency
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.simplifier = SetSimplifier()
+        self.simplify_job = simplify
+        self.session = None
+        self.semaphore = None
+        self.inflight = {}
+
+    async def get_session(self):
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_connections),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+            self.semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self.session
+
+    async def close(self):
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def request(self, url, params=None):
+        session = await self.get_session()
+        for attempt in range(self.retries + 1):
+            try:
+                async with self.semaphore:
+                    async with session.get(url, params=params) as response:
+                        if response.status == 200:
+                            return await response.read(), response.content_type
+                        if response.status not in self.RETRY_STATUSES:
+                            raise UpstreamError(
+                                f"Upstream request failed with status {response.status}"
+                            )
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt == self.retries:
+                    raise UpstreamError("Upstream request failed") from e
+            if attempt < self.retries:
+                await asyncio.sleep(self.backoff * 2**attempt)
+        raise UpstreamError(f"Upstream request failed after {self.retries} retries")
+
+    async def simplify(self, expression):
+        if self.simplify_job is not None:
+            return await self.simplify_job(expression)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, self.simplifier.simplify_expression, expression
+        )
 
-        query = f"http://api.wolframalpha.com/v2/query?input={encoded_query}&format=image&output=JSON&appid={self.api_key}"
+    async def build_diagram(self, expression):
+        return await self.query_diagram_url(await self.simplify(expression))
+
+    async def query_diagram_url(self, simplified_expr):
+        venn_query = f"Venn diagram of {simplified_expr}"
+        body, _ = await self.request(
+            f"{self.base_url}/v2/query",
+            params={
+                "input": venn_query,
+                "format": "image",
+                "output": "JSON",
+                "appid": self.api_key,
+            },
+        )
 
-        response = requests.get(query)
-        if response.status_code == 200:
-            data = response.json()
-            if "pods" in data["queryresult"]:
-                for pod in data["queryresult"]["pods"]:
-                    if "Venn diagram" in pod["title"]:
-                        return pod["subpods"][0]["img"]["src"]
-                raise ValueError("Error while collecting an image")
-            else:
-                raise ValueError("Error with data")
-        else:
-            raise ValueError("Error with request")
+        try:
+            data = json.loads(body)
+            pods = data["queryresult"].get("pods")
+            if pods is None:
+                raise UpstreamError("Error with data")
+            for pod in pods:
+                if "Venn diagram" in pod["title"]:
+                    return pod["subpods"][0]["img"]["src"]
+        except (ValueError, KeyError, IndexError, TypeError) as e:
+            raise UpstreamError("Error with data") from e
+        raise UpstreamError("Error while collecting an image")
+
+    async def fetch_diagram(self, expression):
+        key = await self.simplify(expression)
+        if key not in self.inflight:
+            task = asyncio.ensure_future(self.download(key))
+            self.inflight[key] = task
+            task.add_done_callback(lambda _: self.inflight.pop(key, None))
+        return await asyncio.shield(self.inflight[key])
+
+    async def download(self, key):
+        loop = asyncio.get_running_loop()
+        if self.cache is not None:
+            image = await loop.run_in_executor(None, self.cache.get, key)
+            if image is not None:
+                return image
+
+        image, _ = await self.request(await self.query_diagram_url(key))
+        if self.cache is not None:
+            await loop.run_in_executor(None, self.cache.put, key, image)
+        return image
@@ -0,0 +1,186 @@
+from functools import lru_cache
+from io import BytesIO
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+from .expression_parser import parse_set, variables_in_order
+from .set_theory import region_masks
+
+CANVAS_SIZE = 400
+MAX_SETS = 5
+VENN_FORMATS = ("png", "svg")
+
+SHADE_COLOR = (120, 170, 230)
+BACKGROUND_COLOR = (255, 255, 255)
+OUTLINE_COLOR = (40, 40, 40)
+
+SHAPES = {
+    1: [(0.5, 0.5, 0.3, 0.3, 0)],
+    2: [(0.38, 0.5, 0.25, 0.25, 0), (0.62, 0.5, 0.25, 0.25, 0)],
+    3: [
+        (0.5, 0.38, 0.23, 0.23, 0),
+        (0.38, 0.6, 0.23, 0.23, 0),
+        (0.62, 0.6, 0.23, 0.23, 0),
+    ],
+    4: [
+        (0.395, 0.536, 0.354, 0.204, 37.4),
+        (0.484, 0.443, 0.354, 0.204, 37.4),
+        (0.516, 0.443, 0.354, 0.204, -37.4),
+        (0.605, 0.536, 0.354, 0.204, -37.4),
+    ],
+    5: [
+        (0.541, 0.585, 0.397, 0.243, 80.6),
+        (0.451, 0.579, 0.397, 0.243, 152.6),
+        (0.429, 0.491, 0.397, 0.243, 44.6),
+        (0.505, 0.443, 0.397, 0.243, 116.6),
+        (0.575, 0.501, 0.397, 0.243, 8.6),
+    ],
+}
+
+
+def scaled_shapes(count):
+    return [
+        (
+            x * CANVAS_SIZE,
+            y * CANVAS_SIZE,
+            rx * CANVAS_SIZE,
+            ry * CANVAS_SIZE,
+            angle,
+        )
+        for x, y, rx, ry, angle in SHAPES[count]
+    ]
+
+
+@lru_cache(maxsize=None)
+def region_geometry(count):
+    y, x = np.mgrid[0:CANVAS_SIZE, 0:CANVAS_SIZE] + 0.5
+    regions = np.zeros((CANVAS_SIZE, CANVAS_SIZE), dtype=np.uint8)
+    for index, (cx, cy, rx, ry, angle) in enumerate(scaled_shapes(count)):
+        theta = np.radians(angle)
+        dx, dy = x - cx, y - cy
+        u = dx * np.cos(theta) + dy * np.sin(theta)
+        v = -dx * np.sin(theta) + dy * np.cos(theta)
+        inside = (u / rx) ** 2 + (v / ry) ** 2 <= 1
+        regions |= inside.astype(np.uint8) << (count - 1 - index)
+
+    outline = np.zeros_like(regions, dtype=bool)
+    outline[:, 1:] |= regions[:, 1:] != regions[:, :-1]
+    outline[1:, :] |= regions[1:, :] != regions[:-1, :]
+    outline[[0, -1], :] = True
+    outline[:, [0, -1]] = True
+
+    labels = []
+    for index in range(count):
+        ys, xs = np.nonzero(regions == 1 << (count - 1 - index))
+        nearest = np.argmin((xs - np.median(xs)) ** 2 + (ys - np.median(ys)) ** 2)
+        labels.append((int(xs[nearest]), int(ys[nearest])))
+
+    regions.setflags(write=False)
+    outline.setflags(write=False)
+    return regions, outline, labels
+
+
+class VennDiagramRenderer:
+    def __init__(self, expression):
+        self.tree = parse_set(expression)
+        self.sets = sorted(variables_in_order(self.tree))
+        if len(self.sets) > MAX_SETS:
+            raise ValueError(
+                f"Venn diagrams support at most {MAX_SETS} sets, got {len(self.sets)}"
+            )
+
+    def shaded_regions(self):
+        count = max(len(self.sets), 1)
+        region_count = 1 << count
+        masks, ones = region_masks(count)
+        shaded = self.tree.evaluate(dict(zip(self.sets, masks)), ones)
+        return np.array(
+            [bool(shaded >> region & 1) for region in range(region_count)], dtype=bool
+        )
+
+    def render(self, output_format="png"):
+        if output_format == "png":
+            return self.render_png()
+        if output_format == "svg":
+            return self.render_svg()
+        raise ValueError(
+            f"Unknown format '{output_format}', expected one of: "
+            f"{', '.join(VENN_FORMATS)}"
+        )
+
+    def labels(self):
+        count = max(len(self.sets), 1)
+        _, _, positions = region_geometry(count)
+        names = self.sets or [""]
+        return list(zip(names, positions))
+
+    def render_png(self):
+        regions, outline, _ = region_geometry(max(len(self.sets), 1))
+        palette = np.where(
+            self.shaded_regions()[:, None], SHADE_COLOR, BACKGROUND_COLOR
+        ).astype(np.uint8)
+        pixels = palette[regions]
+        pixels[outline] = OUTLINE_COLOR
+
+        image = Image.fromarray(pixels)
+        draw = ImageDraw.Draw(image)
+        draw.text((8, 6), "U", fill=OUTLINE_COLOR)
+        for name, position in self.labels():
+            draw.text(position, name, fill=OUTLINE_COLOR, anchor="mm")
+
+        buffer = BytesIO()
+        image.save(buffer, format="png")
+        buffer.seek(0)
+        return buffer
+
+    def render_svg(self):
+        count = max(len(self.sets), 1)
+        shapes = scaled_shapes(count)
+        ellipses = [
+            f'<ellipse cx="{cx:.1f}" cy="{cy:.1f}" rx="{rx:.1f}" ry="{ry:.1f}" '
+            f'transform="rotate({angle} {cx:.1f} {cy:.1f})"'
+            for cx, cy, rx, ry, angle in shapes
+        ]
+        fill = "rgb({},{},{})".format(*SHADE_COLOR)
+        outline = "rgb({},{},{})".format(*OUTLINE_COLOR)
+        size = CANVAS_SIZE
+
+        definitions = [
+            f'<clipPath id="s{index}">{ellipse}/></clipPath>'
+            for index, ellipse in enumerate(ellipses)
+        ]
+        body = []
+        for region in np.flatnonzero(self.shaded_regions()).tolist():
+            inside = [
+                index for index in range(count) if region >> (count - 1 - index) & 1
+            ]
+            outside = [index for index in range(count) if index not in inside]
+            definitions.append(
+                f'<mask id="r{region}"><rect width="{size}" height="{size}" '
+                f'fill="white"/>'
+                + "".join(f'{ellipses[index]} fill="black"/>' for index in outside)
+                + "</mask>"
+            )
+            element = f'<rect width="{size}" height="{size}" fill="{fill}"/>'
+            for index in inside:
+                element = f'<g clip-path="url(#s{index})">{element}</g>'
+            body.append(f'<g mask="url(#r{region})">{element}</g>')
+
+        body += [f'{ellipse} fill="none" stroke="{outline}"/>' for ellipse in ellipses]
+        body.append(
+            f'<rect width="{size}" height="{size}" fill="none" stroke="{outline}"/>'
+        )
+        body.append(f'<text x="8" y="18" fill="{outline}">U</text>')
+        for name, (x, y) in self.labels():
+            body.append(
+                f'<text x="{x}" y="{y}" fill="{outline}" text-anchor="middle" '
+                f'dominant-baseline="middle">{name}</text>'
+            )
+
+        return (
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{size}" height="{size}" '
+            f'viewBox="0 0 {size} {size}"><rect width="{size}" height="{size}" '
+            'fill="white"/>'
+            f"<defs>{''.join(definitions)}</defs>{''.join(body)}</svg>"
+        )
@@ -0,0 +1,61 @@
+import unittest
+from itertools import product
+
+from src.math_algos.bdd import BDD, FALSE, TRUE, order_variables
+from src.math_algos.expression_parser import parse_logic
+
+
+def build(expression, heuristic="appearance"):
+    tree = parse_logic(expression)
+    manager = BDD(order_variables([tree], heuristic))
+    return manager, manager.build(tree), tree
+
+
+class TestBDD(unittest.TestCase):
+    def test_count_matches_enumeration(self):
+        for expression in (
+            "(a → b) ⊕ (c ↑ d)",
+            "a ≡ b ≡ c",
+            "(a ∨ b) ∧ ¬(c ↓ d) ← a",
+            "a ∧ ¬a",
+            "a ∨ ¬a",
+        ):
+            for heuristic in ("appearance", "alphabetical", "frequency"):
+                manager, root, tree = build(expression, heuristic)
+                expected = sum(
+                    bool(tree.evaluate(dict(zip(manager.variables, row)), True))
+                    for row in product([False, True], repeat=len(manager.variables))
+                )
+                self.assertEqual(manager.count(root), expected)
+                self.assertEqual(len(list(manager.iter_minterms(root))), expected)
+
+    def test_equivalence(self):
+        tree = parse_logic("a → (b ∧ c)")
+        other = parse_logic("(¬a ∨ b) ∧ (c ∨ ¬a)")
+        manager = BDD(order_variables([tree, other]))
+        self.assertTrue(manager.equivalent(manager.build(tree), manager.build(other)))
+
+    def test_restrict(self):
+        manager, root, _ = build("a ∧ b ∨ c")
+        self.assertEqual(manager.restrict(root, {"c": True}), TRUE)
+        self.assertEqual(manager.restrict(root, {"a": False, "c": False}), FALSE)
+        self.assertEqual(
+            manager.restrict(root, {"a": True, "c": False}), manager.var("b")
+        )
+
+    def test_satisfy_one(self):
+        manager, root, tree = build("a ∧ ¬b ∧ c")
+        self.assertEqual(manager.satisfy_one(root), {"a": True, "b": False, "c": True})
+        self.assertIsNone(manager.satisfy_one(FALSE))
+
+    def test_sixty_variables(self):
+        expression = " ∨ ".join(f"(x{index} ∧ y{index})" for index in range(30))
+        manager, root, _ = build(expression)
+        self.assertEqual(manager.count(root), 2**60 - 3**30)
+
+        reordered = " ∨ ".join(f"(y{index} ∧ x{index})" for index in range(29, -1, -1))
+        self.assertEqual(manager.build(parse_logic(reordered)), root)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
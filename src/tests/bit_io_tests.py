@@ -0,0 +1,111 @@
+import random
+import unittest
+
+import numpy as np
+
+from src.math_algos.bit_io import (
+    BitReader,
+    BitWriter,
+    bits_from_string,
+    pack_frame,
+    unpack_frame,
+)
+from src.math_algos.encoding_decoding_algos import (
+    FixedLengthCoding,
+    HuffmanCoding,
+    ProbabilityCalculating,
+    ShennonFanoCoding,
+)
+
+
+def packed(writer):
+    return BitReader(writer.getvalue(), writer.bit_length).bits()
+
+
+class TestBitWriter(unittest.TestCase):
+    def test_unaligned_writes(self):
+        rng = random.Random(0)
+        for _ in range(200):
+            writer, expected = BitWriter(), ""
+            for _ in range(rng.randint(0, 6)):
+                bits = "".join(rng.choice("01") for _ in range(rng.randint(0, 20)))
+                writer.write_bits(bits_from_string(bits))
+                expected += bits
+            self.assertEqual(writer.bit_length, len(expected))
+            self.assertEqual(len(writer.getvalue()), (len(expected) + 7) // 8)
+            self.assertEqual(writer.to_string(), expected)
+            reader = BitReader.from_base64(writer.to_base64(), writer.bit_length)
+            np.testing.assert_array_equal(reader.bits(), bits_from_string(expected))
+
+    def test_reader_validates_length(self):
+        self.assertEqual(BitReader.from_string("101").data, b"\xa0")
+        self.assertEqual(len(BitReader(b"\xff\x00").bits()), 16)
+        for bit_length in (-1, 8, 17):
+            with self.assertRaises(ValueError):
+                BitReader(b"\xff\x00", bit_length)
+        with self.assertRaises(ValueError):
+            bits_from_string("0120")
+
+
+class TestPackedEncoders(unittest.TestCase):
+    def test_packed_round_trip(self):
+        rng = random.Random(1)
+        for _ in range(100):
+            alphabet = "abcdefghé\U0001f600"[: rng.randint(2, 10)]
+            string = "".join(rng.choices(alphabet, k=rng.randint(1, 500)))
+            if len(set(string)) < 2:
+                continue
+            probabilities = ProbabilityCalculating(string)
+
+            fixed = FixedLengthCoding(string)
+            self.assertEqual(
+                fixed.encode(string),
+                "".join(fixed.char_to_code[char] for char in string),
+            )
+            self.assertEqual(
+                fixed.decode_bits(packed(fixed.encode_bits(string))), string
+            )
+
+            huffman = HuffmanCoding(probabilities)
+            writer = huffman.encode_bits(string)
+            self.assertEqual(
+                writer.to_string(),
+                "".join(huffman.code_dict[char] for char in string),
+            )
+            self.assertEqual(
+                huffman.decode_bits(packed(writer), huffman.code_dict), string
+            )
+
+            shannon_fano = ShennonFanoCoding(probabilities)
+            writer = shannon_fano.encode_bits(string)
+            self.assertEqual(shannon_fano.decode_bits(packed(writer)), string)
+
+    def test_fixed_length_alphabet(self):
+        coder = FixedLengthCoding.recreate_from_alphabet({"x": "10", "y": "01"})
+        self.assertEqual(coder.decode("1001"), "xy")
+        for encoded in ("100", "1100"):
+            with self.assertRaises(ValueError):
+                coder.decode(encoded)
+        with self.assertRaises(ValueError):
+            FixedLengthCoding.recreate_from_alphabet({"x": "1", "y": "01"})
+        single = FixedLengthCoding("aaa")
+        self.assertEqual(single.decode(single.encode("aaa")), "aaa")
+
+
+class TestFrames(unittest.TestCase):
+    def test_round_trip(self):
+        codes = {chr(0x4E00 + i): format(i, "016b") for i in range(5000)}
+        metadata = {"codes": codes, "bit_length": 13}
+        frame = pack_frame(metadata, b"\x01\x02")
+        self.assertEqual(unpack_frame(frame), (metadata, b"\x01\x02"))
+        self.assertEqual(unpack_frame(pack_frame({}, b"")), ({}, b""))
+
+    def test_truncated_frame(self):
+        frame = pack_frame({"bit_length": 8}, b"\xff")
+        for end in (0, 3, 10):
+            with self.assertRaises(ValueError):
+                unpack_frame(frame[:end])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,275 @@
+import json
+import unittest
+from itertools import product
+
+import numpy as np
+from sympy import Equivalent, Implies, symbols
+
+from src.math_algos.boolean_algebra import (
+    CanonicalForms,
+    FunctionalCompleteness,
+    KarnaughMap,
+    LogicSimplifier,
+    PostClasses,
+    TruthTableGenerator,
+    TruthTableWriter,
+    VectorizedTruthTable,
+    ZhegalkinPolynomial,
+)
+
+
+class TestVectorizedTruthTable(unittest.TestCase):
+    def test_variable_columns(self):
+        a, b = symbols("a b")
+        engine = VectorizedTruthTable(a & b, ["a", "b"])
+        columns, results = engine.evaluate()
+        self.assertEqual(columns.astype(int).tolist(), [[0, 0], [0, 1], [1, 0], [1, 1]])
+        self.assertEqual(results.tolist(), [False, False, False, True])
+
+    def test_implication_and_equivalence(self):
+        a, b, c = symbols("a b c")
+        implication = VectorizedTruthTable(Implies(a, b), ["a", "b"])
+        self.assertEqual(implication.evaluate()[1].astype(int).tolist(), [1, 1, 0, 1])
+        equivalence = VectorizedTruthTable(Equivalent(a, b, c), ["a", "b", "c"])
+        self.assertEqual(
+            equivalence.evaluate()[1].astype(int).tolist(), [1, 0, 0, 0, 0, 0, 0, 1]
+        )
+
+    def test_row_range(self):
+        a, b, c = symbols("a b c")
+        engine = VectorizedTruthTable(a | b | c, ["a", "b", "c"])
+        columns, results = engine.evaluate(2, 5)
+        self.assertEqual(
+            columns.astype(int).tolist(), [[0, 1, 0], [0, 1, 1], [1, 0, 0]]
+        )
+        self.assertTrue(results.all())
+
+
+class TestTruthTableGenerator(unittest.TestCase):
+    def test_generate_truth_table(self):
+        variables, rows, results = TruthTableGenerator("a ∧ ¬b").generate_truth_table()
+        self.assertEqual(variables, ["a", "b"])
+        self.assertEqual(rows.shape, (4, 2))
+        self.assertTrue(np.array_equal(results, [False, False, True, False]))
+
+    def test_matches_row_by_row_substitution(self):
+        expression = "(a → b) ⊕ (c ↑ d) ∨ ¬a ∧ (b ≡ c)"
+        generator = TruthTableGenerator(expression)
+        variables, rows, results = generator.generate_truth_table()
+
+        parsed_expr = LogicSimplifier().parse_expression(expression)
+        expected = [
+            bool(parsed_expr.subs(dict(zip(variables, row))))
+            for row in product([False, True], repeat=len(variables))
+        ]
+        self.assertEqual(
+            rows.tolist(),
+            [list(row) for row in product([False, True], repeat=len(variables))],
+        )
+        self.assertEqual(results.tolist(), expected)
+
+    def test_many_variables(self):
+        expression = "(a∧b)∨(c∧d)∨(e∧f)∨(g∧h)∨(i∧j)∨(k∧l)∨(m∧¬n)"
+        variables, rows, results = TruthTableGenerator(
+            expression
+        ).generate_truth_table()
+        self.assertEqual(len(variables), 14)
+        self.assertEqual(rows.shape, (1 << 14, 14))
+        self.assertEqual(int(results.sum()), (1 << 14) - 3**6 * 3)
+
+    def test_tautology(self):
+        _, rows, results = TruthTableGenerator("a ∨ ¬a").generate_truth_table()
+        self.assertEqual(len(rows), 2)
+        self.assertTrue(results.all())
+
+    def test_page_matches_full_table(self):
+        generator = TruthTableGenerator("(a → b) ⊕ c ∨ ¬d")
+        _, _, results = generator.generate_truth_table()
+        variables, page = generator.page(5, 11)
+        self.assertEqual(variables, ["a", "b", "c", "d"])
+        self.assertEqual(page.tolist(), results[5:11].tolist())
+        self.assertEqual(len(generator.page(20, 30)[1]), 0)
+
+    def test_results_are_evaluated_in_chunks(self):
+        a, b, c = symbols("a b c")
+        engine = VectorizedTruthTable((a & ~b) | c, ["a", "b", "c"])
+        expected = engine.evaluate()[1]
+        self.assertEqual(engine.results(chunk_rows=3).tolist(), expected.tolist())
+        self.assertEqual(
+            engine.results(2, 7, chunk_rows=2).tolist(), expected[2:7].tolist()
+        )
+        self.assertEqual(len(engine.results(9, 12)), 0)
+
+    def test_variables(self):
+        self.assertEqual(
+            TruthTableGenerator("c ∧ (a ∨ b)").variables(), ["a", "b", "c"]
+        )
+
+
+class TestTruthTableWriter(unittest.TestCase):
+    def setUp(self):
+        variables, results = TruthTableGenerator("a ∧ ¬b").page(1, 3)
+        self.writer = TruthTableWriter(variables, "a ∧ ¬b", results, start=1)
+
+    def test_csv(self):
+        text = b"".join(self.writer.write("csv")).decode()
+        self.assertEqual(text, "a,b,a ∧ ¬b\n0,1,0\n1,0,1\n")
+
+    def test_ndjson(self):
+        lines = b"".join(self.writer.write("ndjson")).decode().splitlines()
+        self.assertEqual(
+            [json.loads(line) for line in lines],
+            [{"a": 0, "b": 1, "a ∧ ¬b": 0}, {"a": 1, "b": 0, "a ∧ ¬b": 1}],
+        )
+
+    def test_html(self):
+        text = b"".join(self.writer.write("html")).decode()
+        self.assertIn("<th>a ∧ ¬b</th>", text)
+        self.assertIn("<tr><td>1</td><td>0</td><td>1</td></tr>", text)
+
+    def test_streams_in_chunks(self):
+        variables, results = TruthTableGenerator("a ⊕ b ⊕ c").page()
+        writer = TruthTableWriter(variables, "f", results)
+        chunks = list(writer.stream(["", ",", ",", ",", "\n"]))
+        self.assertEqual(len(list(writer.chunks(chunk_rows=3))), 3)
+        self.assertEqual(b"".join(chunks).decode().count("\n"), 8)
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            self.writer.write("xml")
+
+    def test_rows_match_streamed_body(self):
+        for output_format in TruthTableWriter.MEDIA_TYPES:
+            header, _, footer = self.writer.layout(output_format)
+            self.assertEqual(
+                header.encode() + self.writer.rows(output_format) + footer.encode(),
+                b"".join(self.writer.write(output_format)),
+            )
+
+
+class TestCanonicalForms(unittest.TestCase):
+    def test_minterms_and_maxterms(self):
+        forms = CanonicalForms("a ⊕ b ∨ c")
+        self.assertEqual(forms.variables, ["a", "b", "c"])
+        self.assertEqual(forms.minterms(), [1, 2, 3, 4, 5, 7])
+        self.assertEqual(forms.maxterms(), [0, 6])
+
+    def test_cdnf_and_ccnf(self):
+        forms = CanonicalForms("a → b")
+        self.assertEqual(forms.cdnf(), "(¬a ∧ ¬b) ∨ (¬a ∧ b) ∨ (a ∧ b)")
+        self.assertEqual(forms.ccnf(), "(¬a ∨ b)")
+
+    def test_forms_are_equivalent_to_expression(self):
+        expression = "(a ↑ b) ⊕ (c ≡ d) ∨ ¬e"
+        expected = TruthTableGenerator(expression).page()[1]
+        forms = CanonicalForms(expression)
+        for form in (forms.cdnf(), forms.ccnf()):
+            self.assertEqual(
+                TruthTableGenerator(form).page()[1].tolist(), expected.tolist()
+            )
+
+    def test_constants(self):
+        self.assertEqual(CanonicalForms("a ∨ ¬a").cdnf(), "¬a ∨ a")
+        self.assertEqual(CanonicalForms("a ∨ ¬a").ccnf(), "1")
+        self.assertEqual(CanonicalForms("a ∧ ¬a").cdnf(), "0")
+        self.assertEqual(CanonicalForms("1").cdnf(), "1")
+        self.assertEqual(CanonicalForms("0").ccnf(), "0")
+
+
+class TestKarnaughMap(unittest.TestCase):
+    def test_gray_code_layout(self):
+        karnaugh_map = KarnaughMap("a ∧ b ∨ c ∧ ¬d").build()
+        self.assertEqual(karnaugh_map["row_variables"], ["a", "b"])
+        self.assertEqual(karnaugh_map["column_labels"], ["00", "01", "11", "10"])
+        self.assertEqual(
+            karnaugh_map["grid"],
+            [[0, 0, 0, 1], [0, 0, 0, 1], [1, 1, 1, 1], [0, 0, 0, 1]],
+        )
+
+    def test_adjacent_cells_differ_in_one_bit(self):
+        karnaugh_map = KarnaughMap("a ∧ b ∧ c ∧ d ∧ e").build()
+        self.assertEqual(len(karnaugh_map["grid"]), 4)
+        self.assertEqual(len(karnaugh_map["grid"][0]), 8)
+        labels = karnaugh_map["column_labels"]
+        for left, right in zip(labels, labels[1:] + labels[:1]):
+            self.assertEqual(sum(x != y for x, y in zip(left, right)), 1)
+        self.assertEqual(karnaugh_map["grid"][2][5], 1)
+        self.assertEqual(sum(map(sum, karnaugh_map["grid"])), 1)
+
+    def test_variable_limits(self):
+        with self.assertRaises(ValueError):
+            KarnaughMap("a")
+        with self.assertRaises(ValueError):
+            KarnaughMap("a ∧ b ∧ c ∧ d ∧ e ∧ f ∧ g")
+
+
+class TestZhegalkinPolynomial(unittest.TestCase):
+    def test_textbook_polynomials(self):
+        cases = {
+            "a ∨ b": "a ⊕ b ⊕ a ∧ b",
+            "a → b": "1 ⊕ a ⊕ a ∧ b",
+            "¬a": "1 ⊕ a",
+            "a ≡ b": "1 ⊕ a ⊕ b",
+            "a ∧ ¬a": "0",
+        }
+        for expression, expected in cases.items():
+            self.assertEqual(ZhegalkinPolynomial(expression).to_string(), expected)
+
+    def test_polynomial_is_equivalent(self):
+        expression = "(a ↑ b) ∨ (c ≡ ¬d) ∧ e"
+        polynomial = ZhegalkinPolynomial(expression).to_string()
+        self.assertEqual(
+            TruthTableGenerator(polynomial).page()[1].tolist(),
+            TruthTableGenerator(expression).page()[1].tolist(),
+        )
+
+    def test_transform_is_an_involution(self):
+        results = np.random.default_rng(3).integers(0, 2, 1 << 10).astype(bool)
+        coefficients = ZhegalkinPolynomial.mobius_transform(results)
+        self.assertTrue(
+            np.array_equal(ZhegalkinPolynomial.mobius_transform(coefficients), results)
+        )
+
+    def test_many_variables(self):
+        expression = " ∨ ".join(f"x{i:02d} ∧ x{i + 1:02d}" for i in range(20))
+        polynomial = ZhegalkinPolynomial(expression)
+        self.assertEqual(len(polynomial.variables), 21)
+        self.assertEqual(polynomial.degree(), 21)
+
+
+class TestPostClasses(unittest.TestCase):
+    def test_classes(self):
+        self.assertEqual(
+            PostClasses("a ∧ b ∨ a ∧ c ∨ b ∧ c").classes(),
+            {"T0": True, "T1": True, "S": True, "M": True, "L": False},
+        )
+        self.assertEqual(
+            PostClasses("¬a").classes(),
+            {"T0": False, "T1": False, "S": True, "M": False, "L": True},
+        )
+        self.assertEqual(
+            PostClasses("a → b").classes(),
+            {"T0": False, "T1": True, "S": False, "M": False, "L": False},
+        )
+
+    def test_constants(self):
+        self.assertEqual(
+            PostClasses("1").classes(),
+            {"T0": False, "T1": True, "S": False, "M": True, "L": True},
+        )
+
+    def test_functional_completeness(self):
+        self.assertTrue(FunctionalCompleteness(["a ↑ b"]).check()["complete"])
+        self.assertTrue(FunctionalCompleteness(["a ∧ b", "¬a"]).check()["complete"])
+
+        result = FunctionalCompleteness(["a ∧ b", "a ∨ b"]).check()
+        self.assertFalse(result["complete"])
+        self.assertIsNone(result["witnesses"]["M"])
+        self.assertEqual(result["witnesses"]["L"], "a ∧ b")
+
+        with self.assertRaises(ValueError):
+            FunctionalCompleteness([])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,147 @@
+import random
+import unittest
+
+import numpy as np
+from sympy import SOPform, false, symbols, true
+from sympy.logic.boolalg import And, Or
+
+from src.math_algos.boolean_algebra import LogicSimplifier
+from src.math_algos.boolean_minimization import (
+    Cube,
+    EspressoMinimizer,
+    QuineMcCluskey,
+    cubes_to_dnf,
+)
+
+TEXTBOOK_EXPRESSIONS = [
+    "a ∧ ¬b ∨ c ⊕ d",
+    "a ∧ b ∨ ¬a ∧ c ∨ b ∧ c",
+    "(a ∨ ¬b) ∧ (a ∨ ¬b ∨ c) ∧ (a ∨ ¬b ∨ d)",
+    "¬a ∧ ¬b ∨ a ∧ b ∨ ¬a ∧ b",
+    "a → b",
+    "a ≡ b",
+    "a ↓ b",
+    "a ↑ b",
+    "a ⊕ b ⊕ c",
+    "(a → b) ∧ (b → c) → (a → c)",
+    "x ∧ y ∨ ¬x ∧ z ∨ y ∧ z ∧ w",
+]
+
+
+def covered_minterms(cubes, variable_count):
+    covered = np.zeros(1 << variable_count, dtype=bool)
+    for cube in cubes:
+        covered[cube.minterms()] = True
+    return covered
+
+
+def dnf_cost(expr):
+    terms = expr.args if isinstance(expr, Or) else (expr,)
+    return (
+        len(terms),
+        sum(len(term.args) if isinstance(term, And) else 1 for term in terms),
+    )
+
+
+class TestLogicSimplifierEngines(unittest.TestCase):
+    def test_same_dnf_as_sympy(self):
+        for expression in TEXTBOOK_EXPRESSIONS:
+            expected = str(LogicSimplifier("sympy").simplify_expression(expression))
+            for engine in ("qm", "espresso", "auto"):
+                with self.subTest(expression=expression, engine=engine):
+                    result = LogicSimplifier(engine).simplify_expression(expression)
+                    self.assertEqual(str(result), expected)
+
+    def test_constants(self):
+        for engine in ("qm", "espresso"):
+            simplifier = LogicSimplifier(engine)
+            self.assertEqual(simplifier.simplify_expression("a ∨ ¬a"), true)
+            self.assertEqual(simplifier.simplify_expression("a ∧ ¬a"), false)
+
+    def test_reports_exactness(self):
+        expression = "(a ∧ ¬b) ∨ (b ∧ ¬c) ∨ (¬a ∧ c)"
+        for engine, exact in (("sympy", True), ("qm", True), ("espresso", False)):
+            simplifier = LogicSimplifier(engine)
+            simplifier.simplify_expression(expression)
+            self.assertIs(simplifier.exact, exact)
+            simplifier.simplify_expression(expression.replace("a", "x"))
+            self.assertIs(simplifier.exact, exact)
+
+    def test_unknown_engine(self):
+        with self.assertRaises(ValueError):
+            LogicSimplifier("magic")
+
+
+class TestMinimizers(unittest.TestCase):
+    def test_empty_on_set(self):
+        on_set = np.zeros(8, dtype=bool)
+        self.assertEqual(QuineMcCluskey(3).minimize(on_set), [])
+        self.assertEqual(EspressoMinimizer(3).minimize(on_set), [])
+        self.assertEqual(cubes_to_dnf([], symbols("a b c")), false)
+
+    def test_full_on_set(self):
+        on_set = np.ones(8, dtype=bool)
+        for minimizer in (QuineMcCluskey(3), EspressoMinimizer(3)):
+            self.assertEqual(
+                cubes_to_dnf(minimizer.minimize(on_set), symbols("a b c")), true
+            )
+
+    def test_single_variable(self):
+        a = symbols("a")
+        for minimizer in (QuineMcCluskey(1), EspressoMinimizer(1)):
+            self.assertEqual(cubes_to_dnf(minimizer.minimize([False, True]), [a]), a)
+            self.assertEqual(cubes_to_dnf(minimizer.minimize([True, False]), [a]), ~a)
+
+    def test_search_limit_marks_cover_as_not_exact(self):
+        on_set = np.zeros(8, dtype=bool)
+        on_set[[0, 1, 2, 5, 6, 7]] = True
+        bounded = QuineMcCluskey(3, search_limit=1)
+        cover = bounded.minimize(on_set)
+        self.assertFalse(bounded.exact)
+        self.assertTrue(np.array_equal(covered_minterms(cover, 3), on_set))
+
+        exact = QuineMcCluskey(3)
+        self.assertEqual(len(exact.minimize(on_set)), 3)
+        self.assertTrue(exact.exact)
+
+    def test_cube_minterms(self):
+        self.assertEqual(sorted(Cube(0b100, 0b011).minterms()), [4, 5, 6, 7])
+        self.assertTrue(Cube(0b100, 0b011).covers(0b110))
+        self.assertFalse(Cube(0b100, 0b011).covers(0b010))
+
+    def test_random_functions(self):
+        generator = random.Random(0)
+        for _ in range(200):
+            variable_count = generator.randint(1, 5)
+            variables = symbols(f"x0:{variable_count}")
+            on_set = np.array(
+                [generator.random() < 0.5 for _ in range(1 << variable_count)]
+            )
+            minterms = [int(minterm) for minterm in np.flatnonzero(on_set)]
+            reference = SOPform(variables, minterms)
+
+            exact = QuineMcCluskey(variable_count).minimize(on_set)
+            heuristic = EspressoMinimizer(variable_count).minimize(on_set)
+            self.assertTrue(
+                np.array_equal(covered_minterms(exact, variable_count), on_set)
+            )
+            self.assertTrue(
+                np.array_equal(covered_minterms(heuristic, variable_count), on_set)
+            )
+            if minterms:
+                self.assertLessEqual(
+                    dnf_cost(cubes_to_dnf(exact, variables)), dnf_cost(reference)
+                )
+
+    def test_large_function(self):
+        expression = "(a∧b)∨(c∧d)∨(e∧f)∨(g∧h)∨(i∧j)∨(k∧l)∨(m∧¬n)∨(o⊕p)"
+        result = LogicSimplifier("auto").simplify_expression(expression)
+        self.assertEqual(
+            str(result),
+            "(a & b) | (c & d) | (e & f) | (g & h) | (i & j) | (k & l) | "
+            "(m & ~n) | (o & ~p) | (p & ~o)",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,81 @@
+import random
+import unittest
+
+from src.math_algos.context_coding import (
+    RESCALE_LIMIT,
+    ContextDecoder,
+    ContextEncoder,
+    ContextModel,
+    FenwickTree,
+    context_decode,
+    context_encode,
+)
+from src.math_algos.range_coding import RangeCoder
+
+
+class TestFenwickTree(unittest.TestCase):
+    def test_matches_prefix_sums(self):
+        rng = random.Random(0)
+        frequencies = []
+        tree = FenwickTree()
+        for _ in range(500):
+            if not frequencies or rng.random() < 0.3:
+                frequencies.append(rng.randint(1, 9))
+                tree.append(frequencies[-1])
+            else:
+                index = rng.randrange(len(frequencies))
+                frequencies[index] += 3
+                tree.add(index, 3)
+            for index in range(len(frequencies) + 1):
+                self.assertEqual(tree.prefix(index), sum(frequencies[:index]))
+            value = rng.randrange(tree.total)
+            slot, start = tree.find(value)
+            self.assertEqual(start, sum(frequencies[:slot]))
+            self.assertLess(value, start + frequencies[slot])
+
+    def test_rescaling_keeps_symbols(self):
+        model = ContextModel()
+        for symbol in "ab" * 5000 + "c":
+            model.update(symbol)
+        self.assertLessEqual(model.tree.total, RESCALE_LIMIT)
+        self.assertTrue(all(frequency > 0 for frequency in model.tree.frequencies))
+        self.assertEqual(model.symbols, [None, "a", "b", "c"])
+
+
+class TestContextCoding(unittest.TestCase):
+    def test_round_trip(self):
+        rng = random.Random(1)
+        for order in range(7):
+            for _ in range(20):
+                alphabet = "ab c\né€😀"[: rng.randint(1, 8)]
+                string = "".join(rng.choices(alphabet, k=rng.randint(0, 400)))
+                data = context_encode(string, order)
+                self.assertEqual(context_decode(data, order), string)
+
+    def test_streaming_matches_one_shot(self):
+        string = "the quick brown fox jumps over the lazy dog. " * 200
+        encoder = ContextEncoder(3)
+        data = b"".join(encoder.write(string[i : i + 37]) for i in range(0, 9000, 37))
+        data += encoder.finish()
+        self.assertEqual(data, context_encode(string, 3))
+
+        decoder = ContextDecoder(3)
+        parts = [decoder.feed(data[i : i + 5]) for i in range(0, len(data), 5)]
+        self.assertEqual("".join(parts) + decoder.finish(), string)
+        self.assertGreater(len(parts[len(parts) // 2]), 0)
+
+    def test_adapts_to_context(self):
+        string = "abracadabra " * 2000
+        static = RangeCoder.from_string(string).encode(string)
+        self.assertLess(len(context_encode(string, 0)), len(static) * 1.05)
+        self.assertLess(len(context_encode(string, 3)), len(static) / 10)
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            ContextEncoder(7)
+        with self.assertRaises(ValueError):
+            context_decode(context_encode("hello world", 2)[:-6], 2)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
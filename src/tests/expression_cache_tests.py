@@ -0,0 +1,64 @@
+import unittest
+
+import numpy as np
+from sympy import Implies, symbols
+
+from src.math_algos.boolean_algebra import LogicSimplifier, TruthTableGenerator
+from src.math_algos.expression_cache import CanonicalCache
+
+
+class TestCanonicalCache(unittest.TestCase):
+    def test_renamed_and_reordered_expressions_share_key(self):
+        a, b, c, x, y, z = symbols("a b c x y z")
+        cache = CanonicalCache()
+        first, _ = cache.canonicalize((a & ~b) | c)
+        second, _ = cache.canonicalize(z | (~y & x))
+        self.assertEqual(first, second)
+
+    def test_non_commutative_operands_keep_order(self):
+        a, b = symbols("a b")
+        cache = CanonicalCache()
+        key, originals = cache.canonicalize(Implies(b, a))
+        self.assertEqual(originals, [b, a])
+        self.assertEqual(key, "Implies(_c0,_c1)")
+
+    def test_results_are_mapped_back(self):
+        a, b, p, q = symbols("a b p q")
+        cache = CanonicalCache()
+        calls = []
+
+        def compute(expr, _):
+            calls.append(expr)
+            return expr
+
+        self.assertEqual(cache.lookup("test", a & ~b, compute), a & ~b)
+        self.assertEqual(cache.lookup("test", ~q & p, compute), p & ~q)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(cache.info()["hits"], 1)
+        self.assertEqual(cache.info()["hit_rate"], 0.5)
+
+    def test_lru_eviction(self):
+        a, b = symbols("a b")
+        cache = CanonicalCache(maxsize=2)
+        for expr in (a & b, a | b, a ^ b):
+            cache.lookup("test", expr, lambda expr, _: expr)
+        self.assertEqual(cache.info()["size"], 2)
+        cache.lookup("test", a & b, lambda expr, _: expr)
+        self.assertEqual(cache.info()["misses"], 4)
+
+
+class TestCachedSimplification(unittest.TestCase):
+    def test_simplifier_uses_caller_names(self):
+        simplifier = LogicSimplifier("qm")
+        self.assertEqual(str(simplifier.simplify_expression("a ∧ b ∨ a ∧ ¬b")), "a")
+        self.assertEqual(str(simplifier.simplify_expression("¬q ∧ p ∨ p ∧ q")), "p")
+
+    def test_truth_table_columns_follow_caller_order(self):
+        _, _, first = TruthTableGenerator("a ∧ ¬b").generate_truth_table()
+        _, _, second = TruthTableGenerator("¬a ∧ b").generate_truth_table()
+        self.assertTrue(np.array_equal(first, [False, False, True, False]))
+        self.assertTrue(np.array_equal(second, [False, True, False, False]))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
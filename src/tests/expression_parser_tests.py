@@ -0,0 +1,81 @@
+import unittest
+
+from sympy import Equivalent, Implies, Nand, Nor, Not, symbols
+
+from src.math_algos.expression_parser import (
+    Operation,
+    parse_logic,
+    parse_set,
+    variables_in_order,
+)
+
+
+class TestLogicParser(unittest.TestCase):
+    def setUp(self):
+        self.a, self.b, self.c = symbols("a b c")
+
+    def test_precedence(self):
+        a, b, c = self.a, self.b, self.c
+        self.assertEqual(parse_logic("a ∨ b ∧ c").to_sympy({}), a | (b & c))
+        self.assertEqual(parse_logic("¬a ∧ b").to_sympy({}), ~a & b)
+        self.assertEqual(parse_logic("a ∨ b ⊕ c").to_sympy({}), a | (b ^ c))
+        self.assertEqual(
+            parse_logic("a ≡ b → c").to_sympy({}), Equivalent(a, Implies(b, c))
+        )
+
+    def test_implication_is_right_associative(self):
+        a, b, c = self.a, self.b, self.c
+        self.assertEqual(
+            parse_logic("a → b → c").to_sympy({}), Implies(a, Implies(b, c))
+        )
+        self.assertEqual(parse_logic("a ← b").to_sympy({}), Implies(b, a))
+
+    def test_nand_nor_between_subexpressions(self):
+        a, b, c = self.a, self.b, self.c
+        self.assertEqual(parse_logic("(a ∧ b) ↑ c").to_sympy({}), Nand(a & b, c))
+        self.assertEqual(parse_logic("¬a ↓ (b ∨ c)").to_sympy({}), Nor(~a, b | c))
+
+    def test_ascii_operators_and_functions(self):
+        a, b = self.a, self.b
+        self.assertEqual(parse_logic("a & !b | 0").to_sympy({}), a & ~b)
+        self.assertEqual(
+            parse_logic("Not(Equivalent(a, b))").to_sympy({}), Not(Equivalent(a, b))
+        )
+
+    def test_flattens_long_chains(self):
+        expression = " ∨ ".join(f"x{index}" for index in range(5000))
+        tree = parse_logic(expression)
+        self.assertIsInstance(tree, Operation)
+        self.assertEqual(len(tree.operands), 5000)
+        self.assertEqual(len(variables_in_order(tree)), 5000)
+
+    def test_evaluate(self):
+        tree = parse_logic("(a → b) ∧ ¬c")
+        self.assertTrue(tree.evaluate({"a": False, "b": False, "c": False}, True))
+        self.assertFalse(tree.evaluate({"a": True, "b": False, "c": False}, True))
+        self.assertEqual(
+            tree.evaluate({"a": 0b1100, "b": 0b1010, "c": 0b0001}, 0b1111), 0b1010
+        )
+
+    def test_errors(self):
+        for expression in ("", "a ∧", "(a ∨ b", "a b", "∧ a", "a $ b"):
+            with self.assertRaises(ValueError):
+                parse_logic(expression)
+
+
+class TestSetParser(unittest.TestCase):
+    def test_set_operators(self):
+        a, b, c = symbols("A B C")
+        self.assertEqual(parse_set("A \\ B").to_sympy({}), a & ~b)
+        self.assertEqual(parse_set("not(A) ∩ B ∪ C").to_sympy({}), (~a & b) | c)
+        self.assertEqual(parse_set("A ∆ B ∪ ∅").to_sympy({}), (a ^ b) | False)
+        self.assertEqual(parse_set("not A ∩ U").to_sympy({}), ~a)
+
+    def test_variables_in_order(self):
+        self.assertEqual(
+            variables_in_order(parse_set("C ∪ A ∩ C ∪ B")), ["C", "A", "B"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
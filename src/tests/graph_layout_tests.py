@@ -0,0 +1,141 @@
+import tempfile
+import unittest
+from io import BytesIO
+from unittest import mock
+
+import numpy as np
+from PIL import Image
+
+from src.math_algos.binary_relations import BinaryRelationGraph, RelationMatrix
+from src.math_algos.caching import DiskCache
+from src.math_algos.graph_layout import (
+    LayoutCache,
+    compute_layout,
+    force_layout,
+    graph_hash,
+    longest_path_layers,
+    repulsion,
+)
+
+
+def random_relation(size, count, seed=0):
+    rng = np.random.default_rng(seed)
+    return RelationMatrix(
+        range(size), rng.integers(0, size, count), rng.integers(0, size, count)
+    )
+
+
+class TestLayouts(unittest.TestCase):
+    def test_graph_hash(self):
+        first = RelationMatrix.from_pairs(set(), [("1", "2"), ("2", "3")])
+        same = RelationMatrix.from_pairs(set(), [("2", "3"), ("1", "2")])
+        other = RelationMatrix.from_pairs(set(), [("1", "2"), ("3", "2")])
+        self.assertEqual(graph_hash(first), graph_hash(same))
+        self.assertNotEqual(graph_hash(first), graph_hash(other))
+
+    def test_layered_layout_for_orders(self):
+        relation = [(a, b) for a in range(1, 25) for b in range(1, 25) if b % a == 0]
+        matrix = RelationMatrix.from_pairs(set(), relation)
+        layers = longest_path_layers(matrix)
+        self.assertEqual(layers[matrix.index[1]], 0)
+        self.assertEqual(layers[matrix.index[16]], 4)
+
+        positions = compute_layout(matrix)
+        for a, b in relation:
+            if a != b:
+                self.assertGreater(
+                    positions[matrix.index[a], 1], positions[matrix.index[b], 1]
+                )
+        with self.assertRaises(ValueError):
+            compute_layout(
+                RelationMatrix.from_pairs(set(), [(1, 2), (2, 1)]), "layered"
+            )
+
+    def test_small_cyclic_layouts(self):
+        cycle = RelationMatrix(range(8), np.arange(8), (np.arange(8) + 1) % 8)
+        radii = np.sqrt((compute_layout(cycle) ** 2).sum(axis=1))
+        np.testing.assert_allclose(radii, 1)
+
+        shells = compute_layout(random_relation(40, 80))
+        self.assertEqual(shells.shape, (40, 2))
+        self.assertEqual(len(np.unique(shells.round(6), axis=0)), 40)
+        with self.assertRaises(ValueError):
+            compute_layout(cycle, "spiral")
+
+    def test_repulsion_approximates_exact_forces(self):
+        positions = np.random.default_rng(1).random((400, 2))
+        delta = positions[:, None] - positions[None]
+        distance = (delta**2).sum(axis=2)
+        np.fill_diagonal(distance, np.inf)
+        exact = (delta / distance[:, :, None]).sum(axis=1)
+        error = np.linalg.norm(repulsion(positions) - exact) / np.linalg.norm(exact)
+        self.assertLess(error, 0.05)
+
+    def test_force_layout_pulls_edges_together(self):
+        matrix = random_relation(2000, 2500)
+        positions = force_layout(matrix)
+        self.assertLessEqual(np.abs(positions).max(), 1 + 1e-9)
+
+        edges = np.sqrt(
+            ((positions[matrix.sources] - positions[matrix.targets]) ** 2).sum(axis=1)
+        )
+        rng = np.random.default_rng(2)
+        pairs = rng.integers(0, 2000, (2, 5000))
+        random_pairs = np.sqrt(
+            ((positions[pairs[0]] - positions[pairs[1]]) ** 2).sum(axis=1)
+        )
+        self.assertLess(edges.mean(), random_pairs.mean() / 3)
+
+    def test_cache(self):
+        cache = LayoutCache(maxsize=1)
+        matrix = random_relation(30, 60)
+        first = cache.lookup(matrix)
+        self.assertIs(cache.lookup(matrix), first)
+        cache.lookup(random_relation(30, 60, seed=1))
+        cache.lookup(matrix)
+        self.assertEqual(cache.info()["hits"], 1)
+        self.assertEqual(cache.info()["misses"], 3)
+
+    def test_disk_cache_is_shared(self):
+        matrix = random_relation(30, 60)
+        with tempfile.TemporaryDirectory() as directory:
+            first = LayoutCache(disk=DiskCache(directory))
+            positions = first.lookup(matrix, "force")
+            second = LayoutCache(disk=DiskCache(directory))
+            with mock.patch(
+                "src.math_algos.graph_layout.compute_layout"
+            ) as compute_layout:
+                shared = second.lookup(matrix, "force")
+            compute_layout.assert_not_called()
+            self.assertTrue(np.array_equal(shared, positions))
+            self.assertFalse(shared.flags.writeable)
+            self.assertEqual(second.info()["disk_hits"], 1)
+            self.assertIs(second.lookup(matrix, "force"), shared)
+
+
+class TestBinaryRelationGraph(unittest.TestCase):
+    def test_small_graph(self):
+        graph = BinaryRelationGraph({"1", "2", "3"}, {("1", "2"), ("2", "2")})
+        self.assertEqual(len(graph.position), 3)
+        self.assertIsInstance(graph.get_image(), BytesIO)
+        svg = graph.render("svg", node_color="red")
+        self.assertEqual(svg.count("<line"), 1)
+        self.assertEqual(svg.count("<title>"), 3)
+        self.assertIn('fill="red"', svg)
+        with self.assertRaises(ValueError):
+            graph.render("gif")
+
+    def test_large_graph(self):
+        rng = np.random.default_rng(0)
+        relation = {(str(a), str(b)) for a, b in rng.integers(0, 2000, (5000, 2))}
+        graph = BinaryRelationGraph(None, relation)
+        image = Image.open(graph.get_image())
+        self.assertGreater(image.size[0], 1000)
+
+        restyled = BinaryRelationGraph(None, relation)
+        restyled.get_svg(node_color="orange", font_size=8)
+        self.assertIs(restyled.position, graph.position)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,66 @@
+import unittest
+
+from src.api.uploads import MultipartUpload, UploadError
+
+BOUNDARY = "relation-boundary"
+CONTENT_TYPE = f"multipart/form-data; boundary={BOUNDARY}"
+
+
+def multipart_body(*parts):
+    body = b""
+    for name, value, filename in parts:
+        disposition = f'form-data; name="{name}"'
+        if filename is not None:
+            disposition += f'; filename="{filename}"'
+        body += f"--{BOUNDARY}\r\nContent-Disposition: {disposition}\r\n\r\n".encode()
+        body += value + b"\r\n"
+    return body + f"--{BOUNDARY}--\r\n".encode()
+
+
+async def chunked(data, size):
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+async def collect(upload, stream):
+    return b"".join([chunk async for chunk in upload.file_chunks(stream)])
+
+
+class TestMultipartUpload(unittest.IsolatedAsyncioTestCase):
+    async def test_streams_file_and_collects_fields(self):
+        data = b"1,2\n" * 1000
+        body = multipart_body(
+            ("set_of_elements", b"1,2,3", None), ("file", data, "relation.csv")
+        )
+        for size in (1, 7, 4096, len(body)):
+            upload = MultipartUpload(CONTENT_TYPE)
+            self.assertEqual(await collect(upload, chunked(body, size)), data)
+            self.assertEqual(upload.fields, {"set_of_elements": "1,2,3"})
+
+    async def test_fields_after_file(self):
+        body = multipart_body(
+            ("file", b"1,2\n", "relation.csv"), ("set_of_elements", b"1,2", None)
+        )
+        upload = MultipartUpload(CONTENT_TYPE)
+        self.assertEqual(await collect(upload, chunked(body, 5)), b"1,2\n")
+        self.assertEqual(upload.fields["set_of_elements"], "1,2")
+
+    async def test_missing_file(self):
+        upload = MultipartUpload(CONTENT_TYPE)
+        with self.assertRaises(UploadError):
+            await collect(upload, chunked(multipart_body(("x", b"1", None)), 16))
+
+    async def test_field_limit(self):
+        upload = MultipartUpload(CONTENT_TYPE, field_limit=4)
+        body = multipart_body(("set_of_elements", b"1,2,3,4", None))
+        with self.assertRaises(UploadError):
+            await collect(upload, chunked(body, 16))
+
+    def test_rejects_other_content_types(self):
+        for content_type in ("text/csv", "multipart/form-data"):
+            with self.assertRaises(UploadError):
+                MultipartUpload(content_type)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,164 @@
+import itertools
+import random
+import unittest
+from unittest import mock
+
+from src.math_algos import prefix_coding
+from src.math_algos.encoding_decoding_algos import (
+    HuffmanCoding,
+    ProbabilityCalculating,
+    ShennonFanoCoding,
+)
+from src.math_algos.prefix_coding import (
+    PrefixDecoder,
+    canonical_codes,
+    code_lengths,
+    package_merge,
+)
+from src.tests.random_text import random_string
+
+
+class TestPrefixDecoder(unittest.TestCase):
+    def test_huffman_and_shannon_fano_round_trip(self):
+        rng = random.Random(0)
+        for _ in range(100):
+            string = random_string(
+                rng, rng.randint(1, 2000), rng.randint(2, 50), rng.choice([1, 4, 12])
+            )
+            probabilities = ProbabilityCalculating(string)
+            huffman = HuffmanCoding(probabilities)
+            shannon_fano = ShennonFanoCoding(probabilities)
+            if len(huffman.code_dict) < 2:
+                continue
+            encoded = huffman.encode(string)
+            self.assertEqual(huffman.decode(encoded, huffman.code_dict), string)
+            self.assertEqual(shannon_fano.decode(shannon_fano.encode(string)), string)
+
+    def test_long_codes_use_subtables(self):
+        codes = {chr(0x100 + i): "1" * i + "0" for i in range(30)}
+        codes["end"] = "1" * 30
+        symbols = random.Random(3).choices(list(codes), k=2000)
+        encoded = "".join(codes[symbol] for symbol in symbols)
+        self.assertEqual(PrefixDecoder(codes).decode(encoded), "".join(symbols))
+
+    def test_small_tables_and_blocks(self):
+        rng = random.Random(1)
+        with mock.patch.multiple(
+            prefix_coding, TABLE_BITS=3, TABLE_MASK=7, DECODE_BLOCK=64
+        ):
+            for _ in range(100):
+                string = random_string(rng, rng.randint(1, 800), 30, 8)
+                codes = HuffmanCoding(ProbabilityCalculating(string)).code_dict
+                if len(codes) < 2:
+                    continue
+                encoded = "".join(codes[char] for char in string)
+                self.assertEqual(PrefixDecoder(codes).decode(encoded), string)
+
+    def test_multi_character_symbols(self):
+        codes = {"ab": "0", "c": "10", "": "11"}
+        self.assertEqual(PrefixDecoder(codes).decode("0100110"), "abcab" + "ab")
+
+    def test_invalid_input(self):
+        decoder = PrefixDecoder({"a": "0", "b": "10"})
+        for encoded in ("012", "11", "1"):
+            with self.assertRaises(ValueError):
+                decoder.decode(encoded)
+        for codes in ({"a": "0", "b": "01"}, {"a": "01", "b": "0"}, {"a": "x"}):
+            with self.assertRaises(ValueError):
+                PrefixDecoder(codes)
+        with self.assertRaises(ValueError):
+            PrefixDecoder({"a": ""})
+
+    def test_single_symbol_alphabet(self):
+        probabilities = ProbabilityCalculating("aaaa")
+        for coder in (HuffmanCoding(probabilities), ShennonFanoCoding(probabilities)):
+            codes = getattr(coder, "code_dict", None) or coder.get_alphabet_dict()
+            self.assertEqual(codes, {"a": "0"})
+            self.assertEqual(coder.encode("aaaa"), "0000")
+            self.assertEqual(PrefixDecoder(codes).decode("0000"), "aaaa")
+
+
+def optimal_cost(weights, max_length):
+    best = None
+    for lengths in itertools.product(range(1, max_length + 1), repeat=len(weights)):
+        if sum(2.0**-length for length in lengths) <= 1:
+            cost = sum(w * length for w, length in zip(weights, lengths))
+            best = cost if best is None else min(best, cost)
+    return best
+
+
+class TestCanonicalCodes(unittest.TestCase):
+    def test_package_merge_is_optimal(self):
+        rng = random.Random(1)
+        for _ in range(200):
+            count = rng.randint(2, 6)
+            weights = [rng.randint(1, 1000) for _ in range(count)]
+            max_length = rng.randint((count - 1).bit_length(), 5)
+            lengths = package_merge(weights, max_length)
+            self.assertLessEqual(max(lengths), max_length)
+            self.assertLessEqual(sum(2.0**-length for length in lengths), 1)
+            cost = sum(w * length for w, length in zip(weights, lengths))
+            self.assertEqual(cost, optimal_cost(weights, max_length))
+
+    def test_unconstrained_package_merge_matches_huffman(self):
+        rng = random.Random(2)
+        for _ in range(20):
+            string = random_string(rng, 3000, rng.randint(2, 50), 12)
+            probabilities = ProbabilityCalculating(string)
+            huffman = HuffmanCoding(probabilities)
+            limited = HuffmanCoding(probabilities, 32)
+            self.assertAlmostEqual(
+                huffman.average_code_length(), limited.average_code_length()
+            )
+
+    def test_package_merge_edge_cases(self):
+        self.assertEqual(package_merge([], 3), [])
+        self.assertEqual(package_merge([5], 3), [1])
+        self.assertEqual(package_merge([1, 1, 1, 1], 2), [2, 2, 2, 2])
+        with self.assertRaises(ValueError):
+            package_merge([1, 1, 1, 1, 1], 2)
+        with self.assertRaises(ValueError):
+            package_merge([1, 1], 33)
+
+    def test_canonical_codes(self):
+        codes = canonical_codes({"d": 3, "a": 2, "c": 3, "b": 1})
+        self.assertEqual(codes, {"b": "0", "a": "10", "c": "110", "d": "111"})
+        self.assertEqual(canonical_codes(code_lengths(codes)), codes)
+        self.assertEqual(canonical_codes({"a": 1}), {"a": "0"})
+        for lengths in ({"a": 1, "b": 1, "c": 1}, {"a": 0}, {"a": 33}, {"a": "1"}):
+            with self.assertRaises(ValueError):
+                canonical_codes(lengths)
+
+    def test_limited_huffman_round_trip(self):
+        rng = random.Random(3)
+        alphabet = [chr(0x100 + i) for i in range(300)]
+        string = "".join(rng.choices(alphabet, [1.5**-i for i in range(300)], k=20000))
+        string += "".join(alphabet)
+        probabilities = ProbabilityCalculating(string)
+        unlimited = HuffmanCoding(probabilities)
+        self.assertGreater(max(map(len, unlimited.code_dict.values())), 12)
+        for max_length in (9, 12, 20):
+            coder = HuffmanCoding(probabilities, max_length)
+            self.assertLessEqual(max(map(len, coder.code_dict.values())), max_length)
+            self.assertEqual(coder.code_dict, canonical_codes(coder.code_lengths()))
+            encoded = coder.encode(string)
+            decoded = PrefixDecoder(canonical_codes(coder.code_lengths())).decode(
+                encoded
+            )
+            self.assertEqual(decoded, string)
+
+    def test_canonicalize_keeps_code_lengths(self):
+        string = "abracadabra alakazam"
+        probabilities = ProbabilityCalculating(string)
+        for coder in (HuffmanCoding(probabilities), ShennonFanoCoding(probabilities)):
+            lengths = coder.code_lengths()
+            average = coder.average_code_length()
+            coder.canonicalize()
+            self.assertEqual(coder.code_lengths(), lengths)
+            self.assertAlmostEqual(coder.average_code_length(), average)
+            decoder = PrefixDecoder(canonical_codes(lengths))
+            self.assertEqual(decoder.decode(coder.encode(string)), string)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
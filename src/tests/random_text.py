@@ -0,0 +1,7 @@
+ALPHABET = [chr(0x41 + i) if i < 40 else chr(0x1F600 + i) for i in range(50)]
+
+
+def random_string(rng, length, alphabet_size=20, skew=4):
+    alphabet = ALPHABET[:alphabet_size]
+    weights = [rng.random() ** skew for _ in alphabet]
+    return "".join(rng.choices(alphabet, weights, k=length))
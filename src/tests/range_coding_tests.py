@@ -0,0 +1,93 @@
+import math
+import random
+import unittest
+from collections import Counter
+
+from src.math_algos.encoding_decoding_algos import (
+    ArithmeticCoder,
+    ProbabilityCalculating,
+)
+from src.math_algos.range_coding import (
+    MAX_TOTAL,
+    FrequencyTable,
+    RangeCoder,
+    RangeDecoder,
+    RangeEncoder,
+)
+from src.tests.random_text import random_string
+
+
+class TestFrequencyTable(unittest.TestCase):
+    def test_intervals(self):
+        table = FrequencyTable({"b": 2, "a": 3, "c": 0})
+        self.assertEqual(table.symbols, ["a", "b"])
+        self.assertEqual(table.intervals, {"a": (0, 3), "b": (3, 2)})
+        self.assertEqual(table.to_dict(), {"a": 3, "b": 2})
+
+    def test_quantization_keeps_every_symbol(self):
+        table = FrequencyTable({"a": 10**9, "b": 1, "c": 5})
+        self.assertLessEqual(table.total, MAX_TOTAL)
+        self.assertTrue(all(frequency > 0 for frequency in table.frequencies))
+        with self.assertRaises(ValueError):
+            FrequencyTable({"a": -1})
+
+
+class TestRangeCoder(unittest.TestCase):
+    def test_round_trip(self):
+        rng = random.Random(0)
+        for _ in range(200):
+            string = random_string(rng, rng.randint(0, 2000), rng.randint(1, 30))
+            coder = RangeCoder.from_string(string)
+            self.assertEqual(coder.decode(coder.encode(string), len(string)), string)
+
+    def test_skewed_long_input(self):
+        rng = random.Random(1)
+        string = "a" * 100000 + random_string(rng, 100000, 3) + "z"
+        counts = Counter(string)
+        entropy = -sum(c * math.log2(c / len(string)) for c in counts.values()) / 8
+        coder = RangeCoder.from_string(string)
+        data = coder.encode(string)
+        self.assertLess(len(data), entropy * 1.01 + 16)
+        self.assertEqual(coder.decode(data, len(string)), string)
+
+    def test_decimal_engine_loses_precision(self):
+        string = random_string(random.Random(2), 300)
+        decimal_coder = ArithmeticCoder(ProbabilityCalculating(string))
+        self.assertNotEqual(
+            decimal_coder.decode(decimal_coder.encode(string), len(string)), string
+        )
+        coder = RangeCoder.from_string(string)
+        self.assertEqual(coder.decode(coder.encode(string), len(string)), string)
+
+    def test_incremental_encoding_and_decoding(self):
+        string = random_string(random.Random(3), 5000)
+        table = FrequencyTable.from_string(string)
+        encoder = RangeEncoder()
+        chunks = []
+        for start in range(0, len(string), 700):
+            encoder.encode(string[start : start + 700], table)
+            chunks.append(encoder.take())
+        data = b"".join(chunks) + encoder.finish()
+        self.assertEqual(data, RangeCoder(table).encode(string))
+
+        decoder = RangeDecoder(data)
+        decoded = decoder.decode(table, 2500) + decoder.decode(table, 2500)
+        self.assertEqual("".join(decoded), string)
+
+    def test_edge_cases(self):
+        for string in ("", "x", "xxxxxxxx"):
+            coder = RangeCoder.from_string(string)
+            self.assertEqual(coder.decode(coder.encode(string), len(string)), string)
+        with self.assertRaises(ValueError):
+            RangeCoder.from_string("ab").encode("abc")
+        with self.assertRaises(ValueError):
+            RangeCoder(FrequencyTable({})).decode(b"", 1)
+
+    def test_truncated_data_stops_decoding(self):
+        coder = RangeCoder.from_string("abcd")
+        with self.assertRaises(ValueError):
+            coder.decode(coder.encode("abcd"), 10**9)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
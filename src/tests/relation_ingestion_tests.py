@@ -0,0 +1,81 @@
+import io
+import json
+import struct
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from src.math_algos import relation_ingestion
+from src.math_algos.binary_relations import BinaryRelationProperties, RelationMatrix
+from src.math_algos.relation_ingestion import RelationReader
+
+
+def read(data, input_format, **kwargs):
+    return RelationReader().read(io.BytesIO(data), input_format, **kwargs).matrix()
+
+
+class TestRelationReader(unittest.TestCase):
+    def test_json_pairs(self):
+        matrix = read(b' [ ["a b", "c"], [1, 2.5] ,["c","a b"]] ', "json")
+        self.assertEqual(matrix.elements, ["1", "2.5", "a b", "c"])
+        self.assertEqual(matrix.pairs(), [("1", "2.5"), ("a b", "c"), ("c", "a b")])
+
+    def test_json_pairs_across_chunks(self):
+        pairs = [[str(i), str(i * 7 % 50)] for i in range(50)]
+        data = json.dumps(pairs).encode()
+        with mock.patch.object(relation_ingestion, "READ_CHUNK", 5):
+            matrix = read(data, "json")
+        self.assertEqual(set(matrix.pairs()), {tuple(pair) for pair in pairs})
+
+    def test_malformed_json(self):
+        for data in (b'[["a"]]', b'[["a","b"]', b'{"a": 1}', b"[[true, 1]]", b"[1]"):
+            with self.assertRaises(ValueError):
+                read(data, "json")
+
+    def test_delimited(self):
+        matrix = read(b"source,target\n1,2\n\n 3 ,x y\n", "csv", header=True)
+        self.assertEqual(matrix.pairs(), [("1", "2"), ("3", "x y")])
+        matrix = read(b"a\tb c\n", "tsv")
+        self.assertEqual(matrix.pairs(), [("a", "b c")])
+        with self.assertRaises(ValueError):
+            read(b"1,2\n3\n", "csv")
+
+    def test_int32_pairs(self):
+        matrix = read(struct.pack("<6i", 5, -1, 5, 5, 10, 2), "int32")
+        self.assertEqual(matrix.pairs(), [("5", "-1"), ("5", "5"), ("10", "2")])
+        with self.assertRaises(ValueError):
+            read(b"\0" * 12, "int32")
+
+    def test_set_of_elements_and_unknown_format(self):
+        reader = RelationReader({"z", "1"}).read(io.BytesIO(b"1,2\n"), "csv")
+        self.assertEqual(reader.matrix().elements, ["1", "2", "z"])
+        with self.assertRaises(ValueError):
+            RelationReader().read(io.BytesIO(b""), "xml")
+
+    def test_formats_agree(self):
+        rng = np.random.default_rng(3)
+        data = rng.integers(0, 500, (5000, 2))
+        expected = RelationMatrix.from_pairs(
+            set(), [(str(a), str(b)) for a, b in data.tolist()]
+        )
+        sources = [
+            (json.dumps(data.tolist()).encode(), "json"),
+            ("\n".join(f"{a},{b}" for a, b in data.tolist()).encode(), "csv"),
+            ("\n".join(f"{a}\t{b}" for a, b in data.tolist()).encode(), "tsv"),
+            (data.astype("<i4").tobytes(), "int32"),
+        ]
+        for payload, input_format in sources:
+            matrix = read(payload, input_format)
+            self.assertEqual(matrix.elements, expected.elements)
+            self.assertEqual(matrix.pairs(), expected.pairs())
+            self.assertEqual(
+                BinaryRelationProperties.from_matrix(matrix).get_properties_as_list(),
+                BinaryRelationProperties(
+                    None, set(expected.pairs())
+                ).get_properties_as_list(),
+            )
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
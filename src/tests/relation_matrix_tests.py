@@ -0,0 +1,236 @@
+import random
+import unittest
+from itertools import product
+from unittest import mock
+
+import numpy as np
+
+from src.math_algos import binary_relations
+from src.math_algos.binary_relations import (
+    BinaryRelationProperties,
+    BinaryRelationStructure,
+    RelationAlgebra,
+    RelationMatrix,
+)
+
+
+def brute_force_properties(elements, relation):
+    elements = elements or {element for pair in relation for element in pair}
+    loops = [(e, e) in relation for e in elements]
+    reversed_pairs = [(b, a) in relation for a, b in relation]
+    antisymmetric = all((b, a) not in relation or a == b for a, b in relation)
+    composed = [(a, d) for (a, b), (c, d) in product(relation, repeat=2) if b == c]
+    transitive = all(pair in relation for pair in composed)
+    antitransitive = all(
+        pair not in relation for pair in composed if pair[0] != pair[1]
+    )
+    flags = {
+        "Рефлексивно": all(loops),
+        "Антирефлексивно": not any(loops),
+        "Нерефлексивно": any(loops) and not all(loops),
+        "Симметрично": all(reversed_pairs),
+        "Асимметрично": not any(reversed_pairs),
+        "Антисимметрично": antisymmetric,
+        "Несимметрично": not all(reversed_pairs) and not antisymmetric,
+        "Транзитивно": transitive,
+        "Антитранзитивно": antitransitive,
+        "Нетранзитивно": not transitive and not antitransitive,
+    }
+    return [name for name, value in flags.items() if value]
+
+
+class TestRelationMatrix(unittest.TestCase):
+    def test_interning_and_lookup(self):
+        matrix = RelationMatrix.from_pairs({"a"}, [("b", "c"), ("b", "c"), ("a", "b")])
+        self.assertEqual(len(matrix), 2)
+        self.assertEqual(matrix.size, 3)
+        a, b, c = matrix.indices(["a", "b", "c"])
+        self.assertEqual(
+            matrix.contains([a, b, c], [b, c, a]).tolist(), [True, True, False]
+        )
+
+    def test_compositions(self):
+        matrix = RelationMatrix.from_pairs(set(), [(1, 2), (2, 3), (2, 4), (4, 1)])
+        starts, ends = matrix.compositions(matrix.sources, matrix.targets)
+        pairs = {(matrix.elements[s], matrix.elements[e]) for s, e in zip(starts, ends)}
+        self.assertEqual(pairs, {(1, 3), (1, 4), (2, 1), (4, 2)})
+
+
+def brute_force_compose(first, second):
+    return {(a, d) for a, b in first for c, d in second if b == c}
+
+
+class TestRelationAlgebra(unittest.TestCase):
+    def test_operations(self):
+        relation = RelationAlgebra(None, {("1", "2"), ("2", "3"), ("3", "1")})
+        self.assertEqual(relation.inverse(), [("1", "3"), ("2", "1"), ("3", "2")])
+        self.assertEqual(
+            relation.compose({("2", "2"), ("3", "3")}), [("1", "2"), ("2", "3")]
+        )
+        self.assertEqual(relation.power(0), [("1", "1"), ("2", "2"), ("3", "3")])
+        self.assertEqual(relation.power(3), [("1", "1"), ("2", "2"), ("3", "3")])
+        self.assertEqual(len(relation.transitive_closure()), 9)
+        with self.assertRaises(ValueError):
+            relation.power(-1)
+
+    def test_matches_definitions(self):
+        rng = random.Random(5)
+        for _ in range(200):
+            elements = list(range(rng.randint(1, 25)))
+            first, second = (
+                {
+                    (rng.choice(elements), rng.choice(elements))
+                    for _ in range(rng.randint(0, 50))
+                }
+                for _ in range(2)
+            )
+            exponent = rng.randint(0, 5)
+            expected_power = {(e, e) for e in elements}
+            for _ in range(exponent):
+                expected_power = brute_force_compose(expected_power, first)
+
+            for limit in (binary_relations.DENSE_ELEMENT_LIMIT, 0):
+                with mock.patch.object(binary_relations, "DENSE_ELEMENT_LIMIT", limit):
+                    relation = RelationAlgebra(set(elements), first)
+                    self.assertEqual(
+                        set(relation.compose(second)),
+                        brute_force_compose(first, second),
+                    )
+                    self.assertEqual(set(relation.power(exponent)), expected_power)
+                    closure = set(relation.transitive_closure())
+                    self.assertTrue(first <= closure)
+                    self.assertTrue(brute_force_compose(closure, closure) <= closure)
+
+    def test_compact_representation(self):
+        rng = np.random.default_rng(0)
+        size, count = 100000, 500000
+        matrix = RelationMatrix(
+            range(size), rng.integers(0, size, count), rng.integers(0, size, count)
+        )
+        self.assertEqual(matrix.targets.dtype, np.int32)
+        self.assertLessEqual(matrix.nbytes / len(matrix), 8)
+
+        composed = matrix.compose(matrix)
+        sources, targets = composed.sources[:1000], composed.targets[:1000]
+        inverse = matrix.inverse()
+        middles = np.array(
+            [
+                np.intersect1d(
+                    matrix.targets[matrix.offsets[a] : matrix.offsets[a + 1]],
+                    inverse.targets[inverse.offsets[c] : inverse.offsets[c + 1]],
+                ).size
+                for a, c in zip(sources.tolist(), targets.tolist())
+            ]
+        )
+        self.assertTrue(np.all(middles > 0))
+
+
+class TestBinaryRelationProperties(unittest.TestCase):
+    def test_divisibility_order(self):
+        relation = {(a, b) for a in range(1, 10) for b in range(1, 10) if b % a == 0}
+        properties = BinaryRelationProperties(None, relation).get_properties_as_list()
+        self.assertEqual(properties, ["Рефлексивно", "Антисимметрично", "Транзитивно"])
+
+    def test_matches_definitions(self):
+        rng = random.Random(7)
+        for _ in range(300):
+            elements = [str(i) for i in range(rng.randint(1, 5))]
+            relation = {
+                (rng.choice(elements), rng.choice(elements))
+                for _ in range(rng.randint(0, 12))
+            }
+            given = set(rng.sample(elements, rng.randint(1, len(elements))))
+            given = given if rng.random() < 0.3 else None
+            expected = brute_force_properties(given, relation)
+            self.assertEqual(
+                BinaryRelationProperties(given, relation).get_properties_as_list(),
+                expected,
+            )
+            with mock.patch.object(binary_relations, "DENSE_ELEMENT_LIMIT", 0):
+                self.assertEqual(
+                    BinaryRelationProperties(given, relation).get_properties_as_list(),
+                    expected,
+                )
+
+    def test_large_relation(self):
+        relation = {(str(a), str(b)) for a in range(300) for b in range(a, 300)}
+        properties = BinaryRelationProperties(None, relation).get_properties_as_list()
+        self.assertEqual(properties, ["Рефлексивно", "Антисимметрично", "Транзитивно"])
+
+
+class TestBinaryRelationStructure(unittest.TestCase):
+    def test_closures(self):
+        closures = BinaryRelationStructure(
+            {"1", "2", "3"}, {("1", "2"), ("2", "3")}
+        ).closures()
+        self.assertEqual(
+            closures["reflexive"],
+            [("1", "1"), ("1", "2"), ("2", "2"), ("2", "3"), ("3", "3")],
+        )
+        self.assertEqual(
+            closures["symmetric"], [("1", "2"), ("2", "1"), ("2", "3"), ("3", "2")]
+        )
+        self.assertEqual(closures["transitive"], [("1", "2"), ("1", "3"), ("2", "3")])
+
+    def test_transitive_closure_matches_reachability(self):
+        rng = random.Random(11)
+        for _ in range(100):
+            elements = list(range(rng.randint(1, 70)))
+            relation = {
+                (rng.choice(elements), rng.choice(elements))
+                for _ in range(rng.randint(0, 90))
+            }
+            expected = set(relation)
+            while True:
+                composed = {(a, d) for a, b in expected for c, d in expected if b == c}
+                if composed <= expected:
+                    break
+                expected |= composed
+            closure = BinaryRelationStructure(set(elements), relation)
+            self.assertEqual(set(closure.transitive_closure()), expected)
+
+    def test_equivalence_classes(self):
+        relation = {(a, b) for a in range(6) for b in range(6) if a % 3 == b % 3}
+        classes = BinaryRelationStructure(None, relation).equivalence_classes()
+        self.assertEqual(
+            classes, {"is_equivalence": True, "classes": [[0, 3], [1, 4], [2, 5]]}
+        )
+
+        partial = BinaryRelationStructure({"1", "2", "3"}, {("1", "2")})
+        self.assertEqual(
+            partial.equivalence_classes(),
+            {"is_equivalence": False, "classes": [["1", "2"], ["3"]]},
+        )
+
+    def test_hasse_diagram(self):
+        relation = {
+            (str(a), str(b)) for a in range(1, 13) for b in range(1, 13) if b % a == 0
+        }
+        diagram = BinaryRelationStructure(None, relation).hasse_diagram()
+        self.assertIn(("2", "4"), diagram["covers"])
+        self.assertIn(("6", "12"), diagram["covers"])
+        self.assertNotIn(("2", "12"), diagram["covers"])
+        self.assertEqual(len(diagram["covers"]), 14)
+        self.assertEqual(diagram["minimal"], ["1"])
+        self.assertEqual(diagram["maximal"], ["7", "8", "9", "10", "11", "12"])
+        self.assertEqual(diagram["least"], "1")
+        self.assertIsNone(diagram["greatest"])
+
+        position = {
+            element: index for index, element in enumerate(diagram["topological_order"])
+        }
+        self.assertTrue(all(position[a] < position[b] for a, b in diagram["covers"]))
+
+    def test_hasse_diagram_requires_partial_order(self):
+        with self.assertRaises(ValueError):
+            BinaryRelationStructure(None, {("1", "2"), ("2", "1")}).hasse_diagram()
+
+    def test_large_chain(self):
+        relation = {(a, b) for a in range(800) for b in range(a, 800)}
+        diagram = BinaryRelationStructure(None, relation).hasse_diagram()
+        self.assertEqual(diagram["covers"], [(a, a + 1) for a in range(799)])
+        self.assertEqual(diagram["topological_order"], list(range(800)))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
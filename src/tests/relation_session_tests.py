@@ -0,0 +1,94 @@
+import itertools
+import random
+import unittest
+
+from src.api.sessions import SessionNotFoundError, SessionStore
+from src.math_algos.binary_relations import BinaryRelationProperties, RelationSession
+
+
+def brute_counters(elements, relation):
+    return {
+        "transitivity_violations": sum(
+            (a, c) not in relation
+            for (a, b), (b2, c) in itertools.product(relation, relation)
+            if b == b2
+        ),
+        "antitransitivity_witnesses": sum(
+            (a, c) in relation
+            for (a, b), (b2, c) in itertools.product(relation, relation)
+            if b == b2 and a != c
+        ),
+    }
+
+
+class TestRelationSession(unittest.TestCase):
+    def test_edits_match_recomputation(self):
+        rng = random.Random(0)
+        elements = {str(i) for i in range(5)}
+        for fixed in (True, False):
+            session = RelationSession(elements if fixed else None, set())
+            relation = set()
+            for _ in range(400):
+                pairs = {
+                    (rng.choice(sorted(elements)), rng.choice(sorted(elements)))
+                    for _ in range(rng.randint(1, 3))
+                }
+                if rng.random() < 0.6:
+                    session.apply(pairs, ())
+                    relation |= pairs
+                else:
+                    session.apply((), pairs)
+                    relation -= pairs
+                expected = BinaryRelationProperties(
+                    elements if fixed else None, set(relation)
+                )
+                self.assertEqual(
+                    session.get_properties_as_list(),
+                    expected.get_properties_as_list(),
+                )
+                counters = session.counters()
+                self.assertEqual(counters["pairs"], len(relation))
+                for name, value in brute_counters(elements, relation).items():
+                    self.assertEqual(counters[name], value)
+
+    def test_apply_counts_changes(self):
+        session = RelationSession(None, {("1", "2")})
+        self.assertEqual(session.apply({("1", "2"), ("2", "3")}, {("3", "3")}), 1)
+        self.assertEqual(session.apply((), {("1", "2")}), 1)
+        self.assertEqual(session.set_of_elements, {"2", "3"})
+
+    def test_fixed_set_rejects_unknown_elements(self):
+        session = RelationSession({"1", "2"}, {("1", "2")})
+        with self.assertRaises(ValueError):
+            session.apply({("1", "3")}, {("1", "2")})
+        self.assertEqual(session.binary_relation, {("1", "2")})
+
+
+class TestSessionStore(unittest.TestCase):
+    def test_lru_eviction(self):
+        store = SessionStore(maxsize=2, ttl=60)
+        first, second = store.add("a"), store.add("b")
+        self.assertEqual(store.get(first), "a")
+        store.add("c")
+        with self.assertRaises(SessionNotFoundError):
+            store.get(second)
+        self.assertEqual(store.get(first), "a")
+        self.assertEqual(store.stats()["evictions"], 1)
+
+    def test_ttl_and_remove(self):
+        now = [0.0]
+        store = SessionStore(maxsize=10, ttl=10, clock=lambda: now[0])
+        first, second = store.add("a"), store.add("b")
+        now[0] = 8
+        store.get(first)
+        now[0] = 12
+        self.assertEqual(store.get(first), "a")
+        with self.assertRaises(SessionNotFoundError):
+            store.get(second)
+        store.remove(first)
+        with self.assertRaises(KeyError):
+            store.remove(first)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
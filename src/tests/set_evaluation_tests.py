@@ -0,0 +1,67 @@
+import unittest
+
+import numpy as np
+
+from src.math_algos.set_evaluation import SetEvaluator
+
+
+class TestSetEvaluator(unittest.TestCase):
+    def setUp(self):
+        self.sets = {"A": [1, 2, 3, 4], "B": [3, 4, 5], "C": [4, 6], "D": [1, 6, 7]}
+        self.evaluator = SetEvaluator(self.sets)
+
+    def test_matches_python_sets(self):
+        A, B, C, D = (set(self.sets[name]) for name in "ABCD")
+        universe = A | B | C | D
+        cases = {
+            "(A ∪ B) \\ C ∆ D": ((A | B) - C) ^ D,
+            "A ∩ B ∪ not C": (A & B) | (universe - C),
+            "not (A ∪ D)": universe - (A | D),
+            "A ∆ B ∆ C": A ^ B ^ C,
+            "U \\ B": universe - B,
+            "A ∩ ∅": set(),
+        }
+        for expression, expected in cases.items():
+            result = self.evaluator.evaluate(expression)
+            self.assertEqual(self.evaluator.cardinality(result), len(expected))
+            self.assertEqual(self.evaluator.members(result), sorted(expected))
+
+    def test_pagination(self):
+        result = self.evaluator.evaluate("A ∪ B ∪ C ∪ D")
+        self.assertEqual(self.evaluator.members(result, 2, 3), [3, 4, 5])
+        self.assertEqual(self.evaluator.members(result, 6), [7])
+
+    def test_explicit_universe(self):
+        evaluator = SetEvaluator({"A": ["x"]}, universe=["x", "y", "z"])
+        self.assertEqual(evaluator.members(evaluator.evaluate("not A")), ["y", "z"])
+        with self.assertRaises(ValueError):
+            SetEvaluator({"A": ["x", "w"]}, universe=["x", "y"])
+
+    def test_mixed_element_types(self):
+        evaluator = SetEvaluator({"A": ["1", 1, 2], "B": [1]})
+        self.assertEqual(evaluator.members(evaluator.evaluate("A \\ B")), ["1", 2])
+
+    def test_empty_sets(self):
+        evaluator = SetEvaluator({"A": [], "B": [1, 2]})
+        self.assertEqual(evaluator.members(evaluator.evaluate("A ∪ B")), [1, 2])
+        evaluator = SetEvaluator({"A": []})
+        self.assertEqual(evaluator.cardinality(evaluator.evaluate("not A")), 0)
+
+    def test_unknown_set(self):
+        with self.assertRaises(ValueError):
+            self.evaluator.evaluate("A ∩ Z")
+
+    def test_large_sets(self):
+        rng = np.random.default_rng(0)
+        sets = {
+            name: rng.choice(10**6, size=3 * 10**5, replace=False).tolist()
+            for name in "ABC"
+        }
+        evaluator = SetEvaluator(sets)
+        result = evaluator.evaluate("(A ∪ B) \\ C")
+        A, B, C = (set(sets[name]) for name in "ABC")
+        self.assertEqual(evaluator.cardinality(result), len((A | B) - C))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
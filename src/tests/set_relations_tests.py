@@ -0,0 +1,67 @@
+import unittest
+from itertools import product
+
+from src.math_algos.set_theory import SetRelations, region_masks
+
+
+class TestRegionMasks(unittest.TestCase):
+    def test_masks_follow_region_bits(self):
+        masks, ones = region_masks(3)
+        self.assertEqual(ones, 0b11111111)
+        for index, mask in enumerate(masks):
+            for region in range(8):
+                self.assertEqual(mask >> region & 1, region >> (2 - index) & 1)
+
+
+class TestSetRelations(unittest.TestCase):
+    def test_textbook_identities(self):
+        identities = [
+            ("A \\ (B ∪ C)", "A ∩ not B ∩ not C"),
+            ("not (A ∩ B)", "not A ∪ not B"),
+            ("A ∆ B", "(A \\ B) ∪ (B \\ A)"),
+            ("A ∪ A ∩ B", "A"),
+            ("A ∩ not A", "∅"),
+        ]
+        for first, second in identities:
+            result = SetRelations(first, second).equivalence()
+            self.assertTrue(result["equivalent"], first)
+            self.assertIsNone(result["counterexample"])
+
+    def test_counterexample(self):
+        result = SetRelations("A ∪ B", "A ∆ B").equivalence()
+        self.assertFalse(result["equivalent"])
+        self.assertEqual(
+            result["counterexample"],
+            {"sets": {"A": True, "B": True}, "in_first": True, "in_second": False},
+        )
+
+    def test_inclusion(self):
+        self.assertTrue(SetRelations("A ∩ B", "A ∪ C").inclusion()["subset"])
+        self.assertTrue(SetRelations("∅", "A").inclusion()["subset"])
+
+        result = SetRelations("A", "A ∩ B").inclusion()
+        self.assertFalse(result["subset"])
+        self.assertEqual(result["counterexample"]["sets"], {"A": True, "B": False})
+
+    def test_matches_region_enumeration(self):
+        first, second = "(A ∪ B) \\ C ∆ D", "A ∩ not C ∪ B \\ (C ∪ D) ∪ D \\ A"
+        relations = SetRelations(first, second)
+        regions = []
+        for a, b, c, d in product([False, True], repeat=4):
+            left = ((a or b) and not c) != d
+            right = (a and not c) or (b and not (c or d)) or (d and not a)
+            regions.append(left == right)
+        self.assertEqual(relations.equivalence()["equivalent"], all(regions))
+
+    def test_many_sets(self):
+        first = " ∪ ".join(f"S{i} ∩ S{i + 1}" for i in range(19))
+        second = " ∪ ".join(f"S{i + 1} ∩ S{i}" for i in range(19))
+        self.assertTrue(SetRelations(first, second).equivalence()["equivalent"])
+
+    def test_limit(self):
+        with self.assertRaises(ValueError):
+            SetRelations(" ∪ ".join(f"S{i}" for i in range(25)), "A")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
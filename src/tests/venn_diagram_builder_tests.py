@@ -0,0 +1,165 @@
+import asyncio
+import os
+import tempfile
+import time
+import unittest
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.math_algos.set_theory import DiagramCache, UpstreamError, VennDiagramBuilder
+
+IMAGE = b"\x89PNG fake image"
+
+
+class UpstreamStub:
+    def __init__(self):
+        self.queries = 0
+        self.downloads = 0
+        self.failures = 0
+        self.delay = 0
+        self.payload = None
+        app = web.Application()
+        app.router.add_get("/v2/query", self.query)
+        app.router.add_get("/image", self.image)
+        self.server = TestServer(app)
+
+    async def query(self, request):
+        self.queries += 1
+        await asyncio.sleep(self.delay)
+        if self.failures:
+            self.failures -= 1
+            return web.Response(status=503)
+        if request.query["appid"] != "key":
+            return web.Response(status=403)
+        if self.payload is not None:
+            return web.json_response(self.payload)
+        return web.json_response(
+            {
+                "queryresult": {
+                    "pods": [
+                        {
+                            "title": "Venn diagram",
+                            "subpods": [
+                                {"img": {"src": str(self.server.make_url("/image"))}}
+                            ],
+                        }
+                    ]
+                }
+            }
+        )
+
+    async def image(self, request):
+        self.downloads += 1
+        return web.Response(body=IMAGE, content_type="image/png")
+
+
+class TestVennDiagramBuilder(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.upstream = UpstreamStub()
+        await self.upstream.server.start_server()
+        self.directory = tempfile.TemporaryDirectory()
+        self.builder = self.make_builder()
+
+    async def asyncTearDown(self):
+        await self.builder.close()
+        await self.upstream.server.close()
+        self.directory.cleanup()
+
+    def make_builder(self, api_key="key", simplify=None, **cache_options):
+        return VennDiagramBuilder(
+            api_key,
+            base_url=str(self.upstream.server.make_url("/")),
+            cache=DiagramCache(self.directory.name, **cache_options),
+            backoff=0.01,
+            simplify=simplify,
+        )
+
+    async def test_fetches_diagram(self):
+        self.assertEqual(await self.builder.fetch_diagram("A ∩ B"), IMAGE)
+        self.assertEqual((self.upstream.queries, self.upstream.downloads), (1, 1))
+
+    async def test_disk_cache_uses_simplified_expression(self):
+        await self.builder.fetch_diagram("A ∩ B")
+        builder = self.make_builder()
+        try:
+            self.assertEqual(await builder.fetch_diagram("B ∩ A ∩ (A ∪ C)"), IMAGE)
+        finally:
+            await builder.close()
+        self.assertEqual(self.upstream.queries, 1)
+
+    async def test_coalesces_concurrent_requests(self):
+        self.upstream.delay = 0.1
+        images = await asyncio.gather(
+            *(self.builder.fetch_diagram("A ∪ B") for _ in range(5))
+        )
+        self.assertEqual(images, [IMAGE] * 5)
+        self.assertEqual(self.upstream.queries, 1)
+
+    async def test_retries_with_backoff(self):
+        self.upstream.failures = 2
+        self.assertEqual(await self.builder.fetch_diagram("A \\ B"), IMAGE)
+        self.assertEqual(self.upstream.queries, 3)
+
+    async def test_gives_up_after_retries(self):
+        self.upstream.failures = 10
+        with self.assertRaises(UpstreamError):
+            await self.builder.fetch_diagram("A \\ B")
+        self.assertEqual(self.upstream.queries, 4)
+
+    async def test_client_errors_are_not_retried(self):
+        builder = self.make_builder(api_key="wrong")
+        try:
+            with self.assertRaises(UpstreamError):
+                await builder.fetch_diagram("A")
+        finally:
+            await builder.close()
+        self.assertEqual(self.upstream.queries, 1)
+
+    async def test_uses_injected_simplifier(self):
+        expressions = []
+
+        async def simplify(expression):
+            expressions.append(expression)
+            return "A ∩ B"
+
+        builder = self.make_builder(simplify=simplify)
+        try:
+            self.assertEqual(await builder.fetch_diagram("B ∩ A"), IMAGE)
+        finally:
+            await builder.close()
+        self.assertEqual(expressions, ["B ∩ A"])
+
+    async def test_malformed_upstream_data(self):
+        for payload in ({"queryresult": {}}, {"queryresult": {"pods": []}}, []):
+            self.upstream.payload = payload
+            with self.assertRaises(UpstreamError):
+                await self.builder.query_diagram_url("A")
+
+    async def test_expired_entries_are_refetched(self):
+        builder = self.make_builder(ttl=0)
+        try:
+            await builder.fetch_diagram("A")
+            await asyncio.sleep(0.01)
+            await builder.fetch_diagram("A")
+        finally:
+            await builder.close()
+        self.assertEqual(self.upstream.queries, 2)
+
+
+class TestDiagramCache(unittest.TestCase):
+    def test_size_eviction_drops_oldest(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = DiagramCache(directory, max_bytes=25)
+            for index, key in enumerate(["A", "B", "C"]):
+                cache.put(key, b"x" * 10)
+                modified = time.time() - 60 + index
+                os.utime(cache.path(key), (modified, modified))
+                cache.evict()
+            self.assertIsNone(cache.get("A"))
+            self.assertEqual(cache.get("B"), b"x" * 10)
+            self.assertEqual(cache.get("C"), b"x" * 10)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
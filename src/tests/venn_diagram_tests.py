@@ -0,0 +1,57 @@
+import unittest
+from itertools import product
+from xml.dom.minidom import parseString
+
+import numpy as np
+from PIL import Image
+
+from src.math_algos.venn_diagram import (
+    CANVAS_SIZE,
+    MAX_SETS,
+    VennDiagramRenderer,
+    region_geometry,
+)
+
+
+class TestRegionGeometry(unittest.TestCase):
+    def test_every_region_is_drawn(self):
+        for count in range(1, MAX_SETS + 1):
+            regions, outline, labels = region_geometry(count)
+            self.assertEqual(regions.shape, (CANVAS_SIZE, CANVAS_SIZE))
+            self.assertEqual(len(np.unique(regions)), 1 << count)
+            self.assertGreater(np.bincount(regions.ravel()).min(), 300)
+            for index, (x, y) in enumerate(labels):
+                self.assertEqual(regions[y, x], 1 << (count - 1 - index))
+
+
+class TestVennDiagramRenderer(unittest.TestCase):
+    def test_shaded_regions(self):
+        renderer = VennDiagramRenderer("(A ∆ B) \\ C ∪ not A ∩ C")
+        expected = [
+            (a != b) and not c or (not a and c)
+            for a, b, c in product([False, True], repeat=3)
+        ]
+        self.assertEqual(renderer.shaded_regions().tolist(), expected)
+
+    def test_complement_shades_outside(self):
+        shaded = VennDiagramRenderer("not(A ∪ B)").shaded_regions()
+        self.assertEqual(shaded.tolist(), [True, False, False, False])
+
+    def test_png(self):
+        image = Image.open(VennDiagramRenderer("A ∩ B ∩ C ∩ D ∩ E").render("png"))
+        self.assertEqual(image.size, (CANVAS_SIZE, CANVAS_SIZE))
+
+    def test_svg(self):
+        document = parseString(VennDiagramRenderer("A ∪ B \\ C").render("svg"))
+        self.assertEqual(len(document.getElementsByTagName("clipPath")), 3)
+        self.assertEqual(len(document.getElementsByTagName("mask")), 5)
+
+    def test_limits(self):
+        with self.assertRaises(ValueError):
+            VennDiagramRenderer("A ∩ B ∩ C ∩ D ∩ E ∩ F")
+        with self.assertRaises(ValueError):
+            VennDiagramRenderer("A").render("gif")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,109 @@
+import asyncio
+import math
+import time
+import unittest
+from unittest import mock
+
+from src.api.workers import (
+    JobTimeoutError,
+    PoolOverloadedError,
+    Worker,
+    WorkerCrashedError,
+    WorkerPool,
+    run_each,
+)
+
+
+class TestRunEach(unittest.TestCase):
+    def test_collects_per_item_errors(self):
+        self.assertEqual(
+            run_each(math.factorial, [3, -1]),
+            [("ok", 6), ("error", "factorial() not defined for negative values")],
+        )
+
+
+class TestWorkerPool(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.pool = WorkerPool(size=1, max_queue=1)
+        await self.pool.start()
+
+    async def asyncTearDown(self):
+        await self.pool.stop()
+
+    async def test_runs_job(self):
+        self.assertEqual(await self.pool.run(math.factorial, 10, timeout=5), 3628800)
+
+    async def test_large_payloads(self):
+        self.assertEqual(len(await self.pool.run(bytes, 1 << 24, timeout=30)), 1 << 24)
+
+    async def test_respawn_retries_failed_starts(self):
+        wait_ready = Worker.wait_ready
+        attempts = []
+
+        def flaky_wait_ready(worker):
+            attempts.append(worker)
+            if len(attempts) == 1:
+                raise WorkerCrashedError("Worker failed to start")
+            return wait_ready(worker)
+
+        with mock.patch.object(Worker, "wait_ready", flaky_wait_ready), mock.patch(
+            "src.api.workers.RESPAWN_DELAY", 0.01
+        ):
+            with self.assertRaises(JobTimeoutError):
+                await self.pool.run(time.sleep, 30, timeout=0.2)
+            self.assertEqual(await self.pool.run(math.factorial, 5, timeout=30), 120)
+
+        stats = self.pool.stats()
+        self.assertEqual(len(attempts), 2)
+        self.assertEqual(stats["respawn_failures"], 1)
+        self.assertIsNone(stats["respawn_error"])
+        self.assertEqual(stats["workers"], 1)
+
+    async def test_propagates_errors(self):
+        with self.assertRaises(ValueError):
+            await self.pool.run(math.factorial, -1, timeout=5)
+
+    async def test_map_keeps_order_and_errors(self):
+        outcomes = await self.pool.map(math.factorial, [5, -1, 5, 3], timeout=5)
+        self.assertEqual(
+            [status for status, _ in outcomes], ["ok", "error", "ok", "ok"]
+        )
+        self.assertEqual(outcomes[0], ("ok", 120))
+        self.assertEqual(outcomes[2], ("ok", 120))
+        self.assertEqual(outcomes[3], ("ok", 6))
+
+    async def test_map_empty(self):
+        self.assertEqual(await self.pool.map(math.factorial, [], timeout=5), [])
+
+    async def test_map_reports_timeouts_per_item(self):
+        outcomes = await self.pool.map(time.sleep, [30], timeout=0.5)
+        self.assertEqual(outcomes, [("error", "Job exceeded its time limit")])
+
+    async def test_timeout_kills_job(self):
+        (worker,) = self.pool.workers
+        with self.assertRaises(JobTimeoutError):
+            await self.pool.run(time.sleep, 30, timeout=0.5)
+        self.assertNotIn(worker, self.pool.workers)
+        self.assertEqual(await self.pool.run(math.factorial, 5, timeout=30), 120)
+        self.assertFalse(worker.process.is_alive())
+
+    async def test_bounded_queue(self):
+        running = [
+            asyncio.ensure_future(self.pool.run(time.sleep, 0.5, timeout=5))
+            for _ in range(2)
+        ]
+        await asyncio.sleep(0.1)
+        with self.assertRaises(PoolOverloadedError):
+            await self.pool.run(math.factorial, 5, timeout=5)
+        await asyncio.gather(*running)
+
+    async def test_event_loop_stays_responsive(self):
+        job = asyncio.ensure_future(self.pool.run(time.sleep, 1, timeout=5))
+        for _ in range(3):
+            await asyncio.sleep(0.01)
+        self.assertFalse(job.done())
+        await job
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)